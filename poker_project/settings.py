@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'tournaments.middleware.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -87,6 +88,9 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', ''),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5433'),
+        # Keeps the dashboard read pool's connections open between requests.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -145,6 +149,9 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
 }
 
+TOURNAMENT_IMPORT_CHUNK_SIZE = int(os.getenv('TOURNAMENT_IMPORT_CHUNK_SIZE', 500))
+TOURNAMENT_IMPORT_MAX_ROWS = int(os.getenv('TOURNAMENT_IMPORT_MAX_ROWS', 50000))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -157,4 +164,75 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at Redis or
+# memcached in production so every worker shares one dashboard cache.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'poker-bankroll'),
+    }
+}
+
+DASHBOARD_CACHE_TIMEOUT = int(os.getenv('DASHBOARD_CACHE_TIMEOUT', 3600))
+
+SIMULATION_MAX_WORKERS = int(os.getenv('SIMULATION_MAX_WORKERS', os.cpu_count() or 1))
+SIMULATION_TIME_BUDGET = float(os.getenv('SIMULATION_TIME_BUDGET', 5))
+
+# Rendered charts are files named by a hash of the player's data_version,
+# so stale images are never served; clear the directory to reclaim space.
+CHART_CACHE_DIR = os.getenv('CHART_CACHE_DIR', BASE_DIR / 'chart_cache')
+CHART_MAX_WORKERS = int(os.getenv('CHART_MAX_WORKERS', 2))
+CHART_RENDER_TIMEOUT = float(os.getenv('CHART_RENDER_TIMEOUT', 30))
+
+# Most queries a request to each (URL name, method) may run: the count
+# measured once a player's rollups exist, plus two for session
+# authentication (JWT needs one). Reads are counted with a cold dashboard
+# cache and an empty period, which takes one more query to tell apart from
+# missing rollups. Writes are counted on their worst path (an edit that
+# moves money to a day with no bucket yet) with their savepoints and row
+# locks, and streamed bodies are counted to the end. Rebuilding a player's
+# missing rollups runs outside the budget (see
+# querycount.unbudgeted_queries). Over-budget requests are logged, and fail
+# the tests, where QueryBudgetTestRunner turns QUERY_BUDGETS_ENFORCE on.
+QUERY_BUDGETS = {
+    ('tournaments:dashboard', 'GET'): 9,
+    ('tournaments:async_dashboard', 'GET'): 9,
+    ('tournaments:tournament_list', 'GET'): 4,
+
+    ('api-root', 'GET'): 2,
+    ('tournament-list', 'GET'): 3,
+    ('tournament-list', 'POST'): 17,
+    ('tournament-detail', 'GET'): 3,
+    ('tournament-detail', 'PUT'): 20,
+    ('tournament-detail', 'PATCH'): 20,
+    ('tournament-detail', 'DELETE'): 17,
+    ('tournament-stats', 'GET'): 3,
+    ('tournament-advanced-stats', 'GET'): 4,
+    ('tournament-period-stats', 'GET'): 4,
+    ('tournament-buy-in-tiers', 'GET'): 3,
+    ('tournament-finish-distribution', 'GET'): 3,
+    ('tournament-bulk', 'POST'): 14,
+    ('tournament-export', 'GET'): 3,
+    ('adjustment-list', 'GET'): 4,
+    ('adjustment-list', 'POST'): 10,
+    ('adjustment-detail', 'GET'): 3,
+    ('adjustment-detail', 'PUT'): 8,
+    ('adjustment-detail', 'PATCH'): 8,
+    ('adjustment-detail', 'DELETE'): 9,
+    ('adjustment-export', 'GET'): 3,
+    ('adjustment-summary', 'GET'): 4,
+    ('user-list', 'GET'): 4,
+    ('user-detail', 'GET'): 3,
+    ('user-me', 'GET'): 2,
+    ('user-dashboard', 'GET'): 10,
+    ('user-dashboard-async', 'GET'): 10,
+    ('user-cache-stats', 'GET'): 2,
+    ('user-bankroll-history', 'GET'): 3,
+    ('user-chart', 'GET'): 3,
+    ('user-risk-of-ruin', 'GET'): 3,
+}
+QUERY_BUDGETS_ENFORCE = os.getenv('QUERY_BUDGETS_ENFORCE', 'False') == 'True'
+
+TEST_RUNNER = 'tournaments.test_runner.QueryBudgetTestRunner'
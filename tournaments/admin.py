@@ -1,6 +1,54 @@
 # Register your models here.
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import F, Sum
 from .models import TournamentInput, PokerUser
+from .services import record_tournament_change, rebuild_player_stats, tournament_snapshot
 
-admin.site.register(TournamentInput)
-admin.site.register(PokerUser)
\ No newline at end of file
+
+@admin.register(TournamentInput)
+class TournamentInputAdmin(admin.ModelAdmin):
+
+    def save_model(self, request, obj, form, change):
+        previous = TournamentInput.objects.get(pk=obj.pk) if change else None
+
+        super().save_model(request, obj, form, change)
+
+        if previous is not None and previous.player_id != obj.player_id:
+            record_tournament_change(previous.player, old=tournament_snapshot(previous))
+            previous = None
+
+        record_tournament_change(
+            obj.player,
+            old=tournament_snapshot(previous) if previous else None,
+            new=tournament_snapshot(obj),
+            tournament=obj,
+        )
+
+    def delete_model(self, request, obj):
+        old_snapshot = tournament_snapshot(obj)
+        super().delete_model(request, obj)
+        record_tournament_change(obj.player, old=old_snapshot)
+
+    def delete_queryset(self, request, queryset):
+        nets = queryset.values('player').annotate(
+            net=Sum(F('cashed_for') - F('buy_in'))
+        ).order_by()
+        nets = {row['player']: row['net'] for row in nets}
+
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+
+            for player in PokerUser.objects.filter(pk__in=nets):
+                rebuild_player_stats(player)
+                if nets[player.pk]:
+                    player.apply_bankroll_delta(
+                        -nets[player.pk],
+                        'tournament_delete',
+                        description='Tournaments deleted in admin',
+                    )
+                else:
+                    player.bump_data_version()
+
+
+admin.site.register(PokerUser)
@@ -0,0 +1,165 @@
+import math
+import numpy as np
+from django.db import connection
+from django.db.models import BigIntegerField, ExpressionWrapper, F
+from .money import raw_cents
+from .services import aggregate_tournament_totals, get_player_period_totals
+
+Z_95 = 1.959963984540054
+
+
+def load_result_arrays(tournaments):
+    """
+    (buy_ins, cashes, places) of a TournamentInput queryset as int64 NumPy
+    arrays, money in cents, fetched with one query.
+    """
+    # All three are expressions so the SELECT keeps this column order.
+    rows = tournaments.order_by().values_list(
+        raw_cents('buy_in'), raw_cents('cashed_for'), F('place_finished'),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(*rows.query.sql_with_params())
+        data = np.array(cursor.fetchall(), dtype=np.int64).reshape(-1, 3)
+
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def result_totals(buy_ins, cashes, places):
+    """The totals summarize_totals reads, from result arrays."""
+    profit = cashes - buy_ins
+    # ROI in basis points, truncated toward zero as services.roi_basis_points.
+    roi = np.abs(profit) * 10000 // buy_ins * np.sign(profit)
+    return {
+        'total_tournaments': int(buy_ins.size),
+        'total_buy_ins': int(buy_ins.sum()),
+        'total_cash': int(cashes.sum()),
+        'place_sum': int(places.sum()),
+        'roi_sum': int(roi.sum()),
+        # Python ints: the squares can overflow int64.
+        'roi_squares': int((roi.astype(object) ** 2).sum()),
+        'profit_squares': int((profit.astype(object) ** 2).sum()),
+    }
+
+
+def _sample_std(total, squares, count):
+    # Exact in integers, so the variance cannot come out negative.
+    return math.sqrt((count * int(squares) - total * total) / (count * (count - 1)))
+
+
+def summarize_totals(totals):
+    """
+    Variance-aware summary of per-tournament results from their sums (see
+    services.MOMENT_FIELDS). ROI figures are percentages of the buy-in,
+    profit figures are dollars.
+    """
+    count = totals['total_tournaments'] or 0
+    summary = {
+        'tournaments': count,
+        'roi_mean': None,
+        'roi_std_dev': None,
+        'roi_std_error': None,
+        'roi_ci_95': None,
+        'profit_mean': None,
+        'profit_std_dev': None,
+        'average_finish': None,
+        'tournaments_for_significance': None,
+    }
+    if count == 0:
+        return summary
+
+    profit_sum = totals['total_cash'] - totals['total_buy_ins']
+    roi_mean = totals['roi_sum'] / count / 100
+    summary.update({
+        'roi_mean': round(roi_mean, 2),
+        'profit_mean': round(profit_sum / count / 100, 2),
+        'average_finish': round(totals['place_sum'] / count, 1),
+    })
+    if count < 2:
+        return summary
+
+    roi_std = _sample_std(totals['roi_sum'], totals['roi_squares'], count) / 100
+    std_error = roi_std / math.sqrt(count)
+    margin = Z_95 * std_error
+
+    # Sample size at which the 95% interval stops including zero ROI.
+    needed = max(2, math.ceil((Z_95 * roi_std / roi_mean) ** 2)) if roi_mean else None
+
+    summary.update({
+        'roi_std_dev': round(roi_std, 2),
+        'roi_std_error': round(std_error, 2),
+        'roi_ci_95': [round(roi_mean - margin, 2), round(roi_mean + margin, 2)],
+        'profit_std_dev': round(_sample_std(profit_sum, totals['profit_squares'], count) / 100, 2),
+        'tournaments_for_significance': needed,
+    })
+    return summary
+
+
+def summarize_results(buy_ins, cashes, places):
+    return summarize_totals(result_totals(buy_ins, cashes, places))
+
+
+def calculate_advanced_stats(tournaments):
+    """summarize_totals over any queryset, summed in one aggregate."""
+    return summarize_totals(aggregate_tournament_totals(tournaments))
+
+
+def calculate_player_advanced_stats(player, start_date=None, end_date=None):
+    """
+    summarize_totals for a player's date range, read from the stats rollup
+    or the daily buckets rather than from every tournament row.
+    """
+    return summarize_totals(get_player_period_totals(player, start_date, end_date))
+
+
+def calculate_swings(tournaments, chunk_size=2000):
+    """
+    Drawdown, upswing and streak figures from one date-ordered pass over
+    the tournaments, streamed in chunks so memory does not grow with the
+    history. Money is returned in dollars.
+    """
+    rows = tournaments.order_by('date', 'id').values_list(
+        'date', ExpressionWrapper(F('cashed_for') - F('buy_in'), output_field=BigIntegerField()), raw_cents('cashed_for')
+    )
+
+    profit = peak = trough = 0
+    peak_index, peak_date = 0, None
+    max_drawdown = biggest_upswing = 0
+    drawdown_start = drawdown_end = None
+    longest_downswing = longest_downswing_days = 0
+    drought = longest_drought = 0
+    index = 0
+
+    for index, (day, net, cashed) in enumerate(rows.iterator(chunk_size=chunk_size), start=1):
+        if peak_date is None:
+            peak_date = day
+
+        profit += net
+
+        if profit >= peak:
+            peak, peak_index, peak_date = profit, index, day
+        elif peak - profit > max_drawdown:
+            max_drawdown = peak - profit
+            drawdown_start, drawdown_end = peak_date, day
+
+        # A downswing lasts from the last peak until the peak is regained.
+        if profit < peak:
+            longest_downswing = max(longest_downswing, index - peak_index)
+            longest_downswing_days = max(longest_downswing_days, (day - peak_date).days)
+
+        trough = min(trough, profit)
+        biggest_upswing = max(biggest_upswing, profit - trough)
+
+        drought = 0 if cashed > 0 else drought + 1
+        longest_drought = max(longest_drought, drought)
+
+    return {
+        'tournaments': index,
+        'max_drawdown': max_drawdown / 100,
+        'max_drawdown_start': drawdown_start.isoformat() if drawdown_start else None,
+        'max_drawdown_end': drawdown_end.isoformat() if drawdown_end else None,
+        'current_drawdown': (peak - profit) / 100,
+        'longest_downswing_tournaments': longest_downswing,
+        'longest_downswing_days': longest_downswing_days,
+        'longest_itm_drought': longest_drought,
+        'biggest_upswing': biggest_upswing / 100,
+    }
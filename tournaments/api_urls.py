@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .api_views import TournamentViewSet, BankrollAdjustmentViewSet, UserViewSet
+from .api_views import TournamentViewSet, BankrollAdjustmentViewSet, UserViewSet, async_dashboard
 
 router = DefaultRouter()
 router.register(r'tournaments', TournamentViewSet, basename='tournament')
@@ -8,5 +8,6 @@ router.register(r'adjustments', BankrollAdjustmentViewSet, basename='adjustment'
 router.register(r'users', UserViewSet, basename='user')
 
 urlpatterns = [
+    path('users/dashboard/async/', async_dashboard, name='user-dashboard-async'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
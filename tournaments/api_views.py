@@ -1,33 +1,269 @@
+import asyncio
+from functools import wraps
+from asgiref.sync import sync_to_async
 from decimal import Decimal
-from rest_framework import permissions, viewsets
+from rest_framework import permissions, status, viewsets
+from rest_framework.exceptions import APIException, NotAuthenticated, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from .models import TournamentInput, BankrollAdjustment
-from .serializers import TournamentSerializer, BankrollAdjustmentSerializer, UserSerializer, CustomTokenObtainPairSerializer
-from datetime import datetime, timedelta
-from .services import get_period_filter, calculate_tournament_stats, calculate_adjustment_totals
+from .serializers import TournamentSerializer, TournamentListSerializer, BankrollAdjustmentSerializer, UserSerializer, CustomTokenObtainPairSerializer
+from datetime import date, timedelta
+from django.db import transaction
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import require_GET
+from .services import (
+    get_period_filter,
+    calculate_player_stats,
+    calculate_adjustment_totals,
+    calculate_buy_in_tiers,
+    calculate_finish_histogram,
+    calculate_player_period_stats,
+    get_buy_in_tiers,
+    get_finish_buckets,
+    get_period_windows,
+    MAX_PERIOD_DAYS,
+    record_tournament_change,
+    tournament_snapshot,
+)
+from .analytics import calculate_player_advanced_stats, load_result_arrays
+from .charts import CHART_FORMATS, get_chart
+from .plotting import CONTENT_TYPES
+from .cache import (
+    aget_dashboard_data,
+    aget_swing_stats,
+    dashboard_cache_stats,
+    get_dashboard_data,
+    get_finish_histogram,
+    get_swing_stats,
+)
+from .conditional import conditional_on_user_data
+from .exports import EXPORT_FORMATS, iter_adjustment_export, iter_tournament_export
+from .history import GRANULARITIES, iter_bankroll_history, iter_history_json
+from .imports import CSVRowError, get_import_chunk_size, get_import_max_rows, import_tournaments, parse_csv_rows
+from .money import to_cents
+from .simulation import run_simulation
 from rest_framework_simplejwt.views import TokenObtainPairView
+from .pagination import KeysetPagination
 from .permissions import IsOwner, IsSameUser
 
 User = get_user_model()
 
 
+def tiers_to_float(tiers):
+    return [
+        {key: float(value) if isinstance(value, Decimal) else value for key, value in tier.items()}
+        for tier in tiers
+    ]
+
+
+def periods_payload(windows, period_stats, adjustment_totals=None):
+    periods = {}
+    for name, display, start_date, end_date in windows:
+        periods[name] = {
+            'period_display': display,
+            'start_date': start_date,
+            'end_date': end_date,
+            **{
+                key: float(value) if isinstance(value, (int, float, Decimal)) else value
+                for key, value in period_stats[name].items()
+            },
+        }
+        if adjustment_totals:
+            periods[name]['total_deposits'] = float(adjustment_totals[name]['total_deposits'])
+            periods[name]['total_withdrawals'] = float(adjustment_totals[name]['total_withdrawals'])
+    return periods
+
+
+def get_export_format(request):
+    # ``format`` is taken by DRF's renderer override, hence ``file_format``.
+    file_format = request.GET.get('file_format', 'csv')
+    if file_format not in EXPORT_FORMATS:
+        raise ValidationError({
+            'file_format': f"Must be one of: {', '.join(EXPORT_FORMATS)}"
+        })
+    return file_format
+
+
+def export_response(lines, name, file_format):
+    response = StreamingHttpResponse(lines, content_type=EXPORT_FORMATS[file_format])
+    response['Content-Disposition'] = f'attachment; filename="{name}.{file_format}"'
+    return response
+
+
+def dashboard_payload(user, data, swings):
+    adjustment_totals = data['adjustment_totals']
+
+    tournament_serializer = TournamentSerializer(data['recent_tournaments'], many=True)
+    adjustment_serializer = BankrollAdjustmentSerializer(data['recent_adjustments'], many=True)
+
+    stats_float = {
+        key: float(value) if isinstance(value, (int, float, Decimal)) else value
+        for key, value in data['stats'].items()
+    }
+
+    return {
+        'period': data['period'],
+        'period_display': data['period_display'],
+        'user': {
+            'id': user.id,
+            'username': user.username,
+            'bankroll': float(user.bankroll),
+        },
+        'stats': {
+            **stats_float,
+            'total_deposits': float(adjustment_totals['total_deposits']),
+            'total_withdrawals': float(adjustment_totals['total_withdrawals']),
+            'net_adjustments': float(
+                adjustment_totals['total_deposits'] - adjustment_totals['total_withdrawals']
+            ),
+        },
+        'periods': periods_payload(get_period_windows(), data['period_stats'], data['period_adjustment_totals']),
+        'swings': swings,
+        'buy_in_tiers': tiers_to_float(data['buy_in_tiers']),
+        'finish_histogram': data['finish_histogram'],
+        'recent_tournaments': tournament_serializer.data,
+        'recent_adjustments': adjustment_serializer.data,
+    }
+
+
+def _authenticate(request):
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    return drf_request.user
+
+
+def async_api_auth(view_func):
+    """
+    DRF's authentication for a plain async Django view. DRF views are
+    sync-only, so the authenticators run in a thread.
+    """
+    @wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        try:
+            request.user = await sync_to_async(_authenticate)(request)
+        except APIException as exc:
+            return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+
+        if not request.user.is_authenticated:
+            return JsonResponse({'detail': NotAuthenticated.default_detail}, status=status.HTTP_401_UNAUTHORIZED)
+
+        return await view_func(request, *args, **kwargs)
+
+    return inner
+
+
+@require_GET
+@async_api_auth
+@conditional_on_user_data
+async def async_dashboard(request):
+    """UserViewSet.dashboard with its reads run concurrently."""
+    user = request.user
+    data, swings = await asyncio.gather(
+        aget_dashboard_data(user, request.GET.get('period', 'all')),
+        aget_swing_stats(user),
+    )
+
+    return HttpResponse(JSONRenderer().render(dashboard_payload(user, data, swings)), content_type='application/json')
+
+
 class TournamentViewSet(viewsets.ModelViewSet):
     serializer_class = TournamentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         return TournamentInput.objects.filter(player=self.request.user)
 
+    @method_decorator(conditional_on_user_data)
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).list_rows()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(TournamentListSerializer(page).data)
+
+        return Response(TournamentListSerializer(queryset).data)
+
     def perform_create(self, serializer):
-        serializer.save(player=self.request.user)
+        with transaction.atomic():
+            tournament = serializer.save(player=self.request.user)
+            record_tournament_change(
+                self.request.user,
+                new=tournament_snapshot(tournament),
+                tournament=tournament,
+            )
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            # Save onto the row as stored, locked until the save, so the
+            # delta (and a PATCH's untouched fields) cannot be stale.
+            serializer.instance = get_object_or_404(
+                TournamentInput.objects.select_for_update(), pk=serializer.instance.pk
+            )
+            old_snapshot = tournament_snapshot(serializer.instance)
+            tournament = serializer.save()
+            record_tournament_change(
+                self.request.user,
+                old=old_snapshot,
+                new=tournament_snapshot(tournament),
+                tournament=tournament,
+            )
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance = get_object_or_404(TournamentInput.objects.select_for_update(), pk=instance.pk)
+            old_snapshot = tournament_snapshot(instance)
+            instance.delete()
+            record_tournament_change(self.request.user, old=old_snapshot)
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        if 'file' in request.FILES:
+            try:
+                rows = parse_csv_rows(request.FILES['file'])
+            except CSVRowError as exc:
+                return Response({'errors': [exc.as_report()]}, status=status.HTTP_400_BAD_REQUEST)
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            raise ValidationError({'detail': 'Send a JSON array of tournaments or a CSV upload in "file"'})
+
+        if len(rows) > get_import_max_rows():
+            raise ValidationError({'detail': f'At most {get_import_max_rows()} rows per import'})
+
+        try:
+            chunk_size = int(request.GET.get('chunk_size', get_import_chunk_size()))
+        except ValueError:
+            raise ValidationError({'chunk_size': 'Must be an integer'})
+        chunk_size = max(1, min(chunk_size, 5000))
+
+        report = import_tournaments(request.user, rows, chunk_size)
+
+        status_code = status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        return Response(report, status=status_code)
 
     @action(detail=False, methods=['get'])
-    def stats(self, request):
+    def export(self, request):
+        file_format = get_export_format(request)
         tournaments = self.get_queryset()
 
-        stats = calculate_tournament_stats(tournaments)
+        start_date, _ = get_period_filter(request.GET.get('period', 'all'))
+        if start_date:
+            tournaments = tournaments.filter(date__gte=start_date)
+
+        return export_response(iter_tournament_export(tournaments, file_format), 'tournaments', file_format)
+
+    @action(detail=False, methods=['get'])
+    @method_decorator(conditional_on_user_data)
+    def stats(self, request):
+        stats = calculate_player_stats(request.user)
 
         stats_float = {
             key: float(value) if isinstance(value, (int, float, Decimal)) else value
@@ -36,6 +272,72 @@ class TournamentViewSet(viewsets.ModelViewSet):
 
         return Response(stats_float)
 
+    @action(detail=False, methods=['get'], url_path='period-stats')
+    @method_decorator(conditional_on_user_data)
+    def period_stats(self, request):
+        days = request.GET.get('days')
+        ranges = request.GET.get('ranges')
+        try:
+            windows = get_period_windows(days.split(',') if days else None, ranges.split(',') if ranges else None)
+        except ValueError as exc:
+            raise ValidationError({'detail': f'Invalid periods: {exc}. Use e.g. days=14,90 and '
+                                             f'ranges=2024-01-01:2024-03-31,2025-01-01:'})
+
+        return Response({'periods': periods_payload(windows, calculate_player_period_stats(request.user, windows))})
+
+    @action(detail=False, methods=['get'], url_path='advanced-stats')
+    @method_decorator(conditional_on_user_data)
+    def advanced_stats(self, request):
+        start_date, period_display = get_period_filter(request.GET.get('period', 'all'))
+
+        return Response({
+            'period_display': period_display,
+            **calculate_player_advanced_stats(request.user, start_date),
+        })
+
+    @action(detail=False, methods=['get'], url_path='buy-in-tiers')
+    @method_decorator(conditional_on_user_data)
+    def buy_in_tiers(self, request):
+        tournaments = self.get_queryset()
+
+        start_date, period_display = get_period_filter(request.GET.get('period', 'all'))
+        if start_date:
+            tournaments = tournaments.filter(date__gte=start_date)
+
+        edges = request.GET.get('edges')
+        try:
+            tiers = get_buy_in_tiers(edges.split(',') if edges else None)
+        except (ArithmeticError, ValueError):
+            raise ValidationError({'edges': 'Expected increasing positive buy-in amounts, e.g. 5,30,150.'})
+
+        return Response({
+            'period_display': period_display,
+            'tiers': tiers_to_float(calculate_buy_in_tiers(tournaments, tiers)),
+        })
+
+    @action(detail=False, methods=['get'], url_path='finish-distribution')
+    @method_decorator(conditional_on_user_data)
+    def finish_distribution(self, request):
+        start_date, period_display = get_period_filter(request.GET.get('period', 'all'))
+        edges = request.GET.get('edges')
+
+        if not edges:
+            return Response({'period_display': period_display, 'buckets': get_finish_histogram(request.user, start_date)})
+
+        try:
+            buckets = get_finish_buckets(edges.split(','))
+        except ValueError:
+            raise ValidationError({'edges': 'Expected increasing finishing places, e.g. 1,2,3,4,10,28,101.'})
+
+        tournaments = self.get_queryset()
+        if start_date:
+            tournaments = tournaments.filter(date__gte=start_date)
+
+        return Response({
+            'period_display': period_display,
+            'buckets': calculate_finish_histogram(tournaments, buckets),
+        })
+
 class BankrollAdjustmentViewSet(viewsets.ModelViewSet):
     serializer_class = BankrollAdjustmentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwner]
@@ -44,8 +346,32 @@ class BankrollAdjustmentViewSet(viewsets.ModelViewSet):
         return BankrollAdjustment.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        adjustment = serializer.save(user=self.request.user)
-        adjustment.apply_to_user()
+        with transaction.atomic():
+            adjustment = serializer.save(user=self.request.user)
+            adjustment.apply_to_user()
+
+    def perform_update(self, serializer):
+        # Editing an adjustment does not move the bankroll, but it changes
+        # the dashboard totals.
+        with transaction.atomic():
+            serializer.save()
+            self.request.user.bump_data_version()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            self.request.user.bump_data_version()
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        file_format = get_export_format(request)
+        adjustments = self.get_queryset()
+
+        start_date, _ = get_period_filter(request.GET.get('period', 'all'))
+        if start_date:
+            adjustments = adjustments.filter(date__gte=start_date)
+
+        return export_response(iter_adjustment_export(adjustments, file_format), 'adjustments', file_format)
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
@@ -69,84 +395,130 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @method_decorator(conditional_on_user_data)
     def dashboard(self, request):
-        period = request.GET.get('period', 'all')
         user = request.user
+        data = get_dashboard_data(user, request.GET.get('period', 'all'))
 
-        tournaments = TournamentInput.objects.filter(player=user)
-        adjustments = BankrollAdjustment.objects.filter(user=user)
-
-        start_date, period_display = get_period_filter(period)
-
-        if start_date:
-            tournaments = tournaments.filter(date__gte=start_date)
-            adjustments = adjustments.filter(date__gte=start_date)
-
-        tournaments = tournaments.order_by('-date')
-        adjustments = adjustments.order_by('-date')
-
-        stats = calculate_tournament_stats(tournaments)
-
-        adjustment_totals = calculate_adjustment_totals(adjustments)
-
-        recent_tournaments = tournaments[:10]
-        recent_adjustments = adjustments[:5]
+        return Response(dashboard_payload(user, data, get_swing_stats(user)))
 
-        tournament_serializer = TournamentSerializer(recent_tournaments, many=True)
-        adjustment_serializer = BankrollAdjustmentSerializer(recent_adjustments, many=True)
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def cache_stats(self, request):
+        return Response(dashboard_cache_stats())
 
-        stats_float = {
-            key: float(value) if isinstance(value, (int, float, Decimal)) else value
-            for key, value in stats.items()
-        }
-
-        return Response({
-            'period': period,
-            'period_display': period_display,
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'bankroll': float(user.bankroll),
-            },
-            'stats': {
-                **stats_float,
-                'total_deposits': float(adjustment_totals['total_deposits']),
-                'total_withdrawals': float(adjustment_totals['total_withdrawals']),
-                'net_adjustments': float(
-                    adjustment_totals['total_deposits'] - adjustment_totals['total_withdrawals']
-                ),
-            },
-            'recent_tournaments': tournament_serializer.data,
-            'recent_adjustments': adjustment_serializer.data,
-        })
-
-    # for charts in the future:)
     @action(detail=False, methods=['get'])
     def bankroll_history(self, request):
-
-        days = int(request.GET.get('days', 30))
-        user = request.user
-
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        tournaments = TournamentInput.objects.filter(
-            player=user,
-            date__range=[start_date.date(), end_date.date()]
-        ).order_by('date')
-
-        adjustments = BankrollAdjustment.objects.filter(
-            user=user,
-            date__range=[start_date, end_date]
-        ).order_by('date')
-
-        bankroll_history = []
-        running_total = float(user.bankroll)
+        granularity = request.GET.get('granularity', 'day')
+        if granularity not in GRANULARITIES:
+            raise ValidationError({
+                'granularity': f"Must be one of: {', '.join(GRANULARITIES)}"
+            })
+
+        try:
+            end_date = date.fromisoformat(request.GET['end']) if 'end' in request.GET else date.today()
+            if 'start' in request.GET:
+                start_date = date.fromisoformat(request.GET['start'])
+            else:
+                days = int(request.GET.get('days', 30))
+                if not 1 <= days <= MAX_PERIOD_DAYS:
+                    raise ValueError
+                start_date = end_date - timedelta(days=days)
+        except (ValueError, OverflowError):
+            raise ValidationError({
+                'detail': f'Use YYYY-MM-DD for start/end and an integer of 1-{MAX_PERIOD_DAYS} for days'
+            })
+
+        if start_date > end_date:
+            raise ValidationError({'start': 'Start date must not be after end date'})
+
+        points = iter_bankroll_history(request.user, start_date, end_date, granularity)
+
+        body = iter_history_json({
+            'granularity': granularity,
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat(),
+            'current_bankroll': float(request.user.bankroll),
+        }, points)
+
+        return StreamingHttpResponse(body, content_type='application/json')
+
+    @action(detail=False, methods=['get'], url_path=r'charts/(?P<kind>bankroll|profit)')
+    @method_decorator(conditional_on_user_data)
+    def chart(self, request, kind):
+        file_format = request.GET.get('file_format', 'png')
+        if file_format not in CHART_FORMATS:
+            raise ValidationError({'file_format': f"Must be one of: {', '.join(CHART_FORMATS)}"})
+
+        granularity = request.GET.get('granularity', 'day')
+        if granularity not in GRANULARITIES:
+            raise ValidationError({'granularity': f"Must be one of: {', '.join(GRANULARITIES)}"})
+
+        try:
+            path = get_chart(request.user, kind, file_format, granularity)
+        except TimeoutError:
+            return Response({'detail': 'Chart rendering timed out, try again shortly'},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return FileResponse(open(path, 'rb'), content_type=CONTENT_TYPES[file_format])
+
+    @action(detail=False, methods=['get'], url_path='risk-of-ruin')
+    def risk_of_ruin(self, request):
+        try:
+            trajectories = int(request.GET.get('trajectories', 100_000))
+            horizon = int(request.GET.get('horizon', 1000))
+            downswing_buy_ins = int(request.GET.get('downswing_buy_ins', 50))
+            seed = int(request.GET['seed']) if 'seed' in request.GET else None
+        except ValueError:
+            raise ValidationError({'detail': 'trajectories, horizon, downswing_buy_ins and seed must be integers'})
+
+        if not (1 <= trajectories <= 1_000_000 and 1 <= horizon <= 10_000 and downswing_buy_ins >= 1):
+            raise ValidationError({
+                'detail': 'Use 1-1000000 trajectories, a horizon of 1-10000 tournaments and at least 1 buy-in'
+            })
+        if seed is not None and seed < 0:
+            raise ValidationError({'seed': 'Must not be negative'})
+
+        buy_ins, cashes, _ = load_result_arrays(TournamentInput.objects.filter(player=request.user))
+        if buy_ins.size == 0:
+            raise ValidationError({'detail': 'Log some tournaments before running a simulation'})
+
+        average_buy_in = int(buy_ins.mean())
+        try:
+            result = run_simulation(
+                cashes - buy_ins,
+                to_cents(request.user.bankroll),
+                horizon=horizon,
+                trajectories=trajectories,
+                downswing=downswing_buy_ins * average_buy_in,
+                seed=seed,
+                time_budget=settings.SIMULATION_TIME_BUDGET,
+                workers=settings.SIMULATION_MAX_WORKERS,
+            )
+        except TimeoutError:
+            return Response({'detail': 'Simulation timed out, try fewer trajectories or a shorter horizon'},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
         return Response({
-            'labels': [f'Day {i}' for i in range(days)],
-            'data': [float(user.bankroll) * (1 + i / days) for i in range(days)],
-            'message': 'Bankroll history endpoint - implement detailed calculation as needed'
+            'bankroll': float(request.user.bankroll),
+            'horizon': horizon,
+            'sample_size': int(buy_ins.size),
+            'requested_trajectories': trajectories,
+            'trajectories': result['trajectories'],
+            'truncated': result['truncated'],
+            'seed': result['seed'],
+            'risk_of_ruin': result['risk_of_ruin'],
+            'downswing': {
+                'buy_ins': downswing_buy_ins,
+                'amount': downswing_buy_ins * average_buy_in / 100,
+                'probability': result['downswing_probability'],
+            },
+            'final_bankroll_percentiles': {
+                str(p): value / 100 for p, value in result['final_bankroll_percentiles'].items()
+            },
+            'max_drawdown_percentiles': {
+                str(p): value / 100 for p, value in result['max_drawdown_percentiles'].items()
+            },
+            'elapsed_ms': result['elapsed_ms'],
         })
 
 class CustomTokenObtainPairView(TokenObtainPairView):
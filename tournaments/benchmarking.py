@@ -0,0 +1,22 @@
+"""Timing shared by the benchmark management commands."""
+import statistics
+import time
+
+
+def time_calls(repeat, func, before=None):
+    """
+    Call ``func`` ``repeat`` times, running ``before`` (untimed) ahead of
+    each call. Returns the best and median wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'best_ms': round(min(timings), 2),
+        'median_ms': round(statistics.median(timings), 2),
+    }
@@ -0,0 +1,252 @@
+"""
+Set-based CSV loader for large historical imports. Rows are streamed into
+a temporary staging table (COPY FROM STDIN on PostgreSQL, batched inserts
+on SQLite), validated with one UPDATE that mirrors the model validators
+and merged into the tournament table with one INSERT ... SELECT.
+"""
+import csv
+import io
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import connection, transaction
+from .imports import IMPORT_FIELDS
+from .models import TournamentInput
+from .money import from_cents, to_cents
+from .services import rebuild_player_stats
+
+STAGE_TABLE = 'tournament_import_stage'
+
+MONEY_PATTERN = r'^[0-9]{1,10}([.][0-9]{1,2})?$'
+INTEGER_PATTERN = r'^[0-9]{1,9}$'
+DATE_PATTERN = r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$'
+
+_DIALECTS = {
+    'postgresql': {
+        'create': 'CREATE TEMP TABLE {table} (line bigserial PRIMARY KEY, {columns}, error text) ON COMMIT DROP',
+        'drop': 'DROP TABLE IF EXISTS pg_temp.{table}',
+        'matches': "{0} ~ '{1}'",
+        # Only CASE fixes evaluation order in PostgreSQL. Year, month and
+        # day are range-checked first so the cast and addition cannot fail;
+        # an impossible day (Feb 30) rolls into the next month.
+        'valid_date': (
+            "CASE WHEN SUBSTR({0}, 1, 4)::int >= 1 "
+            "AND SUBSTR({0}, 6, 2)::int BETWEEN 1 AND 12 AND SUBSTR({0}, 9, 2)::int BETWEEN 1 AND 31 "
+            "THEN EXTRACT(MONTH FROM (SUBSTR({0}, 1, 7) || '-01')::date + (SUBSTR({0}, 9, 2)::int - 1)) "
+            "= SUBSTR({0}, 6, 2)::int ELSE FALSE END"
+        ),
+        'date': '{0}::date',
+        'cents': 'ROUND({0}::numeric * 100)::bigint',
+        'integer': '{0}::bigint',
+    },
+    'sqlite': {
+        'create': 'CREATE TEMP TABLE {table} (line integer PRIMARY KEY, {columns}, error text)',
+        'drop': 'DROP TABLE IF EXISTS temp.{table}',
+        'matches': "{0} REGEXP '{1}'",
+        # A modifier makes date() normalize, so Feb 30 comes back as Mar 1.
+        'valid_date': "SUBSTR({0}, 1, 4) >= '0001' AND date({0}, '+0 days') = {0}",
+        'date': '{0}',
+        'cents': 'CAST(ROUND(CAST({0} AS real) * 100) AS integer)',
+        'integer': 'CAST({0} AS integer)',
+    },
+}
+
+
+def _limits(field_name):
+    """The (min, max) of a model field's Min/MaxValueValidators."""
+    field = TournamentInput._meta.get_field(field_name)
+    low = next(v.limit_value for v in field.validators if isinstance(v, MinValueValidator))
+    high = next(v.limit_value for v in field.validators if isinstance(v, MaxValueValidator))
+    return low, high
+
+
+def _validation_sql(dialect):
+    def value(field):
+        return f'TRIM({field})'
+
+    def missing(field):
+        return f"COALESCE({value(field)}, '') = ''"
+
+    def matches(field, pattern):
+        return dialect['matches'].format(value(field), pattern)
+
+    bad_date = 'Date has wrong format. Use YYYY-MM-DD.'
+    checks = [
+        (missing('date'), 'date', 'This field is required.'),
+        (f"NOT ({matches('date', DATE_PATTERN)})", 'date', bad_date),
+        (f"NOT ({dialect['valid_date'].format(value('date'))})", 'date', bad_date),
+    ]
+    params = []
+
+    for field, required in (('buy_in', True), ('cashed_for', False)):
+        low, high = _limits(field)
+        cents = dialect['cents'].format(value(field))
+        out_of_range = f'{cents} < %s OR {cents} > %s'
+        if required:
+            checks.append((missing(field), field, 'This field is required.'))
+        else:
+            # An empty optional value passes; guard the cast with CASE.
+            out_of_range = f'CASE WHEN {missing(field)} THEN FALSE ELSE {out_of_range} END'
+        checks += [
+            (f"NOT ({missing(field)}) AND NOT ({matches(field, MONEY_PATTERN)})",
+             field, 'A valid number with at most 2 decimal places is required.'),
+            (out_of_range, field, f'Ensure this value is between {low} and {high}.'),
+        ]
+        params += [to_cents(low), to_cents(high)]
+
+    low, high = _limits('place_finished')
+    place = dialect['integer'].format(value('place_finished'))
+    checks += [
+        (missing('place_finished'), 'place_finished', 'This field is required.'),
+        (f"NOT ({matches('place_finished', INTEGER_PATTERN)})", 'place_finished', 'A valid integer is required.'),
+        (f'{place} < %s OR {place} > %s', 'place_finished', f'Ensure this value is between {low} and {high}.'),
+    ]
+    params += [low, high]
+
+    # CASE stops at the first failing check, so each cast only sees values
+    # that passed the checks before it.
+    whens = '\n'.join(f"    WHEN {condition} THEN '{field}|{message}'" for condition, field, message in checks)
+    return f'UPDATE {STAGE_TABLE} SET error = CASE\n{whens}\nEND', params
+
+
+def _merge_sql(dialect):
+    cents = dialect['cents']
+    cashed = f"CASE WHEN COALESCE(TRIM(cashed_for), '') = '' THEN 0 ELSE {cents.format('TRIM(cashed_for)')} END"
+    valid = f'FROM {STAGE_TABLE} WHERE error IS NULL'
+
+    insert = (
+        f'INSERT INTO {TournamentInput._meta.db_table} (date, buy_in, cashed_for, place_finished, player_id) '
+        f"SELECT {dialect['date'].format('TRIM(date)')}, {cents.format('TRIM(buy_in)')}, {cashed}, "
+        f"{dialect['integer'].format('TRIM(place_finished)')}, %s {valid} ORDER BY line"
+    )
+    totals = f"SELECT COUNT(*), COALESCE(SUM({cents.format('TRIM(buy_in)')}), 0), COALESCE(SUM({cashed}), 0) {valid}"
+    return insert, totals
+
+
+def _stage_columns(header):
+    """
+    Staging column per CSV column. Unknown and repeated columns are loaded
+    under placeholder names and ignored.
+    """
+    columns = []
+    for i, name in enumerate(header):
+        columns.append(name if name in IMPORT_FIELDS and name not in columns else f'ignored_{i}')
+    return columns
+
+
+def _records(text, width):
+    """
+    CSV records padded or cut to ``width`` fields, so a ragged row is
+    staged (and then reported) like any other on every backend.
+    """
+    for record in csv.reader(text):
+        yield (record + [''] * width)[:width]
+
+
+class _CopySource:
+    """
+    The file copy_expert reads from: records written back out as CSV, a
+    chunk at a time.
+    """
+
+    def __init__(self, records):
+        self._records = iter(records)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+
+    def read(self, size=-1):
+        while size < 0 or self._buffer.tell() < size:
+            record = next(self._records, None)
+            if record is None:
+                break
+            self._writer.writerow(record)
+
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+
+def _stage_postgresql(cursor, text, columns):
+    cursor.copy_expert(
+        f"COPY {STAGE_TABLE} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        _CopySource(_records(text, len(columns))),
+    )
+
+
+def _stage_sqlite(cursor, text, columns, batch_size=5000):
+    placeholders = ', '.join(['%s'] * (len(columns) + 1))
+    sql = f"INSERT INTO {STAGE_TABLE} (line, {', '.join(columns)}) VALUES ({placeholders})"
+
+    batch = []
+    for line, record in enumerate(_records(text, len(columns)), start=1):
+        batch.append([line] + [value if value != '' else None for value in record])
+        if len(batch) >= batch_size:
+            cursor.executemany(sql, batch)
+            batch = []
+    if batch:
+        cursor.executemany(sql, batch)
+
+
+def load_tournament_csv(player, stream, max_errors=100):
+    """
+    Load a tournament CSV (binary stream, header row) for ``player``. Rows
+    that fail validation are skipped and reported, up to ``max_errors``.
+    Stats are rebuilt and the bankroll moved once, as an ``import`` entry.
+    """
+    dialect = _DIALECTS.get(connection.vendor)
+    if dialect is None:
+        raise ValueError(f'No bulk loader for {connection.vendor}')
+
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    header = [name.strip() for name in next(csv.reader([text.readline()]), [])]
+    missing_columns = [field for field in IMPORT_FIELDS if field not in header and field != 'cashed_for']
+    if missing_columns:
+        raise ValueError(f"Missing CSV columns: {', '.join(missing_columns)}")
+
+    columns = _stage_columns(header)
+    # cashed_for is optional; without the column every row uses the default.
+    stage_columns = columns if 'cashed_for' in columns else columns + ['cashed_for']
+    validate_sql, validate_params = _validation_sql(dialect)
+    insert_sql, totals_sql = _merge_sql(dialect)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(dialect['drop'].format(table=STAGE_TABLE))
+        cursor.execute(dialect['create'].format(
+            table=STAGE_TABLE, columns=', '.join(f'{column} text' for column in stage_columns),
+        ))
+
+        if connection.vendor == 'postgresql':
+            _stage_postgresql(cursor, text, columns)
+        else:
+            _stage_sqlite(cursor, text, columns)
+
+        cursor.execute(validate_sql, validate_params)
+
+        cursor.execute(f'SELECT COUNT(*) FROM {STAGE_TABLE}')
+        received = cursor.fetchone()[0]
+        cursor.execute(
+            f'SELECT line, error FROM {STAGE_TABLE} WHERE error IS NOT NULL ORDER BY line LIMIT %s', [max_errors]
+        )
+        errors = [
+            {'row': line, 'errors': {field: [message]}}
+            for line, (field, message) in ((line, error.split('|', 1)) for line, error in cursor.fetchall())
+        ]
+
+        cursor.execute(totals_sql)
+        created, buy_ins, cashes = cursor.fetchone()
+        cursor.execute(insert_sql, [player.pk])
+        cursor.execute(dialect['drop'].format(table=STAGE_TABLE))
+
+        if created:
+            rebuild_player_stats(player)
+            net = int(cashes) - int(buy_ins)
+            if net:
+                player.apply_bankroll_delta(from_cents(net), 'import', description=f'Imported {created} tournaments')
+            else:
+                player.bump_data_version()
+
+    return {
+        'received': received,
+        'created': created,
+        'failed': received - created,
+        'errors': errors,
+    }
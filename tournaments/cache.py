@@ -0,0 +1,222 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
+from .analytics import calculate_swings
+from .models import TournamentInput, BankrollAdjustment
+from .services import (
+    STANDARD_PERIODS, get_period_filter, get_period_windows, calculate_player_period_stats,
+    calculate_period_adjustment_totals, calculate_buy_in_tiers, calculate_finish_histogram,
+)
+
+# The dashboard reads that scan the player's tournaments; the rest are
+# index lookups or rollup reads that finish before these could overlap.
+SLOW_DASHBOARD_READS = ('buy_in_tiers', 'finish_histogram')
+
+# One thread, and so one long-lived database connection, for each slow
+# dashboard read and the swing stats the API dashboard reads alongside.
+_read_pool = ThreadPoolExecutor(max_workers=len(SLOW_DASHBOARD_READS) + 1, thread_name_prefix='dashboard-read')
+
+COUNTER_KEYS = {
+    'hits': 'dashboard:stats:hits',
+    'misses': 'dashboard:stats:misses',
+}
+
+
+def get_dashboard_cache():
+    return caches[getattr(settings, 'DASHBOARD_CACHE_ALIAS', 'default')]
+
+
+def user_cache_key(user, name):
+    """
+    Entries are keyed by the player's data_version, so a write makes every
+    older entry unreachable without deleting anything.
+    """
+    return f'{name}:{user.pk}:v{user.data_version}'
+
+
+def _count(name):
+    cache = get_dashboard_cache()
+    key = COUNTER_KEYS[name]
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_user_cached(user, name, build):
+    """``build()``, cached under the player's current data_version."""
+    cache = get_dashboard_cache()
+    key = user_cache_key(user, name)
+
+    value = cache.get(key)
+    if value is None:
+        _count('misses')
+        value = build()
+        cache.set(key, value, getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 3600))
+    else:
+        _count('hits')
+
+    return value
+
+
+def dashboard_readers(user, start_date):
+    """The dashboard's independent reads, by name, as zero-argument callables."""
+    tournaments = TournamentInput.objects.filter(player=user)
+    adjustments = BankrollAdjustment.objects.filter(user=user)
+    # Totals cover every standard period, so the page can switch between
+    # them without another request.
+    windows = get_period_windows()
+    all_adjustments = adjustments
+
+    if start_date:
+        tournaments = tournaments.filter(date__gte=start_date)
+        adjustments = adjustments.filter(date__gte=start_date)
+
+    return {
+        'period_stats': lambda: calculate_player_period_stats(user, windows),
+        'period_adjustment_totals': lambda: calculate_period_adjustment_totals(all_adjustments, windows),
+        'buy_in_tiers': lambda: calculate_buy_in_tiers(tournaments),
+        'finish_histogram': lambda: get_finish_histogram(user, start_date),
+        'recent_tournaments': lambda: list(tournaments.order_by('-date')[:10]),
+        'recent_adjustments': lambda: list(adjustments.order_by('-date')[:5]),
+    }
+
+
+def build_dashboard_data(user, start_date):
+    return {name: read() for name, read in dashboard_readers(user, start_date).items()}
+
+
+def _period_cache_name(name, start_date):
+    # Period windows move daily, including those inside the 'all' dashboard.
+    return f"{name}:{datetime.now().date().isoformat()}:{start_date.isoformat() if start_date else 'all'}"
+
+
+def get_finish_histogram(user, start_date):
+    """The default finish histogram since ``start_date``, cached on its own."""
+    def build():
+        tournaments = TournamentInput.objects.filter(player=user)
+        if start_date:
+            tournaments = tournaments.filter(date__gte=start_date)
+        return calculate_finish_histogram(tournaments)
+
+    return get_user_cached(user, _period_cache_name('finish_histogram', start_date), build)
+
+
+def _select_period(data, period, start_date, period_display):
+    key = period if period in STANDARD_PERIODS else 'all'
+    return {
+        **data,
+        'stats': data['period_stats'][key],
+        'adjustment_totals': data['period_adjustment_totals'][key],
+        'period': period,
+        'period_display': period_display,
+        'start_date': start_date,
+    }
+
+
+def get_dashboard_data(user, period):
+    """
+    Stats, adjustment totals and recent rows for the dashboard, served from
+    the cache while the player's data_version is unchanged. The live
+    bankroll is not cached; read it from ``user``.
+    """
+    start_date, period_display = get_period_filter(period)
+
+    data = get_user_cached(
+        user, _period_cache_name('dashboard', start_date), lambda: build_dashboard_data(user, start_date)
+    )
+    return _select_period(data, period, start_date, period_display)
+
+
+def get_swing_stats(user):
+    return get_user_cached(
+        user, 'swings', lambda: calculate_swings(TournamentInput.objects.filter(player=user))
+    )
+
+
+def on_read_pool(func, *args):
+    """Await ``func(*args)`` run on a read pool thread and its connection."""
+    def run():
+        try:
+            return func(*args)
+        finally:
+            # Pool threads live on, so their connections are kept for
+            # CONN_MAX_AGE instead of being reopened on every request.
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False, executor=_read_pool)()
+
+
+async def read_concurrently(reads, concurrent=()):
+    """
+    Run the ``concurrent`` callables of ``reads`` on the read pool while the
+    rest run one after another on the request's own connection, so the slow
+    queries overlap instead of queueing on the single thread Django's async
+    ORM methods share. Returns results by name, in the order of ``reads``.
+    """
+    pooled = [name for name in reads if name in concurrent]
+
+    def run_in_sequence():
+        return {name: read() for name, read in reads.items() if name not in concurrent}
+
+    in_sequence, *pooled_results = await asyncio.gather(
+        sync_to_async(run_in_sequence)(),
+        *(on_read_pool(reads[name]) for name in pooled),
+    )
+    results = {**in_sequence, **dict(zip(pooled, pooled_results))}
+    return {name: results[name] for name in reads}
+
+
+async def aget_user_cached(user, name, abuild):
+    cache = get_dashboard_cache()
+    key = user_cache_key(user, name)
+
+    value = await cache.aget(key)
+    if value is None:
+        await sync_to_async(_count)('misses')
+        value = await abuild()
+        await cache.aset(key, value, getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 3600))
+    else:
+        await sync_to_async(_count)('hits')
+
+    return value
+
+
+async def aget_dashboard_data(user, period):
+    """get_dashboard_data, building a cache miss with concurrent reads."""
+    start_date, period_display = get_period_filter(period)
+
+    data = await aget_user_cached(
+        user, _period_cache_name('dashboard', start_date),
+        lambda: read_concurrently(dashboard_readers(user, start_date), SLOW_DASHBOARD_READS),
+    )
+    return _select_period(data, period, start_date, period_display)
+
+
+async def aget_swing_stats(user):
+    return await aget_user_cached(
+        user, 'swings',
+        lambda: on_read_pool(calculate_swings, TournamentInput.objects.filter(player=user)),
+    )
+
+
+def dashboard_cache_stats():
+    cache = get_dashboard_cache()
+    counts = cache.get_many(COUNTER_KEYS.values())
+    hits = counts.get(COUNTER_KEYS['hits'], 0)
+    misses = counts.get(COUNTER_KEYS['misses'], 0)
+    lookups = hits + misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / lookups if lookups else 0.0,
+    }
+
+
+def reset_dashboard_cache_stats():
+    get_dashboard_cache().delete_many(COUNTER_KEYS.values())
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import TruncMonth, TruncWeek
+from .history import GRANULARITIES, iter_bankroll_history
+from .models import TournamentInput
+from .money import cents_sum
+from .plotting import CONTENT_TYPES, render_line_chart
+from .workers import get_pool
+
+CHART_KINDS = ('bankroll', 'profit')
+CHART_FORMATS = tuple(CONTENT_TYPES)
+
+# Bump when the rendering changes so old files stop being served.
+CHART_STYLE_VERSION = 1
+
+_PERIODS = {
+    'day': F('date'),
+    'week': TruncWeek('date'),
+    'month': TruncMonth('date'),
+}
+
+
+def bankroll_series(user, granularity):
+    points = iter_bankroll_history(user, date.min, date.max, granularity)
+    dates, values = [], []
+    for point in points:
+        dates.append(date.fromisoformat(point['date']))
+        values.append(point['balance'])
+    return dates, values
+
+
+def profit_series(user, granularity):
+    """Cumulative tournament profit in dollars at the end of each period."""
+    rows = (
+        TournamentInput.objects.filter(player=user)
+        .annotate(period=_PERIODS[granularity])
+        .values('period')
+        .annotate(net=cents_sum(F('cashed_for') - F('buy_in')))
+        .order_by('period')
+        .values_list('period', 'net')
+    )
+
+    dates, values = [], []
+    running = 0
+    for period, net in rows:
+        running += net
+        dates.append(period)
+        values.append(running / 100)
+    return dates, values
+
+
+def chart_path(user, kind, file_format, granularity):
+    """
+    Cache file for a chart. The name hashes everything the image is drawn
+    from, data_version included, so a write moves the player to new files.
+    """
+    raw = ':'.join(map(str, (CHART_STYLE_VERSION, user.pk, user.data_version, kind, granularity, file_format)))
+    digest = hashlib.sha256(raw.encode()).hexdigest()
+    return Path(settings.CHART_CACHE_DIR) / digest[:2] / f'{digest}.{file_format}'
+
+
+def get_chart(user, kind, file_format='png', granularity='day'):
+    """
+    Path of the rendered chart, drawing it in the render pool on a cache
+    miss. Raises concurrent.futures.TimeoutError past CHART_RENDER_TIMEOUT.
+    """
+    if kind not in CHART_KINDS or file_format not in CHART_FORMATS or granularity not in GRANULARITIES:
+        raise ValueError('Unknown chart kind, format or granularity')
+
+    path = chart_path(user, kind, file_format, granularity)
+    if path.exists():
+        return path
+
+    if kind == 'bankroll':
+        dates, values = bankroll_series(user, granularity)
+        title = 'Bankroll'
+    else:
+        dates, values = profit_series(user, granularity)
+        title = 'Cumulative tournament profit'
+
+    future = get_pool('charts', settings.CHART_MAX_WORKERS).submit(
+        render_line_chart, dates, values, file_format, title, 'Dollars'
+    )
+    content = future.result(timeout=settings.CHART_RENDER_TIMEOUT)
+
+    # Write-then-rename so concurrent requests never read a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as tmp:
+        tmp.write(content)
+    os.replace(tmp_path, path)
+
+    return path
@@ -0,0 +1,58 @@
+import hashlib
+from asgiref.sync import iscoroutinefunction
+from functools import wraps
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+
+def user_data_etag(request, *args, **kwargs):
+    """
+    Validator for pages built only from the requesting player's data.
+
+    Besides data_version it covers the query string, today's date (period
+    filters move at midnight) and the CSRF cookie, which is rendered into
+    every HTML page.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+
+    raw = ':'.join((
+        str(user.pk),
+        str(user.data_version),
+        timezone.localdate().isoformat(),
+        request.get_full_path(),
+        request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+    ))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def conditional_on_user_data(view_func):
+    """
+    Answer If-None-Match with a 304 before the view runs when the player has
+    not written anything since the client's copy. There is no Last-Modified:
+    HTTP dates have whole-second resolution, so a write in the same second
+    as a fetch would be answered with a stale 304.
+    """
+    conditional_view = condition(etag_func=user_data_etag)(view_func)
+
+    def patch(response):
+        patch_vary_headers(response, ('Cookie', 'Authorization'))
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    # Async views must have set request.user before this runs.
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_inner(request, *args, **kwargs):
+            return patch(await conditional_view(request, *args, **kwargs))
+
+        return async_inner
+
+    @wraps(view_func)
+    def inner(request, *args, **kwargs):
+        return patch(conditional_view(request, *args, **kwargs))
+
+    return inner
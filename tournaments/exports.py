@@ -0,0 +1,56 @@
+import csv
+import json
+from decimal import Decimal
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+EXPORT_CHUNK_SIZE = 2000
+
+TOURNAMENT_COLUMNS = ('id', 'date', 'buy_in', 'cashed_for', 'net_amount', 'place_finished')
+ADJUSTMENT_COLUMNS = ('id', 'date', 'transaction_type', 'amount', 'description')
+
+
+class Echo:
+    """File-like object whose write() hands the line straight back to csv.writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+def _format_value(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return f'{value:.2f}'
+    return value
+
+
+def _iter_rows(queryset, columns):
+    for row in queryset.values_list(*columns).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield [_format_value(value) for value in row]
+
+
+def _iter_lines(rows, columns, file_format):
+    if file_format == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(row)
+    else:
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row))) + '\n'
+
+
+def iter_tournament_export(tournaments, file_format='csv'):
+    tournaments = tournaments.with_net_amount().order_by('date', 'id')
+
+    return _iter_lines(_iter_rows(tournaments, TOURNAMENT_COLUMNS), TOURNAMENT_COLUMNS, file_format)
+
+
+def iter_adjustment_export(adjustments, file_format='csv'):
+    adjustments = adjustments.order_by('date', 'id')
+
+    return _iter_lines(_iter_rows(adjustments, ADJUSTMENT_COLUMNS), ADJUSTMENT_COLUMNS, file_format)
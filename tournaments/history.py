@@ -0,0 +1,152 @@
+import json
+from django.db import connection
+from .models import PokerUser, TournamentInput, BankrollAdjustment, BankrollLedgerEntry
+from .money import to_cents
+
+GRANULARITIES = ('day', 'week', 'month')
+
+# Date expressions that differ between the backends we run on.
+_DIALECTS = {
+    'postgresql': {
+        'adjustment_day': 'CAST(a.date AS date)',
+        'day': '{0}',
+        'week': "CAST(date_trunc('week', {0}) AS date)",
+        'month': "CAST(date_trunc('month', {0}) AS date)",
+    },
+    'sqlite': {
+        'adjustment_day': 'date(a.date)',
+        'day': '{0}',
+        'week': "date({0}, 'weekday 0', '-6 days')",
+        'month': "date({0}, 'start of month')",
+    },
+}
+
+# Every movement of the bankroll as one ordered event stream. A correction
+# sets the balance instead of moving it, so it starts a new segment and the
+# running SUM restarts from the corrected amount. Within a day, events are
+# ordered by their first ledger entry, i.e. the order they were recorded in;
+# rows without one (imports, data older than the ledger) come first.
+#
+# Without corrections the history is anchored to the current bankroll. With
+# corrections it is anchored to the balance the ledger recorded just before
+# the first one (the starting bankroll if that entry is missing).
+_HISTORY_SQL = """
+WITH events AS (
+    SELECT t.date AS day, 0 AS kind, t.id AS id,
+           COALESCE((SELECT MIN(l.id) FROM {ledger} l WHERE l.tournament_id = t.id), 0) AS seq,
+           t.cashed_for - t.buy_in AS amount, 0 AS is_reset
+    FROM {tournaments} t
+    WHERE t.player_id = %s
+    UNION ALL
+    SELECT {adjustment_day} AS day, 1 AS kind, a.id AS id,
+           COALESCE((SELECT MIN(l.id) FROM {ledger} l WHERE l.adjustment_id = a.id), 0) AS seq,
+           CASE WHEN a.transaction_type = 'withdrawal' THEN -a.amount ELSE a.amount END AS amount,
+           CASE WHEN a.transaction_type = 'correction' THEN 1 ELSE 0 END AS is_reset
+    FROM {adjustments} a
+    WHERE a.user_id = %s
+),
+segmented AS (
+    SELECT day, seq, kind, id, amount, is_reset,
+           SUM(is_reset) OVER (ORDER BY day, seq, kind, id ROWS UNBOUNDED PRECEDING) AS segment
+    FROM events
+),
+anchor AS (
+    SELECT CASE WHEN MAX(segment) > 0 THEN COALESCE(
+               (SELECT l.balance_after - l.amount FROM {ledger} l
+                WHERE l.adjustment_id = (SELECT id FROM segmented WHERE segment = 1 AND is_reset = 1)
+                ORDER BY l.id LIMIT 1)
+               - SUM(CASE WHEN segment = 0 THEN amount ELSE 0 END),
+               %s)
+           ELSE %s - COALESCE(SUM(amount), 0) END AS opening
+    FROM segmented
+),
+balances AS (
+    SELECT day, seq, kind, id,
+           SUM(amount) OVER (PARTITION BY segment ORDER BY day, seq, kind, id ROWS UNBOUNDED PRECEDING)
+           + CASE WHEN segment = 0 THEN anchor.opening ELSE 0 END AS balance
+    FROM segmented CROSS JOIN anchor
+),
+closes AS (
+    SELECT {period} AS period, balance,
+           ROW_NUMBER() OVER (PARTITION BY {period} ORDER BY day DESC, seq DESC, kind DESC, id DESC) AS position,
+           COUNT(*) OVER (PARTITION BY {period}) AS events
+    FROM balances
+),
+series AS (
+    SELECT period, balance, events,
+           balance - LAG(balance, 1, anchor.opening) OVER (ORDER BY period) AS change
+    FROM closes CROSS JOIN anchor
+    WHERE position = 1
+)
+SELECT period, balance, change, events
+FROM series
+WHERE period >= {range_start} AND period <= %s
+ORDER BY period
+"""
+
+
+def _history_sql(granularity):
+    dialect = _DIALECTS.get(connection.vendor, _DIALECTS['postgresql'])
+    period = dialect[granularity].format('day')
+
+    return _HISTORY_SQL.format(
+        tournaments=TournamentInput._meta.db_table,
+        adjustments=BankrollAdjustment._meta.db_table,
+        ledger=BankrollLedgerEntry._meta.db_table,
+        adjustment_day=dialect['adjustment_day'],
+        period=period,
+        range_start=dialect[granularity].format('%s'),
+    )
+
+
+def _money(cents) -> float:
+    return float(cents) / 100
+
+
+def iter_bankroll_history(user, start_date, end_date, granularity='day', chunk_size=500):
+    """
+    Yield the closing balance of every day/week/month between the two dates
+    that had at least one tournament or adjustment. Running balances are
+    computed by the database; rows are fetched in chunks.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Invalid granularity. Must be one of: {', '.join(GRANULARITIES)}")
+
+    # Amounts in the SQL are the raw integer-cent columns.
+    starting_bankroll = to_cents(PokerUser._meta.get_field('bankroll').default)
+    params = [user.pk, user.pk, starting_bankroll, to_cents(user.bankroll), start_date, end_date]
+
+    with connection.cursor() as cursor:
+        cursor.execute(_history_sql(granularity), params)
+
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+
+            for period, balance, change, events in rows:
+                yield {
+                    'date': str(period),
+                    'balance': _money(balance),
+                    'change': _money(change),
+                    'events': events,
+                }
+
+
+def iter_history_json(header, points):
+    """
+    Encode ``header`` and the ``points`` iterable as one JSON object, piece
+    by piece, so a long history is never held in memory.
+    """
+    encoder = json.JSONEncoder()
+
+    yield '{'
+    for key, value in header.items():
+        yield f'{encoder.encode(key)}: {encoder.encode(value)}, '
+
+    yield '"points": ['
+    for index, point in enumerate(points):
+        if index:
+            yield ', '
+        yield from encoder.iterencode(point)
+    yield ']}'
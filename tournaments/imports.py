@@ -0,0 +1,103 @@
+import codecs
+import csv
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+from .models import TournamentInput
+from .serializers import TournamentSerializer
+from .services import record_tournament_batch, tournament_snapshot
+
+IMPORT_FIELDS = ('date', 'buy_in', 'cashed_for', 'place_finished')
+
+
+def get_import_chunk_size():
+    return getattr(settings, 'TOURNAMENT_IMPORT_CHUNK_SIZE', 500)
+
+
+def get_import_max_rows():
+    return getattr(settings, 'TOURNAMENT_IMPORT_MAX_ROWS', 50000)
+
+
+class CSVRowError(ValueError):
+    """A CSV upload that could not be read, and the row it stopped at."""
+
+    def __init__(self, row, message):
+        super().__init__(message)
+        self.row = row
+        self.message = message
+
+    def as_report(self):
+        # Shaped like import_tournaments() reports a row it skipped.
+        return {'row': self.row, 'errors': {'non_field_errors': [self.message]}}
+
+
+def parse_csv_rows(uploaded_file):
+    """
+    Read a tournament CSV with a header row. Empty cells are dropped so the
+    model defaults (e.g. cashed_for) apply. A file that is not UTF-8 or not
+    valid CSV raises CSVRowError.
+    """
+    # Decoded line by line, so a bad byte is reported on its own row.
+    text = codecs.iterdecode(uploaded_file, 'utf-8-sig')
+    rows = []
+
+    try:
+        for record in csv.DictReader(text):
+            rows.append({
+                key.strip(): value.strip()
+                for key, value in record.items()
+                if key and value is not None and value.strip() != ''
+            })
+    except UnicodeDecodeError:
+        raise CSVRowError(len(rows) + 1, 'Row is not valid UTF-8 text')
+    except csv.Error as exc:
+        raise CSVRowError(len(rows) + 1, f'Row is not valid CSV: {exc}')
+
+    return rows
+
+
+def _chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield start, rows[start:start + size]
+
+
+def import_tournaments(player, rows, chunk_size=None):
+    """
+    Validate and insert tournament rows for one player. Invalid rows are
+    reported and skipped; valid rows are inserted with bulk_create in chunks
+    and the stats/bankroll bookkeeping runs once for the whole import.
+    """
+    chunk_size = chunk_size or get_import_chunk_size()
+    validator = TournamentSerializer()
+    errors = []
+    snapshots = []
+
+    with transaction.atomic():
+        for offset, chunk in _chunks(rows, chunk_size):
+            tournaments = []
+
+            for position, row in enumerate(chunk, start=offset + 1):
+                if not isinstance(row, dict):
+                    errors.append({'row': position, 'errors': {'non_field_errors': ['Expected an object']}})
+                    continue
+
+                data = {field: row[field] for field in IMPORT_FIELDS if field in row}
+                try:
+                    validated = validator.run_validation(data)
+                except serializers.ValidationError as exc:
+                    errors.append({'row': position, 'errors': exc.detail})
+                    continue
+
+                tournaments.append(TournamentInput(player=player, **validated))
+
+            TournamentInput.objects.bulk_create(tournaments, batch_size=chunk_size)
+            snapshots.extend(tournament_snapshot(tournament) for tournament in tournaments)
+
+        record_tournament_batch(player, snapshots)
+
+    return {
+        'received': len(rows),
+        'created': len(snapshots),
+        'failed': len(errors),
+        'errors': errors,
+    }
@@ -0,0 +1,73 @@
+import asyncio
+import time
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.backends.signals import connection_created
+from django.db import connections
+from django.test import AsyncClient, override_settings
+from tournaments.benchmarking import time_calls
+from tournaments.cache import get_dashboard_cache
+from tournaments.seeding import seed_player
+
+ENDPOINTS = (
+    ('sync API', '/api/users/dashboard/'),
+    ('async API', '/api/users/dashboard/async/'),
+    ('sync HTML', '/'),
+    ('async HTML', '/async/'),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Time cold-cache dashboard requests through the ASGI handler, sync vs async views, '
+        'with a simulated round trip added to every query. Rows are committed and removed afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000)
+        parser.add_argument('--latency-ms', type=float, default=20)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        latency = options['latency_ms'] / 1000
+
+        def delay(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_delay(connection, **kwargs):
+            if delay not in connection.execute_wrappers:
+                connection.execute_wrappers.append(delay)
+
+        player = get_user_model().objects.create_user(username='__async_benchmark__', password='benchmark')
+        try:
+            seed_player(player, np.random.default_rng(options['seed']), options['rows'], adjustments=20, days=400)
+
+            # Every thread opens its own connection; give each the delay.
+            connection_created.connect(add_delay)
+            for connection in connections.all():
+                add_delay(connection)
+
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                self.run_requests(player, options['repeat'])
+        finally:
+            connection_created.disconnect(add_delay)
+            for connection in connections.all():
+                if delay in connection.execute_wrappers:
+                    connection.execute_wrappers.remove(delay)
+            player.delete()
+
+    def run_requests(self, player, repeat):
+        client = AsyncClient()
+        client.force_login(player)
+
+        async def fetch(url):
+            response = await client.get(url, {'period': 'month'})
+            assert response.status_code == 200, response.status_code
+
+        for name, url in ENDPOINTS:
+            # Each request gets its own event loop; only the request is timed.
+            result = time_calls(repeat, lambda: asyncio.run(fetch(url)), before=get_dashboard_cache().clear)
+            self.stdout.write(f"{name:<12} best {result['best_ms']:8.1f} ms  median {result['median_ms']:8.1f} ms")
@@ -0,0 +1,39 @@
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from tournaments.benchmarking import time_calls
+from tournaments.models import TournamentInput
+from tournaments.seeding import seed_player
+from tournaments.serializers import TournamentSerializer, TournamentListSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare TournamentSerializer(many=True) with TournamentListSerializer on generated rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            player = get_user_model().objects.create_user(username='__serializer_benchmark__')
+            seed_player(player, np.random.default_rng(options['seed']), options['rows'])
+            tournaments = TournamentInput.objects.filter(player=player).order_by('-date', '-id')
+
+            def model_path():
+                return JSONRenderer().render(TournamentSerializer(tournaments.all(), many=True).data)
+
+            def rows_path():
+                return JSONRenderer().render(TournamentListSerializer(tournaments.list_rows()).data)
+
+            if model_path() != rows_path():
+                self.stderr.write(self.style.ERROR('Outputs differ'))
+
+            for name, path in (('TournamentSerializer', model_path), ('TournamentListSerializer', rows_path)):
+                best = time_calls(options['repeat'], path)['best_ms']
+                self.stdout.write(f"{name:<26} best {best:8.1f} ms over {options['rows']} rows")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,38 @@
+import numpy as np
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from tournaments.benchmarking import time_calls
+from tournaments.models import TournamentInput
+from tournaments.seeding import seed_player
+from tournaments.services import calculate_player_stats, calculate_tournament_stats
+
+
+class Command(BaseCommand):
+    help = 'Time the stats path (aggregates, stats build and per-row money properties) on generated rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            player = get_user_model().objects.create_user(username='__stats_benchmark__')
+            seed_player(player, np.random.default_rng(options['seed']), options['rows'])
+            tournaments = TournamentInput.objects.filter(player=player)
+            instances = list(tournaments)
+            since = timezone.localdate() - timedelta(days=365)
+
+            cases = (
+                ('aggregate + build (all rows)', lambda: calculate_tournament_stats(tournaments)),
+                ('daily buckets (date range)', lambda: calculate_player_stats(player, since)),
+                ('rollup (all time)', lambda: calculate_player_stats(player)),
+                ('net_amount/is_itm per row', lambda: [(t.net_amount, t.is_itm) for t in instances]),
+            )
+            for name, func in cases:
+                self.stdout.write(f"{name:<30} best {time_calls(options['repeat'], func)['best_ms']:8.2f} ms")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,38 @@
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from tournaments.bulk_load import load_tournament_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a tournament CSV (date, buy_in, cashed_for, place_finished) into a player's history "
+        'through a staging table: COPY on PostgreSQL, batched inserts on SQLite.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('username')
+        parser.add_argument('csv_path')
+        parser.add_argument('--max-errors', type=int, default=20, help='Invalid rows to print.')
+
+    def handle(self, *args, **options):
+        try:
+            player = get_user_model().objects.get(username=options['username'])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user named {options['username']}")
+
+        started = time.perf_counter()
+        try:
+            with open(options['csv_path'], 'rb') as stream:
+                report = load_tournament_csv(player, stream, max_errors=options['max_errors'])
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+
+        for error in report['errors']:
+            for field, messages in error['errors'].items():
+                self.stderr.write(f"row {error['row']}: {field}: {' '.join(messages)}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Loaded {report['created']} of {report['received']} rows ({report['failed']} invalid) "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
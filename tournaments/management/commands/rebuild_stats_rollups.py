@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from tournaments.models import PlayerStatsRollup, PlayerDailyStats
+from tournaments.services import rebuild_player_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-player stats rollups and daily buckets from the raw tournament rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            dest='username',
+            help='Only rebuild the rollup for this username.',
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = User.objects.all()
+
+        if options['username']:
+            users = users.filter(username=options['username'])
+            if not users.exists():
+                raise CommandError(f"User '{options['username']}' does not exist")
+        else:
+            PlayerStatsRollup.objects.all().delete()
+            PlayerDailyStats.objects.all().delete()
+
+        rebuilt = 0
+        for user in users.iterator():
+            rebuild_player_stats(user)
+            # The old rollup may have been wrong; drop cached dashboards built from it.
+            user.bump_data_version()
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt stats rollups for {rebuilt} player(s)'))
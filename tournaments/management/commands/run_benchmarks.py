@@ -0,0 +1,133 @@
+import json
+import platform
+from datetime import datetime, timezone as dt_timezone
+import django
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from tournaments.benchmarking import time_calls
+from tournaments.cache import get_dashboard_cache
+from tournaments.models import BankrollAdjustment, TournamentInput
+from tournaments.seeding import seed_player
+from tournaments.services import calculate_adjustment_totals, calculate_tournament_stats
+
+VIEW_CASES = (
+    ('dashboard (cold cache)', 'html', '/', True),
+    ('dashboard (warm cache)', 'html', '/', False),
+    ('tournament list', 'html', '/tournaments/', False),
+    ('api tournament list', 'api', '/api/tournaments/', False),
+    ('api stats', 'api', '/api/tournaments/stats/', False),
+    ('api advanced stats', 'api', '/api/tournaments/advanced-stats/', False),
+    ('api period stats', 'api', '/api/tournaments/period-stats/', False),
+    ('api buy-in tiers', 'api', '/api/tournaments/buy-in-tiers/', False),
+    ('api dashboard (cold cache)', 'api', '/api/users/dashboard/', True),
+    ('api bankroll history', 'api', '/api/users/bankroll_history/?days=365', False),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Time the stats services, the dashboard, the tournament list and the API on a generated '
+        'player per size, and write the results as JSON. Generated rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help='Tournaments per generated player.')
+        parser.add_argument('--adjustments', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', default='benchmark_results.json')
+        parser.add_argument('--compare', help='Earlier results file to print changes against.')
+
+    def time_case(self, repeat, func, before=None):
+        captured = CaptureQueriesContext(connection)
+
+        def run():
+            with captured:
+                func()
+
+        return {**time_calls(repeat, run, before), 'queries': len(captured)}
+
+    def get(self, client, url):
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+        # Streaming responses do their work while being consumed.
+        if response.streaming:
+            b''.join(response.streaming_content)
+
+    def run_size(self, size, options):
+        results = []
+        with transaction.atomic():
+            player = get_user_model().objects.create_user(username=f'__benchmark_{size}__')
+            seed_player(player, np.random.default_rng(options['seed']), size, options['adjustments'])
+
+            tournaments = TournamentInput.objects.filter(player=player)
+            adjustments = BankrollAdjustment.objects.filter(user=player)
+            html = Client()
+            html.force_login(player)
+            api = APIClient()
+            api.force_authenticate(player)
+            clear_cache = get_dashboard_cache().clear
+
+            cases = [
+                ('calculate_tournament_stats', lambda: calculate_tournament_stats(tournaments), None),
+                ('calculate_adjustment_totals', lambda: calculate_adjustment_totals(adjustments), None),
+            ] + [
+                (name, lambda c=(html if kind == 'html' else api), u=url: self.get(c, u), clear_cache if cold else None)
+                for name, kind, url, cold in VIEW_CASES
+            ]
+
+            for name, func, before in cases:
+                result = {'size': size, 'case': name, **self.time_case(options['repeat'], func, before)}
+                results.append(result)
+                self.stdout.write(
+                    f"{size:>7} {name:<30} best {result['best_ms']:9.2f} ms  "
+                    f"median {result['median_ms']:9.2f} ms  {result['queries']:>3} queries"
+                )
+
+            transaction.set_rollback(True)
+        return results
+
+    def handle(self, *args, **options):
+        results = []
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            for size in options['sizes']:
+                results.extend(self.run_size(size, options))
+
+        report = {
+            'meta': {
+                'created_at': datetime.now(dt_timezone.utc).isoformat(),
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'seed': options['seed'],
+                'repeat': options['repeat'],
+                'adjustments': options['adjustments'],
+            },
+            'results': results,
+        }
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(results)} results to {options['output']}"))
+
+        if options['compare']:
+            self.compare(options['compare'], results)
+
+    def compare(self, path, results):
+        with open(path) as previous_file:
+            previous = {(r['size'], r['case']): r for r in json.load(previous_file)['results']}
+
+        for result in results:
+            before = previous.get((result['size'], result['case']))
+            if not before:
+                continue
+            change = (result['best_ms'] - before['best_ms']) / before['best_ms'] * 100 if before['best_ms'] else 0
+            self.stdout.write(
+                f"{result['size']:>7} {result['case']:<30} {before['best_ms']:9.2f} -> "
+                f"{result['best_ms']:9.2f} ms ({change:+.1f}%)"
+            )
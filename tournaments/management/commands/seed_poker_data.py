@@ -0,0 +1,50 @@
+import time
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from tournaments.seeding import seed_player
+
+
+class Command(BaseCommand):
+    help = 'Create players with generated tournament and adjustment histories.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10)
+        parser.add_argument('--tournaments', type=int, default=1000, help='Tournaments per player.')
+        parser.add_argument('--adjustments', type=int, default=20, help='Adjustments per player.')
+        parser.add_argument('--days', type=int, default=730, help='Spread results over this many past days.')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--prefix', default='seed_', help='Username prefix of the generated players.')
+        parser.add_argument('--password', help='Password for every generated player (default: unusable).')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--clear', action='store_true', help='Delete players with the prefix first.')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        prefix = options['prefix']
+
+        if options['clear']:
+            deleted, _ = User.objects.filter(username__startswith=prefix).delete()
+            self.stdout.write(f'Deleted {deleted} rows of earlier generated players')
+
+        # Hash once; create_user would spend a full hash per player.
+        password = make_password(options['password'])
+        rng = np.random.default_rng(options['seed'])
+        started = time.perf_counter()
+
+        for i in range(options['users']):
+            player = User.objects.create(username=f'{prefix}{i:04d}', password=password)
+            seed_player(
+                player,
+                rng,
+                options['tournaments'],
+                options['adjustments'],
+                days=options['days'],
+                batch_size=options['batch_size'],
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {options['users']} players with {options['tournaments']} tournaments and "
+            f"{options['adjustments']} adjustments each in {time.perf_counter() - started:.1f}s"
+        ))
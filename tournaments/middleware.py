@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from .querycount import queries_are_budgeted
+
+logger = logging.getLogger(__name__)
+
+_current_stats = ContextVar('query_stats', default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    """Queries run while handling one request, from any thread."""
+
+    def __init__(self):
+        self.count = 0
+        self.unbudgeted = 0
+        self.duration = 0.0
+        self.slowest_sql = None
+        self.slowest_duration = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def budgeted(self):
+        return self.count - self.unbudgeted
+
+    def add(self, sql, duration, budgeted=True):
+        with self._lock:
+            self.count += 1
+            if not budgeted:
+                self.unbudgeted += 1
+            self.duration += duration
+            if duration > self.slowest_duration:
+                self.slowest_sql, self.slowest_duration = sql, duration
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add(sql, time.perf_counter() - started, queries_are_budgeted())
+
+
+def _install(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+# Connections are per thread, and concurrent dashboard reads open their own,
+# so every new connection gets the wrapper. The context variable follows the
+# request into sync_to_async threads.
+connection_created.connect(_install)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts and times the queries of each request, reports them in a
+    Server-Timing header and logs the slowest statement. Requests whose
+    (URL name, method) is in QUERY_BUDGETS and run more queries than the
+    budget are logged, or raise QueryBudgetExceeded when
+    QUERY_BUDGETS_ENFORCE is on (tests). Queries run while a streaming
+    body is produced are counted too, and checked once it is exhausted.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats, token, started = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats, token, started = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self.finish(request, response, stats, started)
+
+    def start(self):
+        for connection in connections.all(initialized_only=True):
+            _install(connection)
+        stats = QueryStats()
+        return stats, _current_stats.set(stats), time.perf_counter()
+
+    def finish(self, request, response, stats, started):
+        elapsed = time.perf_counter() - started
+        response.query_stats = stats
+        # For a streaming body this covers the queries run before it starts.
+        response.headers['Server-Timing'] = (
+            f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+            f'total;dur={elapsed * 1000:.1f}'
+        )
+
+        if not response.streaming:
+            self.check(request, stats)
+        elif response.is_async:
+            response.streaming_content = self.acounted(request, response.streaming_content, stats)
+        else:
+            response.streaming_content = self.counted(request, response.streaming_content, stats)
+        return response
+
+    def counted(self, request, content, stats):
+        # The stats are only current while the next chunk is produced, so
+        # they never leak into whatever consumes the body.
+        content = iter(content)
+        while True:
+            token = _current_stats.set(stats)
+            try:
+                chunk = next(content)
+            except StopIteration:
+                break
+            finally:
+                _current_stats.reset(token)
+            yield chunk
+        self.check(request, stats)
+
+    async def acounted(self, request, content, stats):
+        content = aiter(content)
+        while True:
+            token = _current_stats.set(stats)
+            try:
+                chunk = await anext(content)
+            except StopAsyncIteration:
+                break
+            finally:
+                _current_stats.reset(token)
+            yield chunk
+        self.check(request, stats)
+
+    def check(self, request, stats):
+        view_name = request.resolver_match.view_name if request.resolver_match else None
+        if stats.slowest_sql:
+            logger.debug(
+                '%s: %d queries in %.1f ms, slowest %.1f ms: %s',
+                view_name or request.path, stats.count, stats.duration * 1000,
+                stats.slowest_duration * 1000, stats.slowest_sql,
+            )
+
+        # HEAD runs the GET handler.
+        method = 'GET' if request.method == 'HEAD' else request.method
+        budget = getattr(settings, 'QUERY_BUDGETS', {}).get((view_name, method))
+        if budget is not None and stats.budgeted > budget:
+            message = f'{method} {view_name} ran {stats.budgeted} queries, budget is {budget}'
+            if getattr(settings, 'QUERY_BUDGETS_ENFORCE', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.4 on 2026-10-17 20:34
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_rollups(apps, schema_editor):
+    PokerUser = apps.get_model('tournaments', 'PokerUser')
+    TournamentInput = apps.get_model('tournaments', 'TournamentInput')
+    PlayerStatsRollup = apps.get_model('tournaments', 'PlayerStatsRollup')
+
+    totals = TournamentInput.objects.values('player').annotate(
+        total_tournaments=Count('id'),
+        total_buy_ins=Sum('buy_in'),
+        total_cash=Sum('cashed_for'),
+        itm_count=Count('id', filter=Q(cashed_for__gt=0)),
+        first_places=Count('id', filter=Q(place_finished=1)),
+        top_10_finishes=Count('id', filter=Q(place_finished__lte=10)),
+    ).order_by()
+    totals_by_player = {row.pop('player'): row for row in totals}
+
+    PlayerStatsRollup.objects.bulk_create([
+        PlayerStatsRollup(player_id=user_id, **totals_by_player.get(user_id, {}))
+        for user_id in PokerUser.objects.values_list('id', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0003_alter_bankrolladjustment_id_alter_pokeruser_id_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerStatsRollup',
+            fields=[
+                ('player', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats_rollup', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_tournaments', models.IntegerField(default=0)),
+                ('total_buy_ins', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('total_cash', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('itm_count', models.IntegerField(default=0)),
+                ('first_places', models.IntegerField(default=0)),
+                ('top_10_finishes', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.4 on 2026-10-17 20:36
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def populate_daily_stats(apps, schema_editor):
+    TournamentInput = apps.get_model('tournaments', 'TournamentInput')
+    PlayerDailyStats = apps.get_model('tournaments', 'PlayerDailyStats')
+
+    buckets = TournamentInput.objects.values('player', 'date').annotate(
+        total_tournaments=Count('id'),
+        total_buy_ins=Sum('buy_in'),
+        total_cash=Sum('cashed_for'),
+        itm_count=Count('id', filter=Q(cashed_for__gt=0)),
+        first_places=Count('id', filter=Q(place_finished=1)),
+        top_10_finishes=Count('id', filter=Q(place_finished__lte=10)),
+    ).order_by()
+
+    PlayerDailyStats.objects.bulk_create(
+        (PlayerDailyStats(player_id=row.pop('player'), **row) for row in buckets.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0004_playerstatsrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_tournaments', models.IntegerField(default=0)),
+                ('total_buy_ins', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('total_cash', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('itm_count', models.IntegerField(default=0)),
+                ('first_places', models.IntegerField(default=0)),
+                ('top_10_finishes', models.IntegerField(default=0)),
+                ('date', models.DateField()),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='playerdailystats',
+            constraint=models.UniqueConstraint(fields=('player', 'date'), name='unique_player_daily_stats'),
+        ),
+        migrations.RunPython(populate_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.4 on 2026-10-17 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0005_playerdailystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bankrolladjustment',
+            index=models.Index(fields=['user', 'date'], name='adjustment_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamentinput',
+            index=models.Index(fields=['player', 'date', 'id'], name='tournament_player_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamentinput',
+            index=models.Index(fields=['player', 'place_finished'], name='tournament_player_place_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamentinput',
+            index=models.Index(condition=models.Q(('cashed_for__gt', 0)), fields=['player', 'date'], name='tournament_player_itm_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-17 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0007_bankrollledgerentry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bankrollledgerentry',
+            name='entry_type',
+            field=models.CharField(choices=[('tournament', 'Tournament'), ('tournament_edit', 'Tournament Edit'), ('tournament_delete', 'Tournament Delete'), ('deposit', 'Deposit'), ('withdrawal', 'Withdrawal'), ('correction', 'Correction'), ('import', 'Import')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0008_alter_bankrollledgerentry_entry_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pokeruser',
+            name='data_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.4 on 2026-10-17 22:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0009_pokeruser_data_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pokeruser',
+            name='data_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:05
+
+import django.core.validators
+import tournaments.money
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import F, Value
+from django.db.models.functions import Round
+
+# (model, field, max_digits before the change)
+MONEY_COLUMNS = [
+    ('PokerUser', 'bankroll', 12),
+    ('TournamentInput', 'buy_in', 10),
+    ('TournamentInput', 'cashed_for', 10),
+    ('BankrollAdjustment', 'amount', 10),
+    ('BankrollLedgerEntry', 'amount', 14),
+    ('BankrollLedgerEntry', 'balance_after', 14),
+    ('PlayerStatsRollup', 'total_buy_ins', 14),
+    ('PlayerStatsRollup', 'total_cash', 14),
+    ('PlayerDailyStats', 'total_buy_ins', 14),
+    ('PlayerDailyStats', 'total_cash', 14),
+]
+
+
+def dollars_to_cents(apps, schema_editor):
+    for model_name, field, _ in MONEY_COLUMNS:
+        apps.get_model('tournaments', model_name).objects.update(**{field: Round(F(field) * 100)})
+
+
+def cents_to_dollars(apps, schema_editor):
+    for model_name, field, _ in MONEY_COLUMNS:
+        apps.get_model('tournaments', model_name).objects.update(**{field: F(field) * Value(Decimal('0.01'))})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0010_pokeruser_data_updated_at'),
+    ]
+
+    # Widen the decimal columns so the scaled values fit, multiply every
+    # amount by 100, then switch the columns to bigint.
+    operations = [
+        migrations.AlterField(
+            model_name=model_name.lower(),
+            name=field,
+            field=models.DecimalField(max_digits=max_digits + 2, decimal_places=2, default=Decimal('0.00')),
+        )
+        for model_name, field, max_digits in MONEY_COLUMNS
+    ] + [
+        migrations.RunPython(dollars_to_cents, cents_to_dollars),
+        migrations.AlterField(
+            model_name='pokeruser',
+            name='bankroll',
+            field=tournaments.money.MoneyField(default=Decimal('100.00'), max_digits=12, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AlterField(
+            model_name='tournamentinput',
+            name='buy_in',
+            field=tournaments.money.MoneyField(max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.10')), django.core.validators.MaxValueValidator(10000)]),
+        ),
+        migrations.AlterField(
+            model_name='tournamentinput',
+            name='cashed_for',
+            field=tournaments.money.MoneyField(default=Decimal('0.00'), max_digits=10, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(4000000)]),
+        ),
+        migrations.AlterField(
+            model_name='bankrolladjustment',
+            name='amount',
+            field=tournaments.money.MoneyField(max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01')), django.core.validators.MaxValueValidator(Decimal('4000000'))]),
+        ),
+        migrations.AlterField(
+            model_name='bankrollledgerentry',
+            name='amount',
+            field=tournaments.money.MoneyField(max_digits=14),
+        ),
+        migrations.AlterField(
+            model_name='bankrollledgerentry',
+            name='balance_after',
+            field=tournaments.money.MoneyField(max_digits=14),
+        ),
+        migrations.AlterField(
+            model_name='playerstatsrollup',
+            name='total_buy_ins',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='playerstatsrollup',
+            name='total_cash',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='playerdailystats',
+            name='total_buy_ins',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='playerdailystats',
+            name='total_cash',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
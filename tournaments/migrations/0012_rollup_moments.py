@@ -0,0 +1,63 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import BigIntegerField, ExpressionWrapper, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce
+
+SQUARES = models.DecimalField(max_digits=38, decimal_places=0)
+
+MOMENT_FIELDS = [
+    ('place_sum', models.BigIntegerField(default=0)),
+    ('roi_sum', models.BigIntegerField(default=0)),
+    ('roi_squares', models.DecimalField(decimal_places=0, default=0, max_digits=38)),
+    ('profit_squares', models.DecimalField(decimal_places=0, default=0, max_digits=38)),
+]
+
+
+def moment_aggregates():
+    # Money is in integer cents since 0011; ROI is in basis points,
+    # truncated toward zero by integer division.
+    profit = ExpressionWrapper(F('cashed_for') - F('buy_in'), output_field=BigIntegerField())
+    roi = ExpressionWrapper(profit * Value(10000) / F('buy_in'), output_field=BigIntegerField())
+
+    def squares(expression):
+        exact = Cast(expression, SQUARES)
+        return Sum(ExpressionWrapper(exact * exact, output_field=SQUARES), output_field=SQUARES)
+
+    return {
+        'place_sum': Sum('place_finished'),
+        'roi_sum': Sum(roi),
+        'roi_squares': squares(roi),
+        'profit_squares': squares(profit),
+    }
+
+
+def populate_moments(apps, schema_editor):
+    TournamentInput = apps.get_model('tournaments', 'TournamentInput')
+
+    for model_name, keys in (('PlayerStatsRollup', ('player',)), ('PlayerDailyStats', ('player', 'date'))):
+        model = apps.get_model('tournaments', model_name)
+        rows = TournamentInput.objects.filter(**{key: OuterRef(key) for key in keys}).values(*keys).order_by()
+        model.objects.update(**{
+            field: Coalesce(
+                Subquery(rows.annotate(value=aggregate).values('value')),
+                Value(0),
+                output_field=model._meta.get_field(field),
+            )
+            for field, aggregate in moment_aggregates().items()
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0011_money_in_cents'),
+    ]
+
+    operations = [
+        migrations.AddField(model_name=model_name, name=name, field=field)
+        for model_name in ('playerstatsrollup', 'playerdailystats')
+        for name, field in MOMENT_FIELDS
+    ] + [
+        migrations.RunPython(populate_moments, migrations.RunPython.noop),
+    ]
@@ -1,37 +1,120 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, F, Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 from decimal import Decimal
+from .money import MoneyField, cents_sum, from_cents, to_cents
 
 
 class PokerUser(AbstractUser):
-    bankroll = models.DecimalField(
+    bankroll = MoneyField(
         max_digits=12,
-        decimal_places=2,
         default=Decimal('100.00'),
         validators=[MinValueValidator(0)],
     )
+    # Bumped on every tournament or adjustment write; keys the dashboard
+    # cache and the ETag of per-player pages.
+    data_version = models.PositiveBigIntegerField(default=0, editable=False)
+    data_updated_at = models.DateTimeField(default=timezone.now, editable=False)
 
     @property
     def display_bankroll(self) -> str:
         return f"${self.bankroll:.2f}"
 
+    def _record_bankroll_change(self, amount, entry_type, **references):
+        balance, self.data_version, self.data_updated_at = PokerUser.objects.filter(
+            pk=self.pk
+        ).values_list('bankroll', 'data_version', 'data_updated_at').get()
+        self.bankroll = balance
+
+        return BankrollLedgerEntry.objects.create(
+            user=self,
+            entry_type=entry_type,
+            amount=amount,
+            balance_after=balance,
+            **references,
+        )
+
+    def apply_bankroll_delta(self, amount, entry_type, **references):
+        """
+        Move the bankroll by ``amount`` with a single UPDATE of the bankroll
+        column and write the matching ledger entry in the same transaction.
+        """
+        with transaction.atomic():
+            PokerUser.objects.filter(pk=self.pk).update(
+                bankroll=models.F('bankroll') + to_cents(amount),
+                data_version=models.F('data_version') + 1,
+                data_updated_at=timezone.now(),
+            )
+            return self._record_bankroll_change(amount, entry_type, **references)
+
+    def set_bankroll(self, amount, entry_type, **references):
+        with transaction.atomic():
+            previous = PokerUser.objects.select_for_update().filter(
+                pk=self.pk
+            ).values_list('bankroll', flat=True).get()
+            PokerUser.objects.filter(pk=self.pk).update(
+                bankroll=amount,
+                data_version=models.F('data_version') + 1,
+                data_updated_at=timezone.now(),
+            )
+            return self._record_bankroll_change(amount - previous, entry_type, **references)
+
+    def bump_data_version(self):
+        """Mark the player's data as changed without touching the bankroll."""
+        PokerUser.objects.filter(pk=self.pk).update(
+            data_version=models.F('data_version') + 1,
+            data_updated_at=timezone.now(),
+        )
+        self.data_version, self.data_updated_at = PokerUser.objects.filter(
+            pk=self.pk
+        ).values_list('data_version', 'data_updated_at').get()
+
     def __str__(self) -> str:
         return f"{self.username} (${self.bankroll})"
 
 
+def net_amount_expression():
+    return ExpressionWrapper(
+        F('cashed_for') - F('buy_in'),
+        output_field=MoneyField(),
+    )
+
+
+class TournamentInputQuerySet(models.QuerySet):
+
+    def with_net_amount(self):
+        return self.annotate(net_amount=net_amount_expression())
+
+    def list_rows(self):
+        """Plain dict rows with net and ITM computed in the database."""
+        return self.values(
+            'id', 'date', 'buy_in', 'cashed_for', 'place_finished', 'player',
+            net_amount=net_amount_expression(),
+            is_itm=ExpressionWrapper(Q(cashed_for__gt=0), output_field=BooleanField()),
+        )
+
+    def totals(self):
+        """Row count and net profit of the queryset in one aggregate query."""
+        totals = self.aggregate(
+            total_count=Count('id'),
+            total_profit=cents_sum(net_amount_expression()),
+        )
+        totals['total_profit'] = from_cents(totals['total_profit'] or 0)
+        return totals
+
+
 class TournamentInput(models.Model):
     date = models.DateField()
-    buy_in = models.DecimalField(
+    buy_in = MoneyField(
         max_digits=10,
-        decimal_places=2,
         validators=[MinValueValidator(Decimal('0.10')), MaxValueValidator(10000)],
         null=False,
         blank=False,
     )
-    cashed_for = models.DecimalField(
+    cashed_for = MoneyField(
         max_digits=10,
-        decimal_places=2,
         validators=[MinValueValidator(0), MaxValueValidator(4000000)],
         default=Decimal('0.00'),
         null=False,
@@ -49,13 +132,35 @@ class TournamentInput(models.Model):
         related_name='tournaments'
     )
 
+    objects = TournamentInputQuerySet.as_manager()
+
+    _net_amount = None
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['player', 'date', 'id'], name='tournament_player_date_idx'),
+            models.Index(fields=['player', 'place_finished'], name='tournament_player_place_idx'),
+            models.Index(
+                fields=['player', 'date'],
+                condition=models.Q(cashed_for__gt=0),
+                name='tournament_player_itm_idx',
+            ),
+        ]
+
     @property
     def net_amount(self) -> Decimal:
-        return Decimal(str(self.cashed_for)) - Decimal(str(self.buy_in))
+        if self._net_amount is not None:
+            return self._net_amount
+        return self.cashed_for - self.buy_in
+
+    @net_amount.setter
+    def net_amount(self, value):
+        # Filled in by TournamentInputQuerySet.with_net_amount().
+        self._net_amount = value
 
     @property
     def is_itm(self) -> bool:
-        return float(self.cashed_for) > 0.00
+        return self.cashed_for > 0
 
     @property
     def display_net(self) -> str:
@@ -82,9 +187,8 @@ class BankrollAdjustment(models.Model):
         on_delete=models.CASCADE,
         related_name='adjustments'
     )
-    amount = models.DecimalField(
+    amount = MoneyField(
         max_digits=10,
-        decimal_places=2,
         validators=[MinValueValidator(Decimal('0.01')),
                     MaxValueValidator(Decimal('4000000'))
                     ],
@@ -95,17 +199,127 @@ class BankrollAdjustment(models.Model):
     description = models.CharField(max_length=200, blank=True)
     date = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'date'], name='adjustment_user_date_idx'),
+        ]
+
     def apply_to_user(self):
         if self.transaction_type == 'deposit':
-            self.user.bankroll += self.amount
+            self.user.apply_bankroll_delta(self.amount, 'deposit', adjustment=self)
         elif self.transaction_type == 'withdrawal':
-            self.user.bankroll -= self.amount
+            self.user.apply_bankroll_delta(-self.amount, 'withdrawal', adjustment=self)
         elif self.transaction_type == 'correction':
-            self.user.bankroll = self.amount
-
-        self.user.save()
+            self.user.set_bankroll(self.amount, 'correction', adjustment=self)
 
     def __str__(self) -> str:
         return f"{self.user.username}: {self.transaction_type} ${self.amount}"
 
 
+class BankrollLedgerEntry(models.Model):
+    ENTRY_TYPES = [
+        ('tournament', 'Tournament'),
+        ('tournament_edit', 'Tournament Edit'),
+        ('tournament_delete', 'Tournament Delete'),
+        ('deposit', 'Deposit'),
+        ('withdrawal', 'Withdrawal'),
+        ('correction', 'Correction'),
+        ('import', 'Import'),
+    ]
+
+    user = models.ForeignKey(
+        'PokerUser',
+        on_delete=models.CASCADE,
+        related_name='ledger_entries'
+    )
+    entry_type = models.CharField(max_length=20, choices=ENTRY_TYPES)
+    amount = MoneyField(max_digits=14)
+    balance_after = MoneyField(max_digits=14)
+    tournament = models.ForeignKey(
+        'TournamentInput',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_entries'
+    )
+    adjustment = models.ForeignKey(
+        'BankrollAdjustment',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_entries'
+    )
+    description = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='ledger_user_created_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"User #{self.user_id}: {self.entry_type} {self.amount:+.2f} -> ${self.balance_after}"
+
+
+class TournamentTotals(models.Model):
+    total_tournaments = models.IntegerField(default=0)
+    # Money totals are kept in integer cents, like the aggregates they mirror.
+    total_buy_ins = models.BigIntegerField(default=0)
+    total_cash = models.BigIntegerField(default=0)
+    itm_count = models.IntegerField(default=0)
+    first_places = models.IntegerField(default=0)
+    top_10_finishes = models.IntegerField(default=0)
+    # Sums behind the variance figures of analytics.summarize_totals, kept
+    # as integers so adding and then removing a row restores them exactly.
+    # ROI is in basis points of the buy-in, profit in cents; the squares
+    # outgrow a bigint.
+    place_sum = models.BigIntegerField(default=0)
+    roi_sum = models.BigIntegerField(default=0)
+    roi_squares = models.DecimalField(max_digits=38, decimal_places=0, default=0)
+    profit_squares = models.DecimalField(max_digits=38, decimal_places=0, default=0)
+
+    class Meta:
+        abstract = True
+
+    def as_totals(self) -> dict:
+        return {
+            'total_tournaments': self.total_tournaments,
+            'total_buy_ins': self.total_buy_ins,
+            'total_cash': self.total_cash,
+            'itm_count': self.itm_count,
+            'first_places': self.first_places,
+            'top_10_finishes': self.top_10_finishes,
+            'place_sum': self.place_sum,
+            'roi_sum': self.roi_sum,
+            'roi_squares': self.roi_squares,
+            'profit_squares': self.profit_squares,
+        }
+
+
+class PlayerStatsRollup(TournamentTotals):
+    player = models.OneToOneField(
+        'PokerUser',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats_rollup'
+    )
+
+    def __str__(self) -> str:
+        return f"Stats for player #{self.player_id}: {self.total_tournaments} tournaments"
+
+
+class PlayerDailyStats(TournamentTotals):
+    player = models.ForeignKey(
+        'PokerUser',
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    date = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['player', 'date'], name='unique_player_daily_stats'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.date}: player #{self.player_id}, {self.total_tournaments} tournaments"
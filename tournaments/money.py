@@ -0,0 +1,102 @@
+from decimal import Decimal, InvalidOperation
+from django import forms
+from django.core import exceptions, validators
+from django.db import models
+from django.db.models import Sum
+from django.utils.functional import cached_property
+
+CENTS = Decimal('0.01')
+
+
+def to_cents(value) -> int:
+    """Dollars (Decimal, str, int or float) to integer cents."""
+    if isinstance(value, float):
+        value = repr(value)
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    return int((value * 100).to_integral_value())
+
+
+def from_cents(cents) -> Decimal:
+    """Integer cents to a two-place Decimal of dollars."""
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def raw_cents(field):
+    """A money column as its raw integer cents, skipping per-row conversion."""
+    return models.ExpressionWrapper(models.F(field), output_field=models.BigIntegerField())
+
+
+def cents_sum(expression, **extra):
+    """SUM of a money column that comes back as raw integer cents."""
+    return Sum(expression, output_field=models.BigIntegerField(), **extra)
+
+
+def round_div(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half-to-even, in integer arithmetic."""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+class MoneyField(models.BigIntegerField):
+    """
+    A dollar amount stored as integer cents. Python values are two-place
+    Decimals, so forms, serializers and templates keep working in dollars
+    while the database stores and sums plain integers.
+    """
+    description = 'Dollar amount stored as integer cents'
+    default_error_messages = {
+        'invalid': '“%(value)s” value must be a decimal number.',
+    }
+
+    def __init__(self, *args, max_digits=None, **kwargs):
+        self.max_digits = max_digits
+        self.decimal_places = 2
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.max_digits is not None:
+            kwargs['max_digits'] = self.max_digits
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        extra = [validators.DecimalValidator(self.max_digits, self.decimal_places)] if self.max_digits else []
+        return super().validators + extra
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return from_cents(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, Decimal) and value.as_tuple().exponent == -2:
+            return value
+        try:
+            if isinstance(value, float):
+                value = repr(value)
+            return Decimal(value).quantize(CENTS)
+        except (InvalidOperation, TypeError, ValueError):
+            raise exceptions.ValidationError(
+                self.error_messages['invalid'],
+                code='invalid',
+                params={'value': value},
+            )
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return None
+        return to_cents(value)
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{
+            'form_class': forms.DecimalField,
+            'max_digits': self.max_digits,
+            'decimal_places': self.decimal_places,
+            **kwargs,
+        })
@@ -0,0 +1,133 @@
+import base64
+from collections import OrderedDict
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(position, reverse=False):
+    value, pk = position
+    raw = f"{'r' if reverse else 'f'}|{value.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, field):
+    try:
+        direction, value, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        if direction not in ('f', 'r'):
+            raise ValueError(direction)
+        return (field.to_python(value), int(pk)), direction == 'r'
+    except Exception as exc:
+        raise InvalidCursor(cursor) from exc
+
+
+def keyset_page(queryset, cursor=None, page_size=25, field_name='date'):
+    """
+    One page of ``queryset`` ordered newest first by (field_name, id).
+
+    Pages are located by the (value, id) of the row at their edge instead of
+    an OFFSET, so every page costs an index range scan of ``page_size`` rows.
+    Returns (items, next_cursor, previous_cursor); cursors are None at the
+    ends of the list.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    newest_first = (f'-{field_name}', '-id')
+    oldest_first = (field_name, 'id')
+
+    if cursor is None:
+        rows = list(queryset.order_by(*newest_first)[:page_size + 1])
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+        next_cursor = encode_cursor(_position(items[-1], field_name)) if has_more else None
+        return items, next_cursor, None
+
+    (value, pk), reverse = decode_cursor(cursor, field)
+
+    if not reverse:
+        after = Q(**{f'{field_name}__lte': value}) & (Q(**{f'{field_name}__lt': value}) | Q(id__lt=pk))
+        rows = list(queryset.filter(after).order_by(*newest_first)[:page_size + 1])
+        has_more = len(rows) > page_size
+        items = rows[:page_size]
+
+        next_cursor = encode_cursor(_position(items[-1], field_name)) if has_more else None
+        previous_cursor = encode_cursor(_position(items[0], field_name), reverse=True) if items else None
+        return items, next_cursor, previous_cursor
+
+    before = Q(**{f'{field_name}__gte': value}) & (Q(**{f'{field_name}__gt': value}) | Q(id__gt=pk))
+    rows = list(queryset.filter(before).order_by(*oldest_first)[:page_size + 1])
+    has_more = len(rows) > page_size
+    items = rows[:page_size][::-1]
+
+    next_cursor = encode_cursor(_position(items[-1], field_name)) if items else None
+    previous_cursor = encode_cursor(_position(items[0], field_name), reverse=True) if has_more else None
+    return items, next_cursor, previous_cursor
+
+
+def _position(item, field_name):
+    if isinstance(item, dict):
+        return item[field_name], item['id']
+    return getattr(item, field_name), item.pk
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination over keyset_page. Responses carry ``next``/``previous``
+    links and ``results``; there is no total count.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_field = 'date'
+
+    def get_page_size(self, request):
+        page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE') or 10
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return page_size
+        return max(1, min(requested, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        try:
+            page, self.next_cursor, self.previous_cursor = keyset_page(
+                queryset, cursor, self.get_page_size(request), self.ordering_field
+            )
+        except InvalidCursor:
+            raise NotFound('Invalid cursor')
+
+        return page
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_link(self.next_cursor)),
+            ('previous', self.get_link(self.previous_cursor)),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -3,10 +3,11 @@ from rest_framework import permissions
 class IsOwner(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'player'):
-            return obj.player == request.user
+        # Compare ids; touching obj.user would load the related row.
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == request.user.pk
+        elif hasattr(obj, 'player_id'):
+            return obj.player_id == request.user.pk
 
         return request.method in permissions.SAFE_METHODS
 
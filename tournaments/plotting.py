@@ -0,0 +1,39 @@
+"""
+Chart rendering, run in a workers.get_pool pool. matplotlib is only
+imported there, on first use.
+"""
+import io
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+def render_line_chart(dates, values, file_format, title, ylabel):
+    """``values`` over ``dates`` as PNG or SVG bytes."""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+
+    # Fixed metadata and ids so the same data renders to the same bytes.
+    with matplotlib.rc_context({'svg.hashsalt': 'bankroll', 'svg.fonttype': 'none'}):
+        figure = Figure(figsize=(8, 4), dpi=100)
+        axes = figure.add_subplot()
+
+        if dates:
+            axes.plot(dates, values, color='#0d6efd', linewidth=1.5)
+            axes.axhline(0, color='#adb5bd', linewidth=0.8)
+            figure.autofmt_xdate()
+        else:
+            axes.text(0.5, 0.5, 'No data yet', ha='center', va='center', transform=axes.transAxes)
+
+        axes.set_title(title)
+        axes.set_ylabel(ylabel)
+        axes.grid(True, alpha=0.3)
+        figure.tight_layout()
+
+        buffer = io.BytesIO()
+        metadata = {'Date': None} if file_format == 'svg' else {'Software': None}
+        figure.savefig(buffer, format=file_format, metadata=metadata)
+
+    return buffer.getvalue()
@@ -0,0 +1,22 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_budgeted = ContextVar('query_budgeted', default=True)
+
+
+def queries_are_budgeted() -> bool:
+    """Whether queries run now count against the request's query budget."""
+    return _budgeted.get()
+
+
+@contextmanager
+def unbudgeted_queries():
+    """
+    Queries run inside still show in Server-Timing but are not held against
+    the request's budget: one-off backfills such as a rollup rebuild.
+    """
+    token = _budgeted.set(False)
+    try:
+        yield
+    finally:
+        _budgeted.reset(token)
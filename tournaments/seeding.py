@@ -0,0 +1,121 @@
+"""
+Synthetic players for benchmarks and local testing. Results follow a
+simple MTT model: field sizes are log-normal, about 15% of the field is
+paid with a top-heavy payout curve, and each player has a small edge (or
+leak) at a handful of nearby stakes.
+"""
+from datetime import datetime, time, timedelta
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+from .models import BankrollAdjustment, PokerUser, TournamentInput
+from .money import from_cents, to_cents
+from .services import rebuild_player_stats
+
+# Common online buy-ins, in cents.
+STAKES = np.array([110, 220, 330, 550, 1100, 2200, 3300, 5500, 10900, 21500, 53000])
+
+MAX_FIELD = 20000
+PAID_SHARE = 0.15
+RAKE = 0.09
+PAYOUT_EXPONENT = 0.9
+
+# Payout weight of the first n places is _PAYOUT_WEIGHTS[n - 1].
+_PAYOUT_WEIGHTS = np.cumsum(np.arange(1, MAX_FIELD + 1, dtype=np.float64) ** -PAYOUT_EXPONENT)
+
+
+def generate_results(rng, count, home_stake=None, skill=None):
+    """
+    (buy_ins, cashes, places) int64 arrays for ``count`` tournaments, money
+    in cents. ``home_stake`` indexes STAKES; the player mostly plays within
+    two steps of it. ``skill`` around 0.97 breaks even after rake; lower
+    is better.
+    """
+    if home_stake is None:
+        home_stake = int(rng.integers(1, len(STAKES) - 2))
+    if skill is None:
+        skill = rng.uniform(0.95, 1.0)
+    stake_index = np.clip(np.rint(rng.normal(home_stake, 1.0, count)), 0, len(STAKES) - 1).astype(np.int64)
+    buy_ins = STAKES[stake_index]
+
+    fields = np.clip(np.rint(rng.lognormal(np.log(400), 1.0, count)), 9, MAX_FIELD).astype(np.int64)
+    paid = np.maximum(1, np.rint(fields * PAID_SHARE)).astype(np.int64)
+
+    # Finishing percentile; Beta(1, 1) is a random player, about -8% ROI.
+    places = np.minimum(fields, 1 + np.floor(rng.beta(skill, 2 - skill, count) * fields)).astype(np.int64)
+
+    prize_pools = fields * buy_ins * (1 - RAKE)
+    in_money = places <= paid
+    shares = np.where(in_money, places.astype(np.float64) ** -PAYOUT_EXPONENT, 0) / _PAYOUT_WEIGHTS[paid - 1]
+    cashes = np.rint(prize_pools * shares).astype(np.int64)
+
+    return buy_ins, cashes, places
+
+
+def generate_adjustments(rng, count, average_buy_in):
+    """(amounts in cents, is_withdrawal) for ``count`` deposits and withdrawals."""
+    amounts = np.maximum(100, np.rint(rng.lognormal(np.log(average_buy_in * 20), 0.8, count) / 100) * 100)
+    return amounts.astype(np.int64), rng.random(count) < 0.3
+
+
+def seed_player(player, rng, tournaments, adjustments=0, days=730, batch_size=5000):
+    """
+    Bulk-insert a generated history for ``player``, set the bankroll it
+    implies and rebuild the stats rollups. Ledger entries are not written.
+    """
+    end = timezone.localdate()
+    start = end - timedelta(days=days)
+
+    buy_ins, cashes, places = generate_results(rng, tournaments)
+    offsets = np.sort(rng.integers(0, days + 1, tournaments))
+
+    amounts, withdrawals = generate_adjustments(rng, adjustments, buy_ins.mean() if tournaments else 1100)
+    adjustment_offsets = np.sort(rng.integers(0, days + 1, adjustments))
+
+    balance = to_cents(PokerUser._meta.get_field('bankroll').default)
+    balance += int((cashes - buy_ins).sum()) + int(np.where(withdrawals, -amounts, amounts).sum())
+
+    with transaction.atomic():
+        TournamentInput.objects.bulk_create(
+            (
+                TournamentInput(
+                    date=start + timedelta(days=int(offset)),
+                    buy_in=from_cents(buy_in),
+                    cashed_for=from_cents(cashed),
+                    place_finished=int(place),
+                    player=player,
+                )
+                for offset, buy_in, cashed, place in zip(offsets, buy_ins, cashes, places)
+            ),
+            batch_size=batch_size,
+        )
+
+        rows = [
+            BankrollAdjustment(
+                user=player,
+                amount=from_cents(amount),
+                transaction_type='withdrawal' if withdrawal else 'deposit',
+                description='Generated',
+            )
+            for amount, withdrawal in zip(amounts, withdrawals)
+        ]
+        # Top up at the end so the generated bankroll never ends negative.
+        if balance < 0:
+            rows.append(BankrollAdjustment(
+                user=player, amount=from_cents(-balance + 10000), transaction_type='deposit', description='Generated',
+            ))
+            adjustment_offsets = np.append(adjustment_offsets, days)
+            balance = 10000
+
+        created = BankrollAdjustment.objects.bulk_create(rows, batch_size=batch_size)
+        # ``date`` is auto_now_add, so spread the adjustments out afterwards.
+        for adjustment, offset in zip(created, adjustment_offsets):
+            adjustment.date = timezone.make_aware(datetime.combine(start + timedelta(days=int(offset)), time(12)))
+        BankrollAdjustment.objects.bulk_update(created, ['date'], batch_size=1000)
+
+        PokerUser.objects.filter(pk=player.pk).update(bankroll=from_cents(balance))
+        player.bankroll = from_cents(balance)
+        rebuild_player_stats(player)
+        player.bump_data_version()
+
+    return player
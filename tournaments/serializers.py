@@ -1,10 +1,19 @@
 from rest_framework import serializers
 from decimal import Decimal
 from .models import TournamentInput, BankrollAdjustment, PokerUser
+from .money import MoneyField
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.db.models import Q
 
-class TournamentSerializer(serializers.ModelSerializer):
+
+class ModelSerializer(serializers.ModelSerializer):
+    # Money columns hold integer cents but are Decimal dollars in Python and JSON.
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        MoneyField: serializers.DecimalField,
+    }
+
+class TournamentSerializer(ModelSerializer):
     net_amount = serializers.ReadOnlyField()
     display_net = serializers.ReadOnlyField()
     is_itm = serializers.ReadOnlyField()
@@ -51,7 +60,44 @@ class TournamentSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Tournament date cannot be in the future")
         return value
 
-class BankrollAdjustmentSerializer(serializers.ModelSerializer):
+class TournamentListSerializer(serializers.ListSerializer):
+    """
+    Read-only many=True output for ``TournamentInput.objects.list_rows()``.
+
+    Formats the plain rows directly instead of building instances and going
+    through each field; the rendered JSON is the same as TournamentSerializer's.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('child', TournamentSerializer())
+        super().__init__(*args, **kwargs)
+
+    def to_representation(self, data):
+        return [self.format_row(row) for row in data]
+
+    @staticmethod
+    def format_row(row):
+        net = row['net_amount']
+        if net > 0:
+            display_net = f"+${net}"
+        elif net < 0:
+            display_net = f"-${-net}"
+        else:
+            display_net = "$0.00"
+
+        return {
+            'id': row['id'],
+            'date': row['date'].isoformat(),
+            'buy_in': f"{row['buy_in']:.2f}",
+            'cashed_for': f"{row['cashed_for']:.2f}",
+            'place_finished': row['place_finished'],
+            'player': row['player'],
+            'net_amount': float(net),
+            'display_net': display_net,
+            'is_itm': bool(row['is_itm']),
+        }
+
+class BankrollAdjustmentSerializer(ModelSerializer):
     class Meta:
         model = BankrollAdjustment
         fields = [
@@ -79,7 +125,7 @@ class BankrollAdjustmentSerializer(serializers.ModelSerializer):
             )
         return value
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(ModelSerializer):
     class Meta:
         model = PokerUser
         fields = [
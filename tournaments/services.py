@@ -1,6 +1,51 @@
-from datetime import datetime, timedelta
-from django.db.models import Sum
+from datetime import date, datetime, timedelta
+from django.db import IntegrityError, transaction
+from django.conf import settings
+from django.db.models import (
+    BigIntegerField, Case, Count, DecimalField, ExpressionWrapper, F, IntegerField, Q, Sum, Value, When,
+)
+from django.db.models.functions import Cast
 from decimal import Decimal
+from .models import PlayerDailyStats, PlayerStatsRollup, PokerUser, TournamentInput
+from .querycount import unbudgeted_queries
+from .money import cents_sum, from_cents, raw_cents, round_div, to_cents
+
+STATS_FIELDS = (
+    'total_tournaments',
+    'total_buy_ins',
+    'total_cash',
+    'itm_count',
+    'first_places',
+    'top_10_finishes',
+)
+
+# Sums behind the variance figures of analytics.summarize_totals.
+MOMENT_FIELDS = (
+    'place_sum',
+    'roi_sum',
+    'roi_squares',
+    'profit_squares',
+)
+
+ROLLUP_FIELDS = STATS_FIELDS + MOMENT_FIELDS
+MOMENT_SQUARES = DecimalField(max_digits=38, decimal_places=0)
+
+# (name, exclusive upper buy-in in dollars); the last tier is open-ended.
+DEFAULT_BUY_IN_TIERS = (
+    ('micro', Decimal('5.00')),
+    ('low', Decimal('30.00')),
+    ('mid', Decimal('150.00')),
+    ('high', None),
+)
+
+# Lowest place of each finish bucket; the last bucket is open-ended.
+DEFAULT_FINISH_EDGES = (1, 2, 3, 4, 10, 28, 101)
+
+# The dashboard's periods, in button order; see get_period_filter.
+STANDARD_PERIODS = ('week', 'month', 'year', 'all')
+MAX_EXTRA_PERIODS = 8
+# Longest day count a request may ask for; far larger ones overflow date.
+MAX_PERIOD_DAYS = 36_500
 
 def get_period_filter(period: str):
     today = datetime.now().date()
@@ -14,8 +59,52 @@ def get_period_filter(period: str):
 
     return None, "All Time"
 
-def calculate_tournament_stats(qs):
-    total = qs.count()
+def roi_basis_points(profit, buy_in):
+    """A tournament's ROI in whole basis points, truncated toward zero like SQL integer division."""
+    points = abs(profit) * 10000 // buy_in
+    return points if profit >= 0 else -points
+
+def tournament_totals_aggregates():
+    profit = raw_cents('cashed_for') - raw_cents('buy_in')
+    roi = ExpressionWrapper(profit * Value(10000) / raw_cents('buy_in'), output_field=BigIntegerField())
+
+    def squares(expression):
+        # Cast first: the product of two large bigints overflows.
+        exact = Cast(expression, MOMENT_SQUARES)
+        return Sum(ExpressionWrapper(exact * exact, output_field=MOMENT_SQUARES), output_field=MOMENT_SQUARES)
+
+    return {
+        'total_tournaments': Count('id'),
+        'total_buy_ins': cents_sum('buy_in'),
+        'total_cash': cents_sum('cashed_for'),
+        'itm_count': Count('id', filter=Q(cashed_for__gt=0)),
+        'first_places': Count('id', filter=Q(place_finished=1)),
+        'top_10_finishes': Count('id', filter=Q(place_finished__lte=10)),
+        'place_sum': Sum('place_finished'),
+        'roi_sum': Sum(roi),
+        'roi_squares': squares(roi),
+        'profit_squares': squares(profit),
+    }
+
+def aggregate_tournament_totals(qs):
+    return qs.aggregate(**tournament_totals_aggregates())
+
+def aggregate_daily_totals(player, start_date=None, end_date=None):
+    buckets = PlayerDailyStats.objects.filter(player=player)
+
+    if start_date:
+        buckets = buckets.filter(date__gte=start_date)
+    if end_date:
+        buckets = buckets.filter(date__lte=end_date)
+
+    return buckets.aggregate(**{field: Sum(field) for field in ROLLUP_FIELDS})
+
+def build_tournament_stats(totals):
+    """
+    Stats from a totals dict (money in integer cents). All arithmetic is on
+    ints; money and ROI come back as two-place Decimals.
+    """
+    total = totals['total_tournaments'] or 0
 
     if total == 0:
         return {
@@ -33,38 +122,412 @@ def calculate_tournament_stats(qs):
             'avg_buy_in': 0,
         }
 
-    total_buy_ins = qs.aggregate(Sum('buy_in'))['buy_in__sum'] or Decimal('0')
-    total_cash = qs.aggregate(Sum('cashed_for'))['cashed_for__sum'] or Decimal('0')
+    total_buy_ins = totals['total_buy_ins'] or 0
+    total_cash = totals['total_cash'] or 0
     total_profit = total_cash - total_buy_ins
 
-    roi = (total_profit / total_buy_ins * 100) if total_buy_ins > 0 else 0
+    # ROI in hundredths of a percent.
+    roi = from_cents(round_div(total_profit * 10000, total_buy_ins)) if total_buy_ins > 0 else 0
 
-    itm_count = qs.filter(cashed_for__gt=0).count()
+    itm_count = totals['itm_count']
     itm_percentage = (itm_count / total * 100)
 
-    first_places = qs.filter(place_finished=1).count()
-    top_10_finishes = qs.filter(place_finished__lte=10).count()
+    first_places = totals['first_places']
+    top_10_finishes = totals['top_10_finishes']
 
     first_place_percentage = (first_places / total * 100)
     top_10_percentage = (top_10_finishes / total * 100)
 
-    avg_buy_in = total_buy_ins / total
+    avg_buy_in = from_cents(round_div(total_buy_ins, total))
 
     return {
         'total_tournaments': total,
-        'total_buy_ins': total_buy_ins,
-        'total_cash': total_cash,
-        'total_profit': total_profit,
-        'roi': round(roi, 2),
+        'total_buy_ins': from_cents(total_buy_ins),
+        'total_cash': from_cents(total_cash),
+        'total_profit': from_cents(total_profit),
+        'roi': roi,
         'itm_count': itm_count,
         'itm_percentage': round(itm_percentage, 2),
         'first_places': first_places,
         'top_10_finishes': top_10_finishes,
         'first_place_percentage': round(first_place_percentage, 2),
         'top_10_percentage': round(top_10_percentage, 2),
-        'avg_buy_in': round(avg_buy_in, 2),
+        'avg_buy_in': avg_buy_in,
+    }
+
+def calculate_tournament_stats(qs):
+    return build_tournament_stats(aggregate_tournament_totals(qs))
+
+def calculate_player_stats(player, start_date=None, end_date=None):
+    """
+    Stats for one player over an optional date range, served from the
+    rollup (all time) or the daily buckets (any other range). Use
+    calculate_tournament_stats for filters other than a date range.
+    """
+    return build_tournament_stats(get_player_period_totals(player, start_date, end_date))
+
+def get_player_period_totals(player, start_date=None, end_date=None):
+    """Raw totals behind calculate_player_stats."""
+    if start_date is None and end_date is None:
+        return get_player_totals(player)
+
+    totals = aggregate_daily_totals(player, start_date, end_date)
+
+    if not totals['total_tournaments'] and not PlayerStatsRollup.objects.filter(player=player).exists():
+        with unbudgeted_queries():
+            ensure_player_stats(player)
+            totals = aggregate_daily_totals(player, start_date, end_date)
+
+    return totals
+
+def get_period_windows(days=None, ranges=None):
+    """
+    (name, display, start_date, end_date) for the standard periods, then
+    one window per extra day count in ``days`` and per 'start:end' string
+    in ``ranges`` (ISO dates, either side may be empty). Raises ValueError
+    on bad input.
+    """
+    windows = []
+    for period in STANDARD_PERIODS:
+        start_date, display = get_period_filter(period)
+        windows.append((period, display, start_date, None))
+
+    extras = []
+    today = datetime.now().date()
+    for count in days or ():
+        count = int(count)
+        if not 1 <= count <= MAX_PERIOD_DAYS:
+            raise ValueError(f'Day counts must be between 1 and {MAX_PERIOD_DAYS}')
+        extras.append((f'last_{count}_days', f'Last {count} days', today - timedelta(days=count), None))
+
+    for window in ranges or ():
+        start, _, end = window.partition(':')
+        start_date = date.fromisoformat(start) if start else None
+        end_date = date.fromisoformat(end) if end else None
+        if start_date and end_date and start_date > end_date:
+            raise ValueError('Range start must not be after its end')
+        display = f"{start_date or 'Start'} to {end_date or 'today'}"
+        extras.append((window, display, start_date, end_date))
+
+    if len(extras) > MAX_EXTRA_PERIODS:
+        raise ValueError(f'At most {MAX_EXTRA_PERIODS} extra periods')
+
+    names = set(STANDARD_PERIODS)
+    for window in extras:
+        if window[0] not in names:
+            names.add(window[0])
+            windows.append(window)
+
+    return windows
+
+def _window_filter(start_date, end_date, end_field='date__lte'):
+    window = Q()
+    if start_date:
+        window &= Q(date__gte=start_date)
+    if end_date:
+        window &= Q(**{end_field: end_date})
+    return window or None
+
+def calculate_player_period_stats(player, windows):
+    """
+    Stats for each (name, display, start_date, end_date) window from one
+    query over the daily buckets, with a filtered SUM per window and field.
+    Returns stats by window name.
+    """
+    aggregates = {
+        f'w{i}_{field}': Sum(field, filter=_window_filter(start_date, end_date))
+        for i, (_, _, start_date, end_date) in enumerate(windows)
+        for field in STATS_FIELDS
+    }
+
+    def totals():
+        return PlayerDailyStats.objects.filter(player=player).aggregate(**aggregates)
+
+    row = totals()
+    empty = not any(row[f'w{i}_total_tournaments'] for i in range(len(windows)))
+    if empty and not PlayerStatsRollup.objects.filter(player=player).exists():
+        with unbudgeted_queries():
+            ensure_player_stats(player)
+            row = totals()
+
+    return {
+        name: build_tournament_stats({field: row[f'w{i}_{field}'] for field in STATS_FIELDS})
+        for i, (name, _, _, _) in enumerate(windows)
+    }
+
+def calculate_period_adjustment_totals(qs, windows):
+    """calculate_adjustment_totals for each window, in one query."""
+    aggregates = {}
+    for i, (_, _, start_date, end_date) in enumerate(windows):
+        # ``date`` is a datetime; the end date is included up to midnight.
+        window = _window_filter(start_date, end_date and end_date + timedelta(days=1), 'date__lt') or Q()
+        for transaction_type in ('deposit', 'withdrawal'):
+            aggregates[f'w{i}_{transaction_type}'] = Sum(
+                'amount', filter=window & Q(transaction_type=transaction_type)
+            )
+
+    row = qs.aggregate(**aggregates)
+    return {
+        name: {
+            'total_deposits': row[f'w{i}_deposit'] or Decimal('0'),
+            'total_withdrawals': row[f'w{i}_withdrawal'] or Decimal('0'),
+        }
+        for i, (name, _, _, _) in enumerate(windows)
+    }
+
+def get_buy_in_tiers(edges=None):
+    """
+    Tiers from ``BUY_IN_TIERS`` in settings (or the defaults), or unnamed
+    tiers split at the given increasing dollar ``edges``.
+    """
+    if not edges:
+        return tuple(getattr(settings, 'BUY_IN_TIERS', DEFAULT_BUY_IN_TIERS))
+
+    edges = [Decimal(edge).quantize(Decimal('0.01')) for edge in edges]
+    if any(edge <= 0 for edge in edges) or edges != sorted(set(edges)):
+        raise ValueError('Tier edges must be positive and increasing')
+
+    lowers = [Decimal('0.00')] + edges
+    names = [f'${lower}-${upper}' for lower, upper in zip(lowers, edges)] + [f'${edges[-1]}+']
+    return tuple(zip(names, edges + [None]))
+
+def calculate_buy_in_tiers(qs, tiers=None):
+    """
+    Full stats per buy-in tier from one GROUP BY over a CASE expression
+    that numbers each row's tier. Empty tiers are included.
+    """
+    tiers = tiers or get_buy_in_tiers()
+    tier = Case(
+        *(When(buy_in__lt=upper, then=Value(i)) for i, (_, upper) in enumerate(tiers) if upper is not None),
+        default=Value(len(tiers) - 1),
+        output_field=IntegerField(),
+    )
+    rows = qs.annotate(tier=tier).values('tier').annotate(**tournament_totals_aggregates()).order_by('tier')
+    totals_by_tier = {row.pop('tier'): row for row in rows}
+
+    breakdown = []
+    lower = Decimal('0.00')
+    for i, (name, upper) in enumerate(tiers):
+        breakdown.append({
+            'tier': name,
+            'min_buy_in': lower,
+            'max_buy_in': upper,
+            **build_tournament_stats(totals_by_tier.get(i, {'total_tournaments': 0})),
+        })
+        lower = upper
+
+    return breakdown
+
+def get_finish_buckets(edges=None):
+    """
+    (label, min_place, max_place) per bucket, from increasing lower bounds
+    (``FINISH_HISTOGRAM_EDGES`` in settings by default). Places below the
+    first edge fall in a bucket starting at 1.
+    """
+    edges = [int(edge) for edge in edges or getattr(settings, 'FINISH_HISTOGRAM_EDGES', DEFAULT_FINISH_EDGES)]
+    if any(edge < 1 for edge in edges) or edges != sorted(set(edges)):
+        raise ValueError('Finish edges must be positive and increasing')
+    if edges[0] != 1:
+        edges.insert(0, 1)
+
+    buckets = []
+    for low, next_low in zip(edges, edges[1:] + [None]):
+        high = next_low - 1 if next_low else None
+        if high is None:
+            label = f'{low}+'
+        elif high == low:
+            label = str(low)
+        else:
+            label = f'{low}-{high}'
+        buckets.append((label, low, high))
+    return tuple(buckets)
+
+def calculate_finish_histogram(qs, buckets=None):
+    """Tournament count and share per finish bucket, from one aggregate."""
+    buckets = buckets or get_finish_buckets()
+    counts = {'total': Count('id')}
+    for i, (_, low, high) in enumerate(buckets):
+        places = Q(place_finished__gte=low)
+        if high is not None:
+            places &= Q(place_finished__lte=high)
+        counts[f'bucket_{i}'] = Count('id', filter=places)
+
+    totals = qs.aggregate(**counts)
+    total = totals['total']
+
+    return [
+        {
+            'bucket': label,
+            'min_place': low,
+            'max_place': high,
+            'count': totals[f'bucket_{i}'],
+            'percentage': round(totals[f'bucket_{i}'] / total * 100, 2) if total else 0,
+        }
+        for i, (label, low, high) in enumerate(buckets)
+    ]
+
+def tournament_snapshot(tournament):
+    return {
+        'date': tournament.date,
+        'buy_in': to_cents(tournament.buy_in),
+        'cashed_for': to_cents(tournament.cashed_for),
+        'place_finished': tournament.place_finished,
+    }
+
+def tournament_contribution(snapshot, sign=1):
+    place = snapshot['place_finished']
+    profit = snapshot['cashed_for'] - snapshot['buy_in']
+    roi = roi_basis_points(profit, snapshot['buy_in'])
+
+    return {
+        'total_tournaments': sign,
+        'total_buy_ins': sign * snapshot['buy_in'],
+        'total_cash': sign * snapshot['cashed_for'],
+        'itm_count': sign if snapshot['cashed_for'] > 0 else 0,
+        'first_places': sign if place == 1 else 0,
+        'top_10_finishes': sign if place <= 10 else 0,
+        'place_sum': sign * place,
+        'roi_sum': sign * roi,
+        # Decimal so a square past the bigint range is bound as numeric.
+        'roi_squares': Decimal(sign * roi * roi),
+        'profit_squares': Decimal(sign * profit * profit),
     }
 
+def _lock_player(player):
+    # Rebuilds of one player run one at a time; two at once would both
+    # re-insert the same daily buckets.
+    list(PokerUser.objects.select_for_update().filter(pk=player.pk).values_list('pk'))
+
+def rebuild_player_stats(player):
+    tournaments = TournamentInput.objects.filter(player=player)
+
+    with unbudgeted_queries(), transaction.atomic():
+        _lock_player(player)
+        totals = aggregate_tournament_totals(tournaments)
+        defaults = {field: totals[field] or 0 for field in ROLLUP_FIELDS}
+        rollup, _ = PlayerStatsRollup.objects.update_or_create(player=player, defaults=defaults)
+
+        PlayerDailyStats.objects.filter(player=player).delete()
+        buckets = tournaments.values('date').annotate(**tournament_totals_aggregates()).order_by()
+        PlayerDailyStats.objects.bulk_create(
+            (PlayerDailyStats(player=player, **row) for row in buckets.iterator()),
+            batch_size=1000,
+        )
+
+    return rollup
+
+def ensure_player_stats(player):
+    """
+    The player's rollup, built first if it is missing. Concurrent first
+    reads queue on the player lock and reuse the rollup the first built.
+    """
+    with unbudgeted_queries(), transaction.atomic():
+        _lock_player(player)
+        return PlayerStatsRollup.objects.filter(player=player).first() or rebuild_player_stats(player)
+
+def get_player_totals(player):
+    try:
+        rollup = PlayerStatsRollup.objects.get(player=player)
+    except PlayerStatsRollup.DoesNotExist:
+        rollup = ensure_player_stats(player)
+
+    return rollup.as_totals()
+
+def _apply_daily_delta(player, day, delta):
+    changes = {field: F(field) + value for field, value in delta.items() if value}
+    if not changes:
+        return
+
+    buckets = PlayerDailyStats.objects.filter(player=player, date=day)
+    if buckets.update(**changes):
+        return
+
+    try:
+        with transaction.atomic():
+            PlayerDailyStats.objects.create(player=player, date=day, **delta)
+    except IntegrityError:
+        buckets.update(**changes)
+
+def _apply_stats_delta(player, delta, daily_deltas):
+    changes = {field: F(field) + value for field, value in delta.items() if value}
+    rollups = PlayerStatsRollup.objects.filter(player=player)
+
+    exists = rollups.update(**changes) if changes else rollups.exists()
+    if not exists:
+        rebuild_player_stats(player)
+        return
+
+    for day, daily in daily_deltas.items():
+        _apply_daily_delta(player, day, daily)
+
+def _collect_deltas(signed_snapshots):
+    delta = dict.fromkeys(ROLLUP_FIELDS, 0)
+    daily_deltas = {}
+
+    for snapshot, sign in signed_snapshots:
+        if snapshot is None:
+            continue
+
+        daily = daily_deltas.setdefault(snapshot['date'], dict.fromkeys(ROLLUP_FIELDS, 0))
+        for field, value in tournament_contribution(snapshot, sign).items():
+            delta[field] += value
+            daily[field] += value
+
+    return delta, daily_deltas
+
+def record_tournament_change(player, old=None, new=None, tournament=None):
+    """
+    Apply the difference between two tournament snapshots to the player's
+    rollup, daily buckets and bankroll (with a ledger entry). Pass only
+    ``new`` for a create and only ``old`` for a delete.
+    """
+    delta, daily_deltas = _collect_deltas(((old, -1), (new, 1)))
+
+    if old is None:
+        entry_type = 'tournament'
+    elif new is None:
+        entry_type = 'tournament_delete'
+    else:
+        entry_type = 'tournament_edit'
+
+    net = delta['total_cash'] - delta['total_buy_ins']
+
+    with transaction.atomic():
+        _apply_stats_delta(player, delta, daily_deltas)
+
+        if net:
+            player.apply_bankroll_delta(
+                from_cents(net),
+                entry_type,
+                tournament=tournament,
+                description=f"Tournament on {(new or old)['date']}",
+            )
+        else:
+            player.bump_data_version()
+
+def record_tournament_batch(player, snapshots):
+    """
+    Bookkeeping for many newly inserted tournaments at once: one rollup
+    update, one update per touched day and a single combined bankroll move.
+    """
+    delta, daily_deltas = _collect_deltas((snapshot, 1) for snapshot in snapshots)
+    if not delta['total_tournaments']:
+        return
+
+    net = delta['total_cash'] - delta['total_buy_ins']
+
+    with transaction.atomic():
+        _apply_stats_delta(player, delta, daily_deltas)
+
+        if net:
+            player.apply_bankroll_delta(
+                from_cents(net),
+                'import',
+                description=f"Imported {delta['total_tournaments']} tournaments",
+            )
+        else:
+            player.bump_data_version()
+
 def calculate_adjustment_totals(qs):
     total_deposits = qs.filter(
         transaction_type='deposit'
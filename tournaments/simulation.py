@@ -0,0 +1,107 @@
+"""
+Monte Carlo bankroll simulation; chunks run in a workers.get_pool pool.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+import numpy as np
+from .workers import get_pool
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Trajectories per worker task, and cap on matrix cells per NumPy batch.
+CHUNK_TRAJECTORIES = 10_000
+MAX_BATCH_CELLS = 2_000_000
+
+def simulate_chunk(outcomes, bankroll, horizon, trajectories, seed):
+    """
+    Resample ``outcomes`` (net result per tournament, in cents) into
+    ``trajectories`` paths of ``horizon`` tournaments starting at
+    ``bankroll``. Returns (final balance, max drawdown, ruined) arrays.
+    """
+    rng = np.random.default_rng(seed)
+    batch = max(1, min(trajectories, MAX_BATCH_CELLS // horizon))
+    finals, drawdowns, ruined = [], [], []
+
+    for start in range(0, trajectories, batch):
+        size = min(batch, trajectories - start)
+        paths = bankroll + np.cumsum(rng.choice(outcomes, size=(size, horizon)), axis=1)
+
+        peaks = np.maximum(np.maximum.accumulate(paths, axis=1), bankroll)
+        broke = (paths <= 0).any(axis=1)
+
+        finals.append(np.where(broke, 0, paths[:, -1]))
+        drawdowns.append((peaks - paths).max(axis=1))
+        ruined.append(broke)
+
+    return np.concatenate(finals), np.concatenate(drawdowns), np.concatenate(ruined)
+
+
+def run_simulation(outcomes, bankroll, horizon=1000, trajectories=100_000, downswing=None,
+                   seed=None, time_budget=None, workers=None):
+    """
+    Risk of ruin, downswing probability and percentiles of the final
+    bankroll and worst drawdown. Money is in cents.
+
+    The work is split into chunks with independent child seeds of ``seed``,
+    so a given seed gives the same answer however many workers run it. If
+    ``time_budget`` seconds pass first, only the finished leading chunks are
+    used and the result is marked truncated. ``workers`` sizes the shared
+    pool when the first parallel run creates it.
+    """
+    outcomes = np.asarray(outcomes, dtype=np.int64)
+    seed_sequence = np.random.SeedSequence(seed)
+    chunks = [
+        min(CHUNK_TRAJECTORIES, trajectories - start)
+        for start in range(0, trajectories, CHUNK_TRAJECTORIES)
+    ]
+    seeds = seed_sequence.spawn(len(chunks))
+    workers = workers or os.cpu_count() or 1
+    started = time.monotonic()
+    deadline = started + time_budget if time_budget else None
+
+    if workers == 1 or len(chunks) == 1:
+        results = []
+        for size, child in zip(chunks, seeds):
+            if deadline and results and time.monotonic() > deadline:
+                break
+            results.append(simulate_chunk(outcomes, bankroll, horizon, size, child))
+    else:
+        # The pool is shared by every request; only the chunks are ours.
+        pool = get_pool('simulation', workers)
+        futures = [
+            pool.submit(simulate_chunk, outcomes, bankroll, horizon, size, child)
+            for size, child in zip(chunks, seeds)
+        ]
+        pending = set(futures)
+        while pending:
+            timeout = max(0, deadline - time.monotonic()) if deadline else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+        for future in pending:
+            future.cancel()
+
+        results = []
+        for future in futures:
+            if not future.done() or future.cancelled():
+                break
+            results.append(future.result())
+
+    if not results:
+        raise TimeoutError('No simulation chunk finished within the time budget')
+
+    finals = np.concatenate([r[0] for r in results])
+    drawdowns = np.concatenate([r[1] for r in results])
+    ruined = np.concatenate([r[2] for r in results])
+
+    return {
+        'trajectories': int(finals.size),
+        'truncated': int(finals.size) < trajectories,
+        'seed': seed_sequence.entropy,
+        'risk_of_ruin': float(ruined.mean()),
+        'downswing_probability': float((drawdowns >= downswing).mean()) if downswing else None,
+        'final_bankroll_percentiles': dict(zip(PERCENTILES, np.percentile(finals, PERCENTILES).tolist())),
+        'max_drawdown_percentiles': dict(zip(PERCENTILES, np.percentile(drawdowns, PERCENTILES).tolist())),
+        'elapsed_ms': round((time.monotonic() - started) * 1000, 1),
+    }
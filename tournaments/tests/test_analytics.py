@@ -0,0 +1,136 @@
+import time
+from decimal import Decimal
+from datetime import date
+import numpy as np
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..analytics import (
+    calculate_advanced_stats,
+    calculate_player_advanced_stats,
+    load_result_arrays,
+    summarize_results,
+)
+from ..models import PlayerStatsRollup, TournamentInput
+from ..seeding import seed_player
+from ..services import rebuild_player_stats
+
+User = get_user_model()
+
+
+class AdvancedStatsTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='varianceplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        for buy_in, cashed_for, place in (
+            ('10.00', '0.00', 120),
+            ('10.00', '0.00', 80),
+            ('20.00', '90.00', 3),
+            ('10.00', '25.00', 15),
+        ):
+            TournamentInput.objects.create(
+                date=date(2024, 6, 1),
+                buy_in=Decimal(buy_in),
+                cashed_for=Decimal(cashed_for),
+                place_finished=place,
+                player=self.user
+            )
+        rebuild_player_stats(self.user)
+
+    def test_arrays_loaded_in_one_query(self):
+        with self.assertNumQueries(1):
+            buy_ins, cashes, places = load_result_arrays(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual(sorted(buy_ins.tolist()), [1000, 1000, 1000, 2000])
+        self.assertEqual(cashes.sum(), 11500)
+        self.assertEqual(places.dtype, np.int64)
+
+    def test_summary_values(self):
+        stats = calculate_advanced_stats(TournamentInput.objects.filter(player=self.user))
+
+        roi = np.array([-100.0, -100.0, 350.0, 150.0])
+        self.assertEqual(stats['tournaments'], 4)
+        self.assertEqual(stats['roi_mean'], 75.0)
+        self.assertAlmostEqual(stats['roi_std_dev'], roi.std(ddof=1), places=2)
+        self.assertAlmostEqual(stats['roi_std_error'], roi.std(ddof=1) / 2, places=2)
+        low, high = stats['roi_ci_95']
+        self.assertLess(low, 0)
+        self.assertGreater(high, 75)
+        self.assertEqual(stats['profit_mean'], 16.25)
+        self.assertGreater(stats['tournaments_for_significance'], 4)
+
+    def test_small_samples(self):
+        empty = summarize_results(*(np.array([], dtype=np.int64),) * 3)
+        self.assertEqual(empty['tournaments'], 0)
+        self.assertIsNone(empty['roi_mean'])
+
+        single = summarize_results(np.array([1000]), np.array([3000]), np.array([1]))
+        self.assertEqual(single['roi_mean'], 200.0)
+        self.assertIsNone(single['roi_std_dev'])
+
+    def test_rollups_match_the_rows(self):
+        tournaments = TournamentInput.objects.filter(player=self.user)
+        expected = summarize_results(*load_result_arrays(tournaments))
+        self.assertEqual(calculate_advanced_stats(tournaments), expected)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(calculate_player_advanced_stats(self.user), expected)
+
+        # Writes move the sums by deltas.
+        self.client.post(
+            '/api/tournaments/',
+            {'date': '2024-06-02', 'buy_in': '55.00', 'cashed_for': '400.00', 'place_finished': 2},
+            format='json',
+        )
+        tournament = tournaments.order_by('-id')[0]
+        self.client.delete(f'/api/tournaments/{tournaments.order_by("id")[0].pk}/')
+        self.client.patch(f'/api/tournaments/{tournament.pk}/', {'cashed_for': '150.00'}, format='json')
+
+        self.assertEqual(
+            calculate_player_advanced_stats(self.user),
+            summarize_results(*load_result_arrays(tournaments)),
+        )
+        self.assertEqual(calculate_player_advanced_stats(self.user, date(2024, 6, 2))['tournaments'], 1)
+
+    def test_outlier_round_trip_is_exact(self):
+        rollup = PlayerStatsRollup.objects.get(player=self.user).as_totals()
+
+        response = self.client.post(
+            '/api/tournaments/',
+            {'date': '2024-06-03', 'buy_in': '1.00', 'cashed_for': '250000.00', 'place_finished': 1},
+            format='json',
+        )
+        self.client.delete(f"/api/tournaments/{response.data['id']}/")
+
+        self.assertEqual(PlayerStatsRollup.objects.get(player=self.user).as_totals(), rollup)
+        self.assertEqual(
+            calculate_player_advanced_stats(self.user),
+            summarize_results(*load_result_arrays(TournamentInput.objects.filter(player=self.user))),
+        )
+
+    def test_advanced_stats_are_fast(self):
+        # The 50 ms target covers reading the results as well as the maths.
+        seed_player(self.user, np.random.default_rng(7), 100_000)
+
+        started = time.perf_counter()
+        stats = calculate_player_advanced_stats(self.user)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(stats['tournaments'], 100_004)
+        self.assertLess(elapsed, 0.05)
+
+    def test_api(self):
+        response = self.client.get('/api/tournaments/advanced-stats/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tournaments'], 4)
+        self.assertEqual(response.data['period_display'], 'All Time')
+
+        response = self.client.get('/api/tournaments/advanced-stats/', {'period': 'week'})
+        self.assertEqual(response.data['tournaments'], 0)
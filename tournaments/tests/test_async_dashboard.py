@@ -0,0 +1,101 @@
+import json
+import threading
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.tokens import AccessToken
+from ..cache import read_concurrently
+from ..models import BankrollAdjustment, TournamentInput
+
+User = get_user_model()
+
+
+class AsyncDashboardTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='asyncplayer',
+            password='testpass123',
+        )
+        for place, cashed_for in ((1, '80.00'), (40, '0.00'), (7, '15.00')):
+            TournamentInput.objects.create(
+                date=date.today(),
+                buy_in=Decimal('10.00'),
+                cashed_for=Decimal(cashed_for),
+                place_finished=place,
+                player=self.user
+            )
+        BankrollAdjustment.objects.create(
+            user=self.user,
+            amount=Decimal('50.00'),
+            transaction_type='deposit',
+        )
+
+    async def test_api_matches_sync_dashboard(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get('/api/users/dashboard/async/', {'period': 'month'})
+        self.assertEqual(response.status_code, 200)
+        payload = json.loads(response.content)
+
+        cache.clear()
+        expected = await self.async_client.get('/api/users/dashboard/', {'period': 'month'})
+
+        self.assertEqual(payload, json.loads(expected.content))
+        self.assertEqual(payload['stats']['total_tournaments'], 3)
+        self.assertEqual(payload['stats']['total_deposits'], 50.0)
+        self.assertEqual(len(payload['recent_tournaments']), 3)
+
+    async def test_api_jwt_and_anonymous(self):
+        response = await self.async_client.get('/api/users/dashboard/async/')
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(
+            '/api/users/dashboard/async/', headers={'Authorization': 'Bearer not-a-token'}
+        )
+        self.assertEqual(response.status_code, 401)
+
+        token = AccessToken.for_user(self.user)
+        response = await self.async_client.get(
+            '/api/users/dashboard/async/', headers={'Authorization': f'Bearer {token}'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        not_modified = await self.async_client.get(
+            '/api/users/dashboard/async/',
+            headers={'Authorization': f'Bearer {token}', 'If-None-Match': response['ETag']},
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    async def test_html_dashboard(self):
+        response = await self.async_client.get('/async/')
+        self.assertEqual(response.status_code, 302)
+
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get('/async/')
+
+        self.assertContains(response, 'Buy-in Tiers')
+        self.assertEqual(response.context['total_tournaments'], 3)
+        self.assertEqual(len(response.context['tournaments']), 3)
+
+    async def test_only_slow_reads_use_the_read_pool(self):
+        threads = {}
+
+        def reader(name):
+            def read():
+                threads[name] = threading.current_thread().name
+                return name
+            return read
+
+        results = await read_concurrently(
+            {name: reader(name) for name in ('stats', 'tiers', 'recent')}, ('tiers',)
+        )
+
+        self.assertEqual(results, {'stats': 'stats', 'tiers': 'tiers', 'recent': 'recent'})
+        self.assertEqual(list(results), ['stats', 'tiers', 'recent'])
+        self.assertTrue(threads['tiers'].startswith('dashboard-read'))
+        self.assertFalse(threads['stats'].startswith('dashboard-read'))
+        self.assertEqual(threads['stats'], threads['recent'])
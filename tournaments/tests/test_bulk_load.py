@@ -0,0 +1,159 @@
+import io
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import mock, skipUnless
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import get_user_model
+from .. import bulk_load
+from ..bulk_load import load_tournament_csv
+from ..models import BankrollLedgerEntry, TournamentInput
+from ..services import calculate_tournament_stats, get_player_totals
+
+User = get_user_model()
+
+
+def csv_bytes(*lines):
+    return io.BytesIO('\n'.join(lines).encode())
+
+
+RAGGED_ROWS = (
+    'date,buy_in,cashed_for,place_finished',
+    '2024-01-05,10.00,45.50,3',
+    '2024-01-06,10.00',
+    '2024-01-07,10.00,0,12,late reg,extra',
+)
+
+
+def assert_ragged_report(test, report):
+    test.assertEqual(report['received'], 3)
+    test.assertEqual(report['created'], 2)
+    test.assertEqual(report['errors'], [{'row': 2, 'errors': {'place_finished': ['This field is required.']}}])
+
+
+class BulkLoadTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='loader',
+            password='testpass123',
+        )
+
+    def test_valid_rows_are_merged(self):
+        report = load_tournament_csv(self.user, csv_bytes(
+            'date,buy_in,cashed_for,place_finished',
+            '2024-01-05,10.00,45.50,3',
+            '2024-01-06, 22 ,,150',
+            '2024-01-07,0.10,0,20000',
+        ))
+
+        self.assertEqual(report, {'received': 3, 'created': 3, 'failed': 0, 'errors': []})
+        rows = list(TournamentInput.objects.filter(player=self.user).order_by('id').values_list(
+            'date', 'buy_in', 'cashed_for', 'place_finished'
+        ))
+        self.assertEqual(rows, [
+            (date(2024, 1, 5), Decimal('10.00'), Decimal('45.50'), 3),
+            (date(2024, 1, 6), Decimal('22.00'), Decimal('0.00'), 150),
+            (date(2024, 1, 7), Decimal('0.10'), Decimal('0.00'), 20000),
+        ])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bankroll, Decimal('100.00') + Decimal('13.40'))
+        self.assertEqual(BankrollLedgerEntry.objects.get(user=self.user).entry_type, 'import')
+        self.assertEqual(get_player_totals(self.user)['total_tournaments'], 3)
+
+    def test_invalid_rows_mirror_model_validators(self):
+        report = load_tournament_csv(self.user, csv_bytes(
+            'place_finished,date,buy_in,cashed_for,notes',
+            '1,2024-02-30,10,0,bad day',
+            '1,0000-01-01,10,0,',
+            '1,2024-02-01,0.05,0,',
+            '1,2024-02-01,10000.01,0,',
+            '1,2024-02-01,abc,0,',
+            '1,2024-02-01,10,4000000.01,',
+            '0,2024-02-01,10,0,',
+            '20001,2024-02-01,10,0,',
+            ',2024-02-01,10,0,',
+            '5,2024-02-01,10000,4000000,ok',
+        ))
+
+        self.assertEqual(report['received'], 10)
+        self.assertEqual(report['created'], 1)
+        self.assertEqual(report['failed'], 9)
+        self.assertEqual(
+            [(e['row'], list(e['errors'])) for e in report['errors']],
+            [(1, ['date']), (2, ['date']), (3, ['buy_in']), (4, ['buy_in']), (5, ['buy_in']), (6, ['cashed_for']),
+             (7, ['place_finished']), (8, ['place_finished']), (9, ['place_finished'])],
+        )
+        self.assertEqual(report['errors'][2]['errors']['buy_in'], ['Ensure this value is between 0.10 and 10000.'])
+        self.assertEqual(calculate_tournament_stats(TournamentInput.objects.filter(player=self.user))['total_cash'],
+                         Decimal('4000000.00'))
+
+    def test_ragged_rows_are_reported_per_row(self):
+        assert_ragged_report(self, load_tournament_csv(self.user, csv_bytes(*RAGGED_ROWS)))
+
+    def test_missing_columns(self):
+        with self.assertRaisesMessage(ValueError, 'Missing CSV columns: place_finished'):
+            load_tournament_csv(self.user, csv_bytes('date,buy_in', '2024-01-01,10'))
+
+    def test_nothing_valid_leaves_bankroll(self):
+        report = load_tournament_csv(self.user, csv_bytes('date,buy_in,place_finished', 'x,y,z'))
+
+        self.assertEqual(report['created'], 0)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bankroll, Decimal('100.00'))
+
+    def test_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.csv')
+            with open(path, 'w') as history:
+                history.write('date,buy_in,cashed_for,place_finished\n')
+                for day in range(1, 29):
+                    history.write(f'2024-03-{day:02d},5.50,{"20.00" if day % 7 == 0 else "0"},{day * 10}\n')
+
+            call_command('load_tournaments', 'loader', path, stdout=io.StringIO(), stderr=io.StringIO())
+
+        self.assertEqual(TournamentInput.objects.filter(player=self.user).count(), 28)
+
+    def test_command_reports_unsupported_database(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.csv')
+            with open(path, 'w') as history:
+                history.write('date,buy_in,cashed_for,place_finished\n2024-03-01,5.50,0,10\n')
+
+            with mock.patch.dict(bulk_load._DIALECTS, clear=True), \
+                    self.assertRaisesMessage(CommandError, f'No bulk loader for {connection.vendor}'):
+                call_command('load_tournaments', 'loader', path, stdout=io.StringIO(), stderr=io.StringIO())
+
+
+class CopySourceTests(SimpleTestCase):
+
+    def test_rows_are_normalized_and_chunked(self):
+        records = bulk_load._records(io.StringIO('a,b\n1\n1,"2,5",3\n\n'), 2)
+        source = bulk_load._CopySource(records)
+
+        chunks = list(iter(lambda: source.read(4), ''))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), 'a,b\n1,\n1,"2,5"\n,\n')
+
+
+@skipUnless(connection.vendor == 'postgresql', 'COPY FROM STDIN is PostgreSQL only')
+class CopyStagingTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='copyloader',
+            password='testpass123',
+        )
+
+    def test_ragged_rows_go_through_copy(self):
+        with mock.patch.object(bulk_load, '_stage_postgresql', wraps=bulk_load._stage_postgresql) as stage:
+            report = load_tournament_csv(self.user, csv_bytes(*RAGGED_ROWS))
+
+        stage.assert_called_once()
+        assert_ragged_report(self, report)
+        self.assertEqual(TournamentInput.objects.filter(player=self.user).count(), 2)
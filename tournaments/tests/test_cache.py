@@ -0,0 +1,87 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..cache import dashboard_cache_stats
+
+User = get_user_model()
+
+
+class DashboardCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='cacheplayer',
+            password='testpass123',
+            bankroll=Decimal('500.00')
+        )
+        self.client.force_login(self.user)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def add_tournament(self, **fields):
+        data = {'date': '2024-03-01', 'buy_in': '20.00', 'cashed_for': '0.00', 'place_finished': 40}
+        data.update(fields)
+        response = self.api.post('/api/tournaments/', data, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def test_repeat_dashboard_is_served_from_cache(self):
+        self.add_tournament()
+        self.client.get('/')
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/')
+
+        self.assertEqual(response.context['total_tournaments'], 1)
+        self.assertEqual(dashboard_cache_stats()['hits'], 1)
+        # The first build also missed the finish histogram's own entry.
+        self.assertEqual(dashboard_cache_stats()['misses'], 2)
+
+    def test_tournament_writes_invalidate(self):
+        self.api.get('/api/users/dashboard/')
+
+        tournament_id = self.add_tournament(cashed_for='20.00')
+        response = self.api.get('/api/users/dashboard/')
+        self.assertEqual(response.data['stats']['total_tournaments'], 1)
+        self.assertEqual(response.data['stats']['top_10_finishes'], 0)
+
+        # Same net result, so the bankroll does not move; the cache must still miss.
+        self.api.patch(f'/api/tournaments/{tournament_id}/', {'place_finished': 3}, format='json')
+        response = self.api.get('/api/users/dashboard/')
+        self.assertEqual(response.data['stats']['top_10_finishes'], 1)
+
+        self.api.delete(f'/api/tournaments/{tournament_id}/')
+        response = self.api.get('/api/users/dashboard/')
+        self.assertEqual(response.data['stats']['total_tournaments'], 0)
+        self.assertEqual(dashboard_cache_stats()['hits'], 0)
+
+    def test_adjustment_writes_invalidate(self):
+        self.client.get('/')
+
+        self.api.post('/api/adjustments/', {'amount': '50.00', 'transaction_type': 'deposit'}, format='json')
+        response = self.client.get('/')
+        self.assertEqual(response.context['total_deposits'], Decimal('50.00'))
+        self.assertEqual(response.context['current_bankroll'], Decimal('550.00'))
+
+        adjustment_id = response.context['adjustments'][0].id
+        self.api.patch(f'/api/adjustments/{adjustment_id}/', {'amount': '80.00'}, format='json')
+        response = self.client.get('/')
+        self.assertEqual(response.context['total_deposits'], Decimal('80.00'))
+
+    def test_periods_are_cached_separately(self):
+        self.add_tournament()
+
+        self.assertEqual(self.client.get('/').context['total_tournaments'], 1)
+        self.assertEqual(self.client.get('/', {'period': 'week'}).context['total_tournaments'], 0)
+
+    def test_cache_stats_requires_staff(self):
+        self.assertEqual(self.api.get('/api/users/cache_stats/').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.api.get('/api/users/cache_stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {'hits', 'misses', 'hit_rate'})
@@ -0,0 +1,89 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+from decimal import Decimal
+from datetime import date
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from .. import charts
+from ..models import TournamentInput
+from ..plotting import render_line_chart
+
+User = get_user_model()
+
+
+class ChartTests(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        overrides = override_settings(CHART_CACHE_DIR=self.cache_dir)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.user = User.objects.create_user(
+            username='chartplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        for day, buy_in, cashed_for in ((1, '10.00', '0.00'), (1, '10.00', '45.00'), (3, '20.00', '0.00')):
+            TournamentInput.objects.create(
+                date=date(2024, 6, day),
+                buy_in=Decimal(buy_in),
+                cashed_for=Decimal(cashed_for),
+                place_finished=10,
+                player=self.user
+            )
+
+    def test_profit_series(self):
+        with self.assertNumQueries(1):
+            dates, values = charts.profit_series(self.user, 'day')
+
+        self.assertEqual(dates, [date(2024, 6, 1), date(2024, 6, 3)])
+        self.assertEqual(values, [25.0, 5.0])
+
+    def test_render_formats(self):
+        png = render_line_chart([date(2024, 6, 1), date(2024, 6, 2)], [1.0, 2.0], 'png', 'Test', 'Dollars')
+        svg = render_line_chart([], [], 'svg', 'Test', 'Dollars')
+
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        self.assertIn(b'<svg', svg)
+        self.assertEqual(svg, render_line_chart([], [], 'svg', 'Test', 'Dollars'))
+
+    def test_repeat_views_are_file_reads(self):
+        future = mock.Mock(result=mock.Mock(return_value=b'<svg/>'))
+        pool = mock.Mock(submit=mock.Mock(return_value=future))
+
+        with mock.patch.object(charts, 'get_pool', return_value=pool):
+            first = charts.get_chart(self.user, 'profit', 'svg')
+            second = charts.get_chart(self.user, 'profit', 'svg')
+            self.assertEqual(first, second)
+            self.assertEqual(pool.submit.call_count, 1)
+
+            self.user.bump_data_version()
+            self.assertNotEqual(charts.get_chart(self.user, 'profit', 'svg'), first)
+            self.assertEqual(pool.submit.call_count, 2)
+
+    def test_endpoint_renders_in_pool(self):
+        response = self.client.get('/api/users/charts/bankroll/', {'file_format': 'svg'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        self.assertIn(b'<svg', b''.join(response.streaming_content))
+
+        response = self.client.get('/api/users/charts/profit/', {'file_format': 'gif'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_matplotlib_not_imported_at_startup(self):
+        code = (
+            'import django; django.setup(); '
+            'import tournaments.api_views, tournaments.views, sys; '
+            "print('matplotlib' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
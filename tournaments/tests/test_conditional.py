@@ -0,0 +1,79 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='pollingplayer',
+            password='testpass123',
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+        self.client.force_login(self.user)
+
+    def add_tournament(self):
+        response = self.api.post(
+            '/api/tournaments/',
+            {'date': '2024-05-01', 'buy_in': '10.00', 'cashed_for': '0.00', 'place_finished': 9},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def test_api_endpoints_answer_304(self):
+        for url in ('/api/users/dashboard/', '/api/tournaments/stats/', '/api/tournaments/'):
+            response = self.api.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('private', response['Cache-Control'])
+
+            # Only the request itself; nothing is aggregated.
+            with self.assertNumQueries(0):
+                cached = self.api.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(cached.status_code, 304, url)
+
+            self.assertNotIn('Last-Modified', response)
+
+    def test_write_changes_etag(self):
+        etag = self.api.get('/api/tournaments/stats/')['ETag']
+
+        self.add_tournament()
+        self.user.refresh_from_db()
+        self.api.force_authenticate(user=self.user)
+
+        response = self.api.get('/api/tournaments/stats/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_tournaments'], 1)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_write_in_the_same_second_is_not_a_304(self):
+        self.api.get('/api/tournaments/stats/')
+        self.add_tournament()
+        self.user.refresh_from_db()
+        self.api.force_authenticate(user=self.user)
+
+        # If-Modified-Since alone is never enough for a 304.
+        response = self.api.get('/api/tournaments/stats/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_tournaments'], 1)
+
+    def test_query_string_is_part_of_etag(self):
+        etag = self.api.get('/api/users/dashboard/')['ETag']
+        response = self.api.get('/api/users/dashboard/', {'period': 'week'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_html_views_answer_304(self):
+        # The first page sets the CSRF cookie, which is part of the ETag.
+        self.client.get('/')
+
+        for url in ('/', '/tournaments/'):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.add_tournament()
+        self.assertEqual(self.client.get('/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
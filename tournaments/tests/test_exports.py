@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from decimal import Decimal
+from datetime import date, timedelta
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput, BankrollAdjustment
+
+User = get_user_model()
+
+
+class ExportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='exportplayer',
+            password='testpass123',
+        )
+        self.other = User.objects.create_user(
+            username='otherplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        today = date.today()
+        for player, day, cashed in (
+            (self.user, today - timedelta(days=100), '0.00'),
+            (self.user, today - timedelta(days=2), '75.50'),
+            (self.other, today, '10.00'),
+        ):
+            TournamentInput.objects.create(
+                date=day,
+                buy_in=Decimal('25.00'),
+                cashed_for=Decimal(cashed),
+                place_finished=12,
+                player=player
+            )
+
+        BankrollAdjustment.objects.create(
+            user=self.user,
+            amount=Decimal('300.00'),
+            transaction_type='deposit',
+            description='Bank, "wire"',
+        )
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_tournament_csv(self):
+        response = self.client.get('/api/tournaments/export/')
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('tournaments.csv', response['Content-Disposition'])
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['buy_in'], '25.00')
+        self.assertEqual(rows[0]['net_amount'], '-25.00')
+        self.assertEqual(rows[1]['net_amount'], '50.50')
+        self.assertLess(rows[0]['date'], rows[1]['date'])
+
+    def test_tournament_ndjson_with_period(self):
+        response = self.client.get('/api/tournaments/export/', {'file_format': 'ndjson', 'period': 'week'})
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]['cashed_for'], '75.50')
+        self.assertEqual(lines[0]['place_finished'], 12)
+
+    def test_adjustment_csv(self):
+        response = self.client.get('/api/adjustments/export/')
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['transaction_type'], 'deposit')
+        self.assertEqual(rows[0]['description'], 'Bank, "wire"')
+
+    def test_rejects_unknown_format(self):
+        response = self.client.get('/api/tournaments/export/', {'file_format': 'xlsx'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,92 @@
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..services import calculate_finish_histogram, get_finish_buckets
+
+User = get_user_model()
+
+
+class FinishHistogramTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='histplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        for place in (1, 2, 3, 4, 9, 10, 27, 28, 100, 101, 5000):
+            TournamentInput.objects.create(
+                date=date(2024, 6, 1),
+                buy_in=Decimal('10.00'),
+                cashed_for=Decimal('0.00'),
+                place_finished=place,
+                player=self.user
+            )
+
+    def test_default_buckets_in_one_query(self):
+        with self.assertNumQueries(1):
+            histogram = calculate_finish_histogram(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual(
+            [(b['bucket'], b['count']) for b in histogram],
+            [('1', 1), ('2', 1), ('3', 1), ('4-9', 2), ('10-27', 2), ('28-100', 2), ('101+', 2)],
+        )
+        self.assertEqual(histogram[3]['percentage'], 18.18)
+        self.assertIsNone(histogram[-1]['max_place'])
+
+    def test_custom_edges(self):
+        self.assertEqual(get_finish_buckets([10, 100]), (('1-9', 1, 9), ('10-99', 10, 99), ('100+', 100, None)))
+
+        for edges in ([10, 5], [0, 3], [3, 3]):
+            with self.assertRaises(ValueError):
+                get_finish_buckets(edges)
+
+    @override_settings(FINISH_HISTOGRAM_EDGES=(1, 11))
+    def test_edges_from_settings(self):
+        histogram = calculate_finish_histogram(TournamentInput.objects.filter(player=self.user))
+        self.assertEqual([b['count'] for b in histogram], [6, 5])
+
+    def test_empty(self):
+        histogram = calculate_finish_histogram(TournamentInput.objects.none())
+        self.assertTrue(all(b['count'] == 0 and b['percentage'] == 0 for b in histogram))
+
+    def test_endpoint_uses_cached_dashboard_data(self):
+        self.client.get('/api/users/dashboard/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/tournaments/finish-distribution/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['buckets']), 7)
+
+    def test_endpoint_builds_only_the_histogram(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tournaments/finish-distribution/', {'period': 'year'})
+        self.assertEqual(response.data['period_display'], 'Last Year')
+
+        # The dashboard reuses the entry instead of counting again.
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get('/api/users/dashboard/', {'period': 'year'})
+        self.assertFalse(any('"bucket_0"' in query['sql'] for query in captured.captured_queries))
+
+    def test_endpoint_custom_edges(self):
+        response = self.client.get('/api/tournaments/finish-distribution/', {'edges': '1,4'})
+        self.assertEqual([b['count'] for b in response.data['buckets']], [3, 8])
+
+        response = self.client.get('/api/tournaments/finish-distribution/', {'edges': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_renders_histogram(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/')
+        self.assertContains(response, 'Finish Distribution')
+        self.assertEqual(response.context['finish_histogram'][0]['count'], 1)
@@ -0,0 +1,158 @@
+import json
+from decimal import Decimal
+from datetime import date, datetime, timezone
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput, BankrollAdjustment
+from ..history import iter_bankroll_history
+
+User = get_user_model()
+
+
+class BankrollHistoryTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='historyplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add_tournament(self, day, buy_in, cashed_for):
+        TournamentInput.objects.create(
+            date=day,
+            buy_in=Decimal(buy_in),
+            cashed_for=Decimal(cashed_for),
+            place_finished=50,
+            player=self.user
+        )
+
+    def add_adjustment(self, when, transaction_type, amount):
+        adjustment = BankrollAdjustment.objects.create(
+            user=self.user,
+            amount=Decimal(amount),
+            transaction_type=transaction_type,
+        )
+        BankrollAdjustment.objects.filter(pk=adjustment.pk).update(date=when)
+
+    def post_tournament(self, day, buy_in, cashed_for):
+        self.client.post('/api/tournaments/', {
+            'date': day.isoformat(),
+            'buy_in': buy_in,
+            'cashed_for': cashed_for,
+            'place_finished': 50,
+        }, format='json')
+
+    def post_adjustment(self, transaction_type, amount):
+        self.client.post('/api/adjustments/', {
+            'amount': amount,
+            'transaction_type': transaction_type,
+        }, format='json')
+
+    def history(self, start, end, granularity='day'):
+        return list(iter_bankroll_history(self.user, start, end, granularity))
+
+    def test_running_balance_is_anchored_to_current_bankroll(self):
+        self.add_tournament(date(2024, 3, 1), '100.00', '0.00')
+        self.add_tournament(date(2024, 3, 2), '50.00', '250.00')
+        self.add_adjustment(datetime(2024, 3, 2, 18, 0, tzinfo=timezone.utc), 'withdrawal', '100.00')
+
+        points = self.history(date(2024, 3, 1), date(2024, 3, 31))
+
+        self.assertEqual([p['date'] for p in points], ['2024-03-01', '2024-03-02'])
+        self.assertEqual(points[0]['balance'], 1000.0 - 100.0)
+        self.assertEqual(points[0]['change'], -100.0)
+        self.assertEqual(points[1]['balance'], 1000.0)
+        self.assertEqual(points[1]['change'], 100.0)
+        self.assertEqual(points[1]['events'], 2)
+
+    def test_correction_resets_balance(self):
+        self.add_tournament(date(2024, 3, 1), '100.00', '0.00')
+        self.add_adjustment(datetime(2024, 3, 3, 9, 0, tzinfo=timezone.utc), 'correction', '500.00')
+        self.add_tournament(date(2024, 3, 4), '20.00', '70.00')
+        self.add_adjustment(datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc), 'deposit', '30.00')
+
+        points = self.history(date(2024, 3, 1), date(2024, 3, 31))
+
+        self.assertEqual(points[0]['balance'], 0.0)
+        self.assertEqual(points[1], {'date': '2024-03-03', 'balance': 500.0, 'change': 500.0, 'events': 1})
+        self.assertEqual(points[2]['balance'], 550.0)
+        self.assertEqual(points[3]['balance'], 580.0)
+
+    def test_history_before_correction_uses_ledger_balance(self):
+        today = datetime.now(timezone.utc).date()
+        self.post_tournament(date(2024, 3, 1), '100.00', '0.00')
+        self.post_adjustment('correction', '500.00')
+
+        points = self.history(date(2024, 3, 1), today)
+
+        self.assertEqual(points[0]['balance'], 900.0)
+        self.assertEqual(points[0]['change'], -100.0)
+        self.assertEqual(points[-1]['balance'], 500.0)
+
+    def test_same_day_events_follow_recording_order(self):
+        today = datetime.now(timezone.utc).date()
+        self.post_tournament(today, '100.00', '0.00')
+        self.post_adjustment('correction', '500.00')
+        self.post_tournament(today, '20.00', '70.00')
+        self.user.refresh_from_db()
+
+        points = self.history(today, today)
+
+        self.assertEqual(self.user.bankroll, Decimal('550.00'))
+        self.assertEqual(points, [{'date': today.isoformat(), 'balance': 550.0, 'change': -450.0, 'events': 3}])
+
+    def test_range_uses_full_history_for_opening_balance(self):
+        self.add_tournament(date(2024, 1, 10), '100.00', '400.00')
+        self.add_tournament(date(2024, 3, 1), '100.00', '0.00')
+
+        points = self.history(date(2024, 2, 1), date(2024, 3, 31))
+
+        self.assertEqual(len(points), 1)
+        self.assertEqual(points[0]['balance'], 1000.0)
+        self.assertEqual(points[0]['change'], -100.0)
+
+    def test_weekly_and_monthly_buckets(self):
+        self.add_tournament(date(2024, 3, 4), '10.00', '0.00')
+        self.add_tournament(date(2024, 3, 10), '10.00', '0.00')
+        self.add_tournament(date(2024, 3, 11), '10.00', '0.00')
+        self.add_tournament(date(2024, 4, 2), '10.00', '0.00')
+
+        weeks = self.history(date(2024, 3, 1), date(2024, 4, 30), 'week')
+        self.assertEqual([p['date'] for p in weeks], ['2024-03-04', '2024-03-11', '2024-04-01'])
+        self.assertEqual(weeks[0]['events'], 2)
+        self.assertEqual(weeks[0]['change'], -20.0)
+
+        months = self.history(date(2024, 3, 1), date(2024, 4, 30), 'month')
+        self.assertEqual([p['date'] for p in months], ['2024-03-01', '2024-04-01'])
+        self.assertEqual(months[-1]['balance'], 1000.0)
+
+    def test_endpoint_streams_json(self):
+        self.add_tournament(date(2024, 3, 1), '100.00', '300.00')
+
+        response = self.client.get('/api/users/bankroll_history/', {
+            'start': '2024-02-01',
+            'end': '2024-03-31',
+            'granularity': 'week',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['granularity'], 'week')
+        self.assertEqual(data['current_bankroll'], 1000.0)
+        self.assertEqual(data['points'], [
+            {'date': '2024-02-26', 'balance': 1000.0, 'change': 200.0, 'events': 1},
+        ])
+
+    def test_endpoint_rejects_bad_granularity(self):
+        response = self.client.get('/api/users/bankroll_history/', {'granularity': 'hour'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_endpoint_rejects_out_of_range_days(self):
+        for days in ('0', '99999999'):
+            response = self.client.get('/api/users/bankroll_history/', {'days': days})
+            self.assertEqual(response.status_code, 400)
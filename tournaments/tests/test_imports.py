@@ -0,0 +1,117 @@
+from decimal import Decimal
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput, BankrollLedgerEntry, PlayerStatsRollup
+from ..services import aggregate_tournament_totals
+
+User = get_user_model()
+
+
+class BulkImportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='importplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_json_import_reports_row_errors(self):
+        rows = [
+            {'date': '2024-01-01', 'buy_in': '10.00', 'cashed_for': '45.00', 'place_finished': 3},
+            {'date': '2024-01-01', 'buy_in': '0.01', 'cashed_for': '0.00', 'place_finished': 3},
+            {'date': '2024-01-02', 'buy_in': '20.00', 'place_finished': 150},
+            {'date': '2024-01-02', 'buy_in': '20.00', 'cashed_for': '0.00'},
+        ]
+
+        response = self.client.post('/api/tournaments/bulk/?chunk_size=2', rows, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['failed'], 2)
+        self.assertEqual([e['row'] for e in response.data['errors']], [2, 4])
+        self.assertIn('buy_in', response.data['errors'][0]['errors'])
+        self.assertIn('place_finished', response.data['errors'][1]['errors'])
+        self.assertEqual(TournamentInput.objects.filter(player=self.user).count(), 2)
+
+    def test_import_applies_single_bankroll_delta(self):
+        rows = [
+            {'date': '2024-01-01', 'buy_in': '10.00', 'cashed_for': '0.00', 'place_finished': 50}
+            for _ in range(30)
+        ]
+
+        self.client.post('/api/tournaments/bulk/', rows, format='json')
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bankroll, Decimal('700.00'))
+        entry = BankrollLedgerEntry.objects.get(user=self.user)
+        self.assertEqual(entry.entry_type, 'import')
+        self.assertEqual(entry.amount, Decimal('-300.00'))
+
+        rollup = PlayerStatsRollup.objects.get(player=self.user)
+        raw = aggregate_tournament_totals(TournamentInput.objects.filter(player=self.user))
+        self.assertEqual(rollup.as_totals(), raw)
+
+    def test_csv_upload(self):
+        upload = SimpleUploadedFile(
+            'results.csv',
+            b'date,buy_in,cashed_for,place_finished\n'
+            b'2024-02-01,5.50,,200\n'
+            b'2024-02-02,5.50,30.00,4\n'
+            b'2024-02-03,abc,0,10\n',
+            content_type='text/csv',
+        )
+
+        response = self.client.post('/api/tournaments/bulk/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'][0]['row'], 3)
+        self.assertEqual(
+            TournamentInput.objects.get(player=self.user, place_finished=200).cashed_for,
+            Decimal('0.00')
+        )
+
+    def test_csv_upload_that_is_not_utf8(self):
+        upload = SimpleUploadedFile(
+            'results.csv',
+            b'date,buy_in,cashed_for,place_finished\n'
+            b'2024-02-01,5.50,,200\n'
+            b'2024-02-02,5.50,30.00,4 \xff\n',
+            content_type='text/csv',
+        )
+
+        response = self.client.post('/api/tournaments/bulk/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'][0]['row'], 2)
+        self.assertIn('UTF-8', str(response.data['errors'][0]['errors']['non_field_errors'][0]))
+        self.assertFalse(TournamentInput.objects.filter(player=self.user).exists())
+
+    def test_csv_upload_that_is_not_csv(self):
+        upload = SimpleUploadedFile(
+            'results.csv',
+            b'date,buy_in,cashed_for,place_finished\n'
+            b'2024-02-01,5.50,' + b'9' * 200_000 + b',200\n',
+            content_type='text/csv',
+        )
+
+        response = self.client.post('/api/tournaments/bulk/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'][0]['row'], 1)
+        self.assertFalse(TournamentInput.objects.filter(player=self.user).exists())
+
+    def test_all_rows_invalid(self):
+        response = self.client.post('/api/tournaments/bulk/', [{'date': 'soon'}], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['created'], 0)
+
+    def test_rejects_non_list_payload(self):
+        response = self.client.post('/api/tournaments/bulk/', {'date': '2024-01-01'}, format='json')
+        self.assertEqual(response.status_code, 400)
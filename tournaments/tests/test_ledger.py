@@ -0,0 +1,178 @@
+from decimal import Decimal
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..api_views import TournamentViewSet
+from ..models import TournamentInput, BankrollAdjustment, BankrollLedgerEntry
+from ..querycount import unbudgeted_queries
+from ..services import record_tournament_change, tournament_snapshot
+
+User = get_user_model()
+
+
+class BankrollLedgerTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='ledgerplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+        self.client.force_login(self.user)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def assertBankroll(self, expected):
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.bankroll, Decimal(expected))
+
+    def test_tournament_lifecycle_writes_ledger(self):
+        self.client.post('/add_tournament/', {
+            'date': '2024-01-20',
+            'buy_in': '100.00',
+            'cashed_for': '350.00',
+            'place_finished': 2,
+        })
+        tournament = TournamentInput.objects.get(player=self.user)
+        self.assertBankroll('1250.00')
+
+        self.client.post(f'/tournaments/{tournament.id}/edit/', {
+            'date': '2024-01-20',
+            'buy_in': '100.00',
+            'cashed_for': '0.00',
+            'place_finished': 40,
+        })
+        self.assertBankroll('900.00')
+
+        self.client.post(f'/tournaments/{tournament.id}/delete/')
+        self.assertBankroll('1000.00')
+
+        entries = list(BankrollLedgerEntry.objects.filter(user=self.user).order_by('id'))
+        self.assertEqual(
+            [(e.entry_type, e.amount, e.balance_after) for e in entries],
+            [
+                ('tournament', Decimal('250.00'), Decimal('1250.00')),
+                ('tournament_edit', Decimal('-350.00'), Decimal('900.00')),
+                ('tournament_delete', Decimal('100.00'), Decimal('1000.00')),
+            ]
+        )
+        self.assertIsNone(entries[0].tournament)
+
+    def test_api_tournament_moves_bankroll(self):
+        self.api.post('/api/tournaments/', {
+            'date': '2024-01-20',
+            'buy_in': '55.00',
+            'cashed_for': '0.00',
+            'place_finished': 300,
+        }, format='json')
+
+        self.assertBankroll('945.00')
+        entry = BankrollLedgerEntry.objects.get(user=self.user)
+        self.assertEqual(entry.tournament, TournamentInput.objects.get(player=self.user))
+
+    def test_adjustments_write_ledger(self):
+        self.api.post('/api/adjustments/', {'amount': '200.00', 'transaction_type': 'deposit'}, format='json')
+        self.api.post('/api/adjustments/', {'amount': '50.00', 'transaction_type': 'withdrawal'}, format='json')
+        self.api.post('/api/adjustments/', {'amount': '400.00', 'transaction_type': 'correction'}, format='json')
+
+        self.assertBankroll('400.00')
+        entries = BankrollLedgerEntry.objects.filter(user=self.user).order_by('id')
+        self.assertEqual(
+            [(e.entry_type, e.amount, e.balance_after) for e in entries],
+            [
+                ('deposit', Decimal('200.00'), Decimal('1200.00')),
+                ('withdrawal', Decimal('-50.00'), Decimal('1150.00')),
+                ('correction', Decimal('-750.00'), Decimal('400.00')),
+            ]
+        )
+        self.assertEqual(entries[0].adjustment.transaction_type, 'deposit')
+
+    def test_update_writes_only_bankroll_column(self):
+        adjustment = BankrollAdjustment.objects.create(
+            user=self.user,
+            amount=Decimal('10.00'),
+            transaction_type='deposit',
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            adjustment.apply_to_user()
+
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"bankroll"', updates[0])
+        self.assertNotIn('"username"', updates[0])
+        self.assertNotIn('"password"', updates[0])
+
+    def test_edit_applies_delta_to_stored_row(self):
+        self.api.post('/api/tournaments/', {
+            'date': '2024-01-20',
+            'buy_in': '10.00',
+            'cashed_for': '0.00',
+            'place_finished': 30,
+        }, format='json')
+        tournament = TournamentInput.objects.get(player=self.user)
+        get_object = TournamentViewSet.get_object
+
+        def get_object_then_concurrent_edit(view):
+            # Another request cashes the tournament after this one read it.
+            instance = get_object(view)
+            with unbudgeted_queries():
+                TournamentInput.objects.filter(pk=tournament.pk).update(cashed_for=Decimal('50.00'))
+                record_tournament_change(
+                    self.user,
+                    old=tournament_snapshot(tournament),
+                    new=tournament_snapshot(TournamentInput.objects.get(pk=tournament.pk)),
+                    tournament=tournament,
+                )
+            return instance
+
+        with mock.patch.object(TournamentViewSet, 'get_object', get_object_then_concurrent_edit):
+            response = self.api.patch(f'/api/tournaments/{tournament.pk}/', {'buy_in': '20.00'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        tournament.refresh_from_db()
+        self.assertEqual((tournament.buy_in, tournament.cashed_for), (Decimal('20.00'), Decimal('50.00')))
+        self.assertBankroll('1030.00')
+
+
+class ConcurrentBankrollTests(TransactionTestCase):
+    WRITERS = 8
+    WRITES = 200
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='concurrentplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+
+    def write(self, i):
+        try:
+            user = User.objects.get(pk=self.user.pk)
+            amount = Decimal('1.00') if i % 2 else Decimal('-0.50')
+            user.apply_bankroll_delta(amount, 'deposit' if i % 2 else 'withdrawal')
+        finally:
+            connections.close_all()
+
+    def test_parallel_writes_do_not_lose_updates(self):
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest('In-memory SQLite does not allow concurrent writers')
+
+        with ThreadPoolExecutor(max_workers=self.WRITERS) as pool:
+            list(pool.map(self.write, range(self.WRITES)))
+
+        self.user.refresh_from_db()
+        expected = Decimal('1000.00') + Decimal('1.00') * 100 - Decimal('0.50') * 100
+        self.assertEqual(self.user.bankroll, expected)
+
+        balances = list(
+            BankrollLedgerEntry.objects.filter(user=self.user).values_list('balance_after', flat=True)
+        )
+        self.assertEqual(len(balances), self.WRITES)
+        self.assertEqual(sum(
+            BankrollLedgerEntry.objects.filter(user=self.user).values_list('amount', flat=True)
+        ), expected - Decimal('1000.00'))
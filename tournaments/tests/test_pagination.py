@@ -0,0 +1,117 @@
+from decimal import Decimal
+from datetime import date, timedelta
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..pagination import keyset_page
+
+User = get_user_model()
+
+
+class KeysetPaginationTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='pageplayer',
+            password='testpass123',
+        )
+        first_day = date(2024, 1, 1)
+        TournamentInput.objects.bulk_create([
+            TournamentInput(
+                date=first_day + timedelta(days=i // 3),
+                buy_in=Decimal('10.00'),
+                cashed_for=Decimal('0.00'),
+                place_finished=100 + i,
+                player=self.user,
+            )
+            for i in range(23)
+        ])
+        self.expected = list(
+            TournamentInput.objects.filter(player=self.user).order_by('-date', '-id').values_list('id', flat=True)
+        )
+        self.client.force_login(self.user)
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def test_walk_forward_and_back(self):
+        queryset = TournamentInput.objects.filter(player=self.user)
+        pages = []
+        cursor = None
+
+        while True:
+            items, cursor, _ = keyset_page(queryset, cursor, page_size=5)
+            pages.append([t.id for t in items])
+            if cursor is None:
+                break
+
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+        self.assertEqual(len(pages), 5)
+
+        _, next_cursor, _ = keyset_page(queryset, None, page_size=5)
+        items, _, previous_cursor = keyset_page(queryset, next_cursor, page_size=5)
+        self.assertEqual([t.id for t in items], pages[1])
+
+        items, next_cursor, previous_cursor = keyset_page(queryset, previous_cursor, page_size=5)
+        self.assertEqual([t.id for t in items], pages[0])
+        self.assertIsNone(previous_cursor)
+        self.assertIsNotNone(next_cursor)
+
+    def test_api_pages_without_count_or_offset(self):
+        url = '/api/tournaments/?page_size=5'
+        seen = []
+
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.api.get(url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            self.assertEqual(len(queries), 1)
+            self.assertNotIn('COUNT(', queries[0]['sql'])
+            self.assertNotIn('OFFSET', queries[0]['sql'])
+
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(seen, self.expected)
+
+    def test_api_invalid_cursor(self):
+        response = self.api.get('/api/tournaments/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    @patch('tournaments.views.TOURNAMENT_LIST_PAGE_SIZE', 10)
+    def test_html_list_is_paginated(self):
+        seen = []
+        params = {}
+
+        while True:
+            response = self.client.get('/tournaments/', params)
+            seen.extend(t.id for t in response.context['tournaments'])
+            if not response.context['next_cursor']:
+                break
+            params = {'cursor': response.context['next_cursor']}
+
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(len(response.context['tournaments']), 3)
+        self.assertIsNotNone(response.context['previous_cursor'])
+
+        response = self.client.get('/tournaments/', {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_html_list_totals_in_one_aggregate(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/tournaments/')
+
+        tournament_queries = [q['sql'] for q in queries if 'tournaments_tournamentinput' in q['sql']]
+        self.assertEqual(len(tournament_queries), 2)
+        self.assertIn('COUNT(', tournament_queries[0])
+        self.assertIn('LIMIT', tournament_queries[1])
+
+        self.assertEqual(response.context['total_count'], 23)
+        self.assertEqual(response.context['total_profit'], Decimal('-230.00'))
+        self.assertEqual(response.context['tournaments'][0].net_amount, Decimal('-10.00'))
+        self.assertContains(response, '-$10.00')
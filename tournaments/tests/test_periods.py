@@ -0,0 +1,117 @@
+import json
+from decimal import Decimal
+from datetime import date, timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import BankrollAdjustment, TournamentInput
+from ..services import (
+    calculate_period_adjustment_totals,
+    calculate_player_period_stats,
+    calculate_player_stats,
+    get_period_windows,
+)
+
+User = get_user_model()
+
+
+class PeriodStatsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='periodplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.today = date.today()
+
+        for days_ago, buy_in, cashed_for, place in (
+            (1, '10.00', '25.00', 3),
+            (20, '20.00', '0.00', 80),
+            (200, '50.00', '0.00', 12),
+            (800, '5.00', '100.00', 1),
+        ):
+            TournamentInput.objects.create(
+                date=self.today - timedelta(days=days_ago),
+                buy_in=Decimal(buy_in),
+                cashed_for=Decimal(cashed_for),
+                place_finished=place,
+                player=self.user
+            )
+
+    def test_standard_periods_in_one_query(self):
+        windows = get_period_windows()
+        calculate_player_period_stats(self.user, windows)
+
+        with self.assertNumQueries(1):
+            periods = calculate_player_period_stats(self.user, windows)
+
+        self.assertEqual(list(periods), ['week', 'month', 'year', 'all'])
+        self.assertEqual([periods[name]['total_tournaments'] for name in periods], [1, 2, 3, 4])
+        self.assertEqual(periods['week']['total_profit'], Decimal('15.00'))
+        self.assertEqual(periods['all']['first_places'], 1)
+
+        for name, _, start_date, _ in windows:
+            self.assertEqual(periods[name], calculate_player_stats(self.user, start_date))
+
+    def test_extra_periods(self):
+        start = (self.today - timedelta(days=30)).isoformat()
+        end = (self.today - timedelta(days=2)).isoformat()
+        windows = get_period_windows(['90', '7'], [f'{start}:{end}', f':{start}'])
+
+        self.assertEqual(
+            [name for name, _, _, _ in windows],
+            ['week', 'month', 'year', 'all', 'last_90_days', 'last_7_days', f'{start}:{end}', f':{start}'],
+        )
+
+        periods = calculate_player_period_stats(self.user, windows)
+        self.assertEqual(periods['last_90_days']['total_tournaments'], 2)
+        self.assertEqual(periods[f'{start}:{end}']['total_buy_ins'], Decimal('20.00'))
+        self.assertEqual(periods[f':{start}']['total_tournaments'], 2)
+
+        for days, ranges in ((['0'], None), (['x'], None), (['99999999'], None), (None, ['2024-02-30:']), (None, ['2024-03-01:2024-02-01'])):
+            with self.assertRaises(ValueError):
+                get_period_windows(days, ranges)
+
+    def test_adjustment_totals_per_period(self):
+        BankrollAdjustment.objects.create(user=self.user, amount=Decimal('100.00'), transaction_type='deposit')
+        BankrollAdjustment.objects.create(user=self.user, amount=Decimal('40.00'), transaction_type='withdrawal')
+
+        with self.assertNumQueries(1):
+            totals = calculate_period_adjustment_totals(
+                BankrollAdjustment.objects.filter(user=self.user),
+                get_period_windows(None, [f':{self.today - timedelta(days=1)}']),
+            )
+
+        self.assertEqual(totals['week'], {'total_deposits': Decimal('100.00'), 'total_withdrawals': Decimal('40.00')})
+        self.assertEqual(totals[f':{self.today - timedelta(days=1)}']['total_deposits'], Decimal('0'))
+
+    def test_period_stats_endpoint(self):
+        response = self.client.get('/api/tournaments/period-stats/', {'days': '90'})
+
+        self.assertEqual(response.status_code, 200)
+        periods = response.data['periods']
+        self.assertEqual(list(periods), ['week', 'month', 'year', 'all', 'last_90_days'])
+        self.assertEqual(periods['all']['total_tournaments'], 4.0)
+        self.assertEqual(periods['last_90_days']['period_display'], 'Last 90 days')
+        self.assertEqual(periods['year']['start_date'], self.today - timedelta(days=365))
+
+        response = self.client.get('/api/tournaments/period-stats/', {'ranges': 'yesterday:'})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get('/api/tournaments/period-stats/', {'days': '99999999'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_embeds_every_period(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/', {'period': 'week'})
+
+        self.assertEqual(response.context['total_tournaments'], 1)
+        payload = response.content.decode().split('<script id="period-stats" type="application/json">')[1]
+        periods = json.loads(payload.split('</script>')[0])
+        self.assertEqual(periods['all']['total_tournaments'], '4')
+        self.assertEqual(periods['month']['total_profit'], '-5.00')
+        self.assertEqual(periods['year']['period_display'], 'Last Year')
@@ -0,0 +1,128 @@
+from decimal import Decimal
+from datetime import date
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..api_urls import router
+from ..middleware import QueryBudgetExceeded
+from ..models import BankrollAdjustment, TournamentInput
+from ..services import rebuild_player_stats
+
+User = get_user_model()
+
+
+class QueryInstrumentationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='budgetplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.tournament = TournamentInput.objects.create(
+            date=date(2024, 6, 1),
+            buy_in=Decimal('10.00'),
+            cashed_for=Decimal('0.00'),
+            place_finished=30,
+            player=self.user
+        )
+
+    def test_server_timing_header(self):
+        response = self.client.get('/api/tournaments/buy-in-tiers/')
+
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="1 queries", total;dur=[\d.]+$')
+        self.assertEqual(response.query_stats.count, 1)
+        self.assertIn('tournaments_tournamentinput', response.query_stats.slowest_sql)
+
+    def test_budget_enforced_in_tests(self):
+        self.assertTrue(settings.QUERY_BUDGETS_ENFORCE)
+
+        with override_settings(QUERY_BUDGETS={('tournament-buy-in-tiers', 'GET'): 0}):
+            with self.assertRaisesMessage(QueryBudgetExceeded, 'GET tournament-buy-in-tiers ran 1 queries, budget is 0'):
+                self.client.get('/api/tournaments/buy-in-tiers/')
+
+    @override_settings(QUERY_BUDGETS={('tournament-list', 'POST'): 0})
+    def test_budget_is_per_method(self):
+        self.assertEqual(self.client.get('/api/tournaments/').status_code, 200)
+
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.post('/api/tournaments/', {
+                'date': '2024-06-02', 'buy_in': '5.00', 'cashed_for': '0.00', 'place_finished': 3,
+            }, format='json')
+
+    @override_settings(QUERY_BUDGETS={('tournament-export', 'GET'): 0})
+    def test_streamed_body_is_counted(self):
+        response = self.client.get('/api/tournaments/export/')
+        self.assertEqual(response.query_stats.count, 0)
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, 'GET tournament-export ran 1 queries, budget is 0'):
+            b''.join(response.streaming_content)
+        self.assertEqual(response.query_stats.count, 1)
+
+    @override_settings(QUERY_BUDGETS={('tournament-stats', 'GET'): 1})
+    def test_rollup_rebuild_is_not_budgeted(self):
+        # The tournament above was saved without bookkeeping, so the first
+        # read rebuilds the rollups.
+        response = self.client.get('/api/tournaments/stats/')
+
+        self.assertEqual(response.query_stats.budgeted, 1)
+        self.assertGreater(response.query_stats.count, 1)
+        self.assertEqual(response.data['total_tournaments'], 1)
+
+    @override_settings(QUERY_BUDGETS={('tournament-buy-in-tiers', 'GET'): 0}, QUERY_BUDGETS_ENFORCE=False)
+    def test_budget_logged_when_not_enforced(self):
+        with self.assertLogs('tournaments.middleware', 'WARNING'):
+            response = self.client.get('/api/tournaments/buy-in-tiers/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_every_api_route_has_a_budget(self):
+        routes = {
+            (url.name, method.upper())
+            for url in router.urls if url.name and not url.name.endswith('-root')
+            for method in url.callback.actions if method != 'head'
+        } | {('api-root', 'GET'), ('user-dashboard-async', 'GET')}
+        self.assertEqual(routes - set(settings.QUERY_BUDGETS), set())
+
+    def test_adjustment_summary_within_budget(self):
+        response = self.client.get('/api/adjustments/summary/')
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(response.query_stats.count, settings.QUERY_BUDGETS[('adjustment-summary', 'GET')] - 2)
+
+    def test_date_moving_edits_within_budget(self):
+        TournamentInput.objects.create(
+            date=date(2024, 6, 2), buy_in=Decimal('5.00'), cashed_for=Decimal('0.00'), place_finished=9,
+            player=self.user,
+        )
+        rebuild_player_stats(self.user)
+        url = f'/api/tournaments/{self.tournament.pk}/'
+        row = {'cashed_for': '0.00', 'place_finished': 30}
+
+        # To a day that has a bucket, then to new days (a bucket is created).
+        for method, data in (
+            ('put', {**row, 'date': '2024-06-02', 'buy_in': '11.00'}),
+            ('put', {**row, 'date': '2024-07-01', 'buy_in': '12.00'}),
+            ('patch', {'date': '2024-06-02', 'buy_in': '13.00'}),
+            ('patch', {'date': '2024-08-01', 'buy_in': '14.00'}),
+        ):
+            response = getattr(self.client, method)(url, data, format='json')
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(
+                response.query_stats.count,
+                settings.QUERY_BUDGETS[('tournament-detail', method.upper())] - 2,
+            )
+
+    def test_owner_check_does_not_load_user(self):
+        adjustment = BankrollAdjustment.objects.create(
+            user=self.user,
+            amount=Decimal('25.00'),
+            transaction_type='deposit',
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/adjustments/{adjustment.pk}/')
+        self.assertEqual(response.status_code, 200)
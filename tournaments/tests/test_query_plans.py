@@ -0,0 +1,149 @@
+from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput, BankrollAdjustment, PlayerDailyStats
+from ..pagination import keyset_page
+from ..services import (
+    calculate_period_adjustment_totals, calculate_player_period_stats, get_period_windows, rebuild_player_stats,
+)
+
+User = get_user_model()
+
+PLAYERS = 20
+TOURNAMENTS_PER_PLAYER = 300
+
+
+class QueryPlanTests(TestCase):
+    """
+    EXPLAIN the hot per-player queries against a seeded table and fail if
+    any of them falls back to a sequential scan.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        players = [
+            User.objects.create_user(username=f'planplayer{i}', password='testpass123')
+            for i in range(PLAYERS)
+        ]
+
+        first_day = date(2023, 1, 1)
+        TournamentInput.objects.bulk_create([
+            TournamentInput(
+                date=first_day + timedelta(days=i % 365),
+                buy_in=Decimal('11.00'),
+                cashed_for=Decimal('40.00') if i % 7 == 0 else Decimal('0.00'),
+                place_finished=1 + (i * 37) % 900,
+                player=player,
+            )
+            for player in players
+            for i in range(TOURNAMENTS_PER_PLAYER)
+        ], batch_size=1000)
+
+        BankrollAdjustment.objects.bulk_create([
+            BankrollAdjustment(user=player, amount=Decimal('25.00'), transaction_type='deposit')
+            for player in players
+            for _ in range(30)
+        ])
+
+        for player in players:
+            rebuild_player_stats(player)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        cls.player = players[PLAYERS // 2]
+        cls.since = first_day + timedelta(days=300)
+
+    def assertPlanUsesIndexes(self, plan, ordered):
+        if connection.vendor == 'sqlite':
+            for line in plan.splitlines():
+                self.assertFalse(
+                    ' SCAN ' in f' {line} ' and 'USING' not in line,
+                    f'Sequential scan in plan:\n{plan}'
+                )
+            if ordered:
+                self.assertNotIn('USE TEMP B-TREE FOR ORDER BY', plan, f'Unindexed sort in plan:\n{plan}')
+        else:
+            self.assertNotIn('Seq Scan', plan, f'Sequential scan in plan:\n{plan}')
+
+    def assertNoSequentialScan(self, queryset):
+        self.assertPlanUsesIndexes(queryset.explain(), queryset.ordered)
+
+    def assertQueriesUseIndexes(self, run, *models):
+        """
+        EXPLAIN each query ``run()`` sends to the tables of ``models``, as
+        the code under test built it.
+        """
+        tables = [f'"{model._meta.db_table}"' for model in models]
+        with CaptureQueriesContext(connection) as captured:
+            run()
+
+        queries = [
+            query['sql'] for query in captured
+            if query['sql'].startswith('SELECT') and any(table in query['sql'] for table in tables)
+        ]
+        self.assertTrue(queries, 'No queries to explain')
+
+        prefix = 'EXPLAIN QUERY PLAN' if connection.vendor == 'sqlite' else 'EXPLAIN'
+        for sql in queries:
+            with connection.cursor() as cursor:
+                cursor.execute(f'{prefix} {sql}')
+                plan = '\n'.join(str(row[-1]) for row in cursor.fetchall())
+            self.assertPlanUsesIndexes(plan, ordered='ORDER BY' in sql)
+
+    def test_dashboard_queries(self):
+        tournaments = TournamentInput.objects.filter(player=self.player)
+        adjustments = BankrollAdjustment.objects.filter(user=self.player)
+
+        self.assertNoSequentialScan(tournaments.order_by('-date')[:10])
+        self.assertNoSequentialScan(tournaments.filter(date__gte=self.since).order_by('-date')[:10])
+        self.assertNoSequentialScan(adjustments.order_by('-date')[:5])
+        since = datetime(self.since.year, self.since.month, self.since.day, tzinfo=timezone.utc)
+        self.assertNoSequentialScan(adjustments.filter(date__gte=since).values('amount'))
+
+    def test_tournament_list_queries(self):
+        client = APIClient()
+        client.force_authenticate(user=self.player)
+
+        def walk_pages():
+            # First page, the next one ((date, id) < cursor) and back again.
+            first = client.get('/api/tournaments/', {'page_size': 25}).data
+            second = client.get(first['next']).data
+            client.get(second['previous'])
+
+        self.assertQueriesUseIndexes(walk_pages, TournamentInput)
+
+        tournaments = TournamentInput.objects.filter(player=self.player)
+        for queryset in (tournaments, tournaments.filter(date__gte=self.since)):
+            def list_page():
+                queryset.totals()
+                _, next_cursor, _ = keyset_page(queryset.with_net_amount(), page_size=25)
+                keyset_page(queryset.with_net_amount(), next_cursor, page_size=25)
+
+            self.assertQueriesUseIndexes(list_page, TournamentInput)
+
+    def test_period_queries(self):
+        windows = get_period_windows(days=[30])
+        adjustments = BankrollAdjustment.objects.filter(user=self.player)
+
+        self.assertQueriesUseIndexes(
+            lambda: calculate_player_period_stats(self.player, windows), PlayerDailyStats
+        )
+        self.assertQueriesUseIndexes(
+            lambda: calculate_period_adjustment_totals(adjustments, windows), BankrollAdjustment
+        )
+
+    def test_stats_queries(self):
+        tournaments = TournamentInput.objects.filter(player=self.player)
+
+        self.assertNoSequentialScan(tournaments.values('buy_in', 'cashed_for'))
+        self.assertNoSequentialScan(tournaments.filter(date__gte=self.since).values('buy_in', 'cashed_for'))
+        self.assertNoSequentialScan(tournaments.filter(cashed_for__gt=0).values('date'))
+        self.assertNoSequentialScan(tournaments.filter(place_finished__lte=10).values('id'))
+        self.assertNoSequentialScan(
+            PlayerDailyStats.objects.filter(player=self.player, date__gte=self.since).values('total_buy_ins')
+        )
@@ -0,0 +1,227 @@
+from decimal import Decimal
+from datetime import date
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from ..models import TournamentInput, PlayerStatsRollup, PlayerDailyStats
+from ..services import (
+    aggregate_tournament_totals,
+    calculate_player_stats,
+    calculate_tournament_stats,
+    ensure_player_stats,
+)
+
+User = get_user_model()
+
+
+class PlayerStatsRollupTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='rollupplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+        self.client.force_login(self.user)
+
+    def assertRollupMatchesRawRows(self):
+        rollup = PlayerStatsRollup.objects.get(player=self.user)
+        raw = aggregate_tournament_totals(TournamentInput.objects.filter(player=self.user))
+
+        for field, value in rollup.as_totals().items():
+            self.assertEqual(value, raw[field] or 0, field)
+
+        for bucket in PlayerDailyStats.objects.filter(player=self.user):
+            raw_day = aggregate_tournament_totals(
+                TournamentInput.objects.filter(player=self.user, date=bucket.date)
+            )
+            for field, value in bucket.as_totals().items():
+                self.assertEqual(value, raw_day[field] or 0, f'{bucket.date} {field}')
+
+    def test_html_views_keep_rollup_in_sync(self):
+        self.client.post('/add_tournament/', {
+            'date': '2024-01-20',
+            'buy_in': '100.00',
+            'cashed_for': '450.00',
+            'place_finished': 1,
+        })
+        self.client.post('/add_tournament/', {
+            'date': '2024-01-21',
+            'buy_in': '50.00',
+            'cashed_for': '0.00',
+            'place_finished': 120,
+        })
+        self.assertRollupMatchesRawRows()
+
+        tournament = TournamentInput.objects.get(place_finished=120)
+        self.client.post(f'/tournaments/{tournament.id}/edit/', {
+            'date': '2024-01-21',
+            'buy_in': '50.00',
+            'cashed_for': '90.00',
+            'place_finished': 9,
+        })
+        self.assertRollupMatchesRawRows()
+        self.assertEqual(PlayerStatsRollup.objects.get(player=self.user).top_10_finishes, 2)
+
+        self.client.post(f'/tournaments/{tournament.id}/delete/')
+        self.assertRollupMatchesRawRows()
+        self.assertEqual(PlayerStatsRollup.objects.get(player=self.user).total_tournaments, 1)
+
+    def test_api_keeps_rollup_in_sync(self):
+        response = self.api.post('/api/tournaments/', {
+            'date': '2024-01-20',
+            'buy_in': '100.00',
+            'cashed_for': '0.00',
+            'place_finished': 300,
+        }, format='json')
+        tournament_id = response.data['id']
+        self.assertRollupMatchesRawRows()
+
+        self.api.patch(f'/api/tournaments/{tournament_id}/', {
+            'cashed_for': '250.00',
+            'place_finished': 3,
+        }, format='json')
+        self.assertRollupMatchesRawRows()
+        self.assertEqual(PlayerStatsRollup.objects.get(player=self.user).itm_count, 1)
+
+        self.api.delete(f'/api/tournaments/{tournament_id}/')
+        self.assertRollupMatchesRawRows()
+        self.assertEqual(PlayerStatsRollup.objects.get(player=self.user).total_tournaments, 0)
+
+    def test_all_time_stats_read_rollup(self):
+        self.api.post('/api/tournaments/', {
+            'date': '2024-01-20',
+            'buy_in': '100.00',
+            'cashed_for': '300.00',
+            'place_finished': 2,
+        }, format='json')
+
+        with self.assertNumQueries(1):
+            stats = calculate_player_stats(self.user)
+
+        self.assertEqual(stats['total_tournaments'], 1)
+        self.assertEqual(stats['total_profit'], Decimal('200.00'))
+
+    def test_missing_rollup_is_rebuilt(self):
+        TournamentInput.objects.create(
+            date=date(2024, 1, 20),
+            buy_in=Decimal('10.00'),
+            cashed_for=Decimal('0.00'),
+            place_finished=50,
+            player=self.user
+        )
+
+        stats = calculate_player_stats(self.user)
+
+        self.assertEqual(stats['total_tournaments'], 1)
+        self.assertTrue(PlayerStatsRollup.objects.filter(player=self.user).exists())
+
+    def test_queued_first_read_reuses_rollup(self):
+        TournamentInput.objects.create(
+            date=date(2024, 1, 20),
+            buy_in=Decimal('10.00'),
+            cashed_for=Decimal('0.00'),
+            place_finished=50,
+            player=self.user
+        )
+        rollup = ensure_player_stats(self.user)
+
+        # A read that queued on the player lock finds the rollup built.
+        with mock.patch('tournaments.services.rebuild_player_stats') as rebuild:
+            self.assertEqual(ensure_player_stats(self.user), rollup)
+        rebuild.assert_not_called()
+        self.assertEqual(rollup.total_tournaments, 1)
+
+    def test_rebuild_command(self):
+        TournamentInput.objects.create(
+            date=date(2024, 1, 20),
+            buy_in=Decimal('10.00'),
+            cashed_for=Decimal('40.00'),
+            place_finished=4,
+            player=self.user
+        )
+        PlayerStatsRollup.objects.update_or_create(player=self.user, defaults={'total_tournaments': 99})
+
+        out = StringIO()
+        call_command('rebuild_stats_rollups', stdout=out)
+
+        self.assertIn('Rebuilt stats rollups', out.getvalue())
+        self.assertRollupMatchesRawRows()
+
+
+class PlayerDailyStatsTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='bucketplayer',
+            password='testpass123',
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def post_tournament(self, day, buy_in, cashed_for, place):
+        return self.api.post('/api/tournaments/', {
+            'date': day,
+            'buy_in': buy_in,
+            'cashed_for': cashed_for,
+            'place_finished': place,
+        }, format='json')
+
+    def test_one_bucket_per_day(self):
+        self.post_tournament('2024-03-01', '10.00', '0.00', 40)
+        self.post_tournament('2024-03-01', '20.00', '80.00', 3)
+        self.post_tournament('2024-03-02', '5.00', '0.00', 400)
+
+        bucket = PlayerDailyStats.objects.get(player=self.user, date=date(2024, 3, 1))
+        self.assertEqual(bucket.total_tournaments, 2)
+        self.assertEqual(bucket.total_buy_ins, 3000)
+        self.assertEqual(bucket.total_cash, 8000)
+        self.assertEqual(bucket.top_10_finishes, 1)
+        self.assertEqual(PlayerDailyStats.objects.filter(player=self.user).count(), 2)
+
+    def test_date_edit_moves_tournament_between_buckets(self):
+        response = self.post_tournament('2024-03-01', '10.00', '25.00', 5)
+        self.api.patch(f"/api/tournaments/{response.data['id']}/", {'date': '2024-03-05'}, format='json')
+
+        old_bucket = PlayerDailyStats.objects.get(player=self.user, date=date(2024, 3, 1))
+        new_bucket = PlayerDailyStats.objects.get(player=self.user, date=date(2024, 3, 5))
+        self.assertEqual(old_bucket.total_tournaments, 0)
+        self.assertEqual(old_bucket.total_buy_ins, 0)
+        self.assertEqual(new_bucket.total_tournaments, 1)
+        self.assertEqual(new_bucket.itm_count, 1)
+
+    def test_range_stats_match_raw_rows(self):
+        self.post_tournament('2024-02-10', '100.00', '0.00', 90)
+        self.post_tournament('2024-03-01', '10.00', '0.00', 40)
+        self.post_tournament('2024-03-03', '20.00', '80.00', 1)
+        self.post_tournament('2024-03-09', '5.00', '12.00', 9)
+
+        start, end = date(2024, 3, 1), date(2024, 3, 5)
+        with self.assertNumQueries(1):
+            stats = calculate_player_stats(self.user, start, end)
+
+        raw = calculate_tournament_stats(
+            TournamentInput.objects.filter(player=self.user, date__gte=start, date__lte=end)
+        )
+        self.assertEqual(stats, raw)
+        self.assertEqual(stats['total_tournaments'], 2)
+        self.assertEqual(stats['first_places'], 1)
+
+    def test_range_stats_rebuild_missing_buckets(self):
+        TournamentInput.objects.create(
+            date=date(2024, 3, 1),
+            buy_in=Decimal('10.00'),
+            cashed_for=Decimal('0.00'),
+            place_finished=50,
+            player=self.user
+        )
+
+        stats = calculate_player_stats(self.user, date(2024, 2, 1))
+
+        self.assertEqual(stats['total_tournaments'], 1)
+        self.assertEqual(PlayerDailyStats.objects.filter(player=self.user).count(), 1)
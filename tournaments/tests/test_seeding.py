@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+import numpy as np
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from ..models import BankrollAdjustment, PlayerStatsRollup, TournamentInput
+from ..seeding import generate_results, seed_player
+from ..services import calculate_adjustment_totals, calculate_tournament_stats, get_player_totals
+
+User = get_user_model()
+
+
+class SeedingTests(TestCase):
+
+    def test_results_are_plausible(self):
+        buy_ins, cashes, places = generate_results(np.random.default_rng(7), 50000, home_stake=4, skill=0.97)
+
+        self.assertTrue((places >= 1).all() and (places <= 20000).all())
+        self.assertTrue((cashes >= 0).all())
+        self.assertAlmostEqual((cashes > 0).mean(), 0.16, delta=0.02)
+        roi = (cashes.sum() - buy_ins.sum()) / buy_ins.sum()
+        self.assertAlmostEqual(roi, 0.0, delta=0.1)
+
+    def test_same_seed_same_data(self):
+        first = generate_results(np.random.default_rng(3), 100)
+        second = generate_results(np.random.default_rng(3), 100)
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+
+    def test_seed_player(self):
+        player = User.objects.create_user(username='seeded')
+        seed_player(player, np.random.default_rng(1), 500, 20, days=90)
+        player.refresh_from_db()
+
+        tournaments = TournamentInput.objects.filter(player=player)
+        adjustments = BankrollAdjustment.objects.filter(user=player)
+        stats = calculate_tournament_stats(tournaments)
+        totals = calculate_adjustment_totals(adjustments)
+
+        self.assertEqual(stats['total_tournaments'], 500)
+        self.assertGreaterEqual(adjustments.count(), 20)
+        self.assertEqual(
+            player.bankroll,
+            100 + stats['total_profit'] + totals['total_deposits'] - totals['total_withdrawals'],
+        )
+        self.assertGreaterEqual(player.bankroll, 0)
+        self.assertTrue(PlayerStatsRollup.objects.filter(player=player).exists())
+        self.assertEqual(get_player_totals(player)['total_tournaments'], 500)
+        self.assertGreater(len(set(adjustments.values_list('date', flat=True))), 1)
+
+    def test_seed_command(self):
+        call_command('seed_poker_data', users=2, tournaments=30, adjustments=3, prefix='cmd_', stdout=StringIO())
+        call_command('seed_poker_data', users=1, tournaments=10, adjustments=0, prefix='cmd_', clear=True,
+                     stdout=StringIO())
+
+        players = User.objects.filter(username__startswith='cmd_')
+        self.assertEqual(players.count(), 1)
+        self.assertFalse(players.get().has_usable_password())
+        self.assertEqual(TournamentInput.objects.filter(player__in=players).count(), 10)
+
+    def test_run_benchmarks_writes_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            call_command('run_benchmarks', sizes=[40], adjustments=3, repeat=1, output=output,
+                         stdout=StringIO())
+            call_command('run_benchmarks', sizes=[40], adjustments=3, repeat=1, output=output,
+                         compare=output, stdout=StringIO())
+
+            with open(output) as results_file:
+                report = json.load(results_file)
+
+        cases = {result['case'] for result in report['results']}
+        self.assertIn('calculate_tournament_stats', cases)
+        self.assertIn('api dashboard (cold cache)', cases)
+        self.assertTrue(all(result['size'] == 40 for result in report['results']))
+        self.assertFalse(User.objects.filter(username__startswith='__benchmark_').exists())
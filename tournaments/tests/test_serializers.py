@@ -0,0 +1,60 @@
+import json
+from decimal import Decimal
+from datetime import date
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..money import MoneyField
+from ..serializers import TournamentSerializer, TournamentListSerializer
+
+User = get_user_model()
+
+
+class TournamentListSerializerTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='listplayer',
+            password='testpass123',
+        )
+        for buy_in, cashed_for, place in (
+            ('5.55', '10.10', 12),
+            ('10.00', '0.00', 300),
+            ('22.00', '22.00', 40),
+            ('109.00', '3050.75', 1),
+            ('0.10', '0.00', 9),
+        ):
+            TournamentInput.objects.create(
+                date=date(2024, 4, place % 28 + 1),
+                buy_in=Decimal(buy_in),
+                cashed_for=Decimal(cashed_for),
+                place_finished=place,
+                player=self.user
+            )
+        self.tournaments = TournamentInput.objects.filter(player=self.user).order_by('-date', '-id')
+
+    def test_matches_model_serializer_byte_for_byte(self):
+        expected = JSONRenderer().render(TournamentSerializer(self.tournaments, many=True).data)
+        actual = JSONRenderer().render(TournamentListSerializer(self.tournaments.list_rows()).data)
+
+        self.assertEqual(actual, expected)
+
+    def test_api_list_uses_rows(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.get('/api/tournaments/')
+
+        expected = JSONRenderer().render(TournamentSerializer(self.tournaments, many=True).data)
+        self.assertEqual(response.json()['results'], json.loads(expected))
+
+        display = {row['place_finished']: row['display_net'] for row in response.json()['results']}
+        self.assertEqual(display[40], '$0.00')
+        self.assertEqual(display[12], '+$4.55')
+
+    def test_money_mapping_stays_in_the_app(self):
+        self.assertNotIn(MoneyField, serializers.ModelSerializer.serializer_field_mapping)
+        self.assertIsInstance(TournamentSerializer().fields['buy_in'], serializers.DecimalField)
@@ -0,0 +1,115 @@
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..services import calculate_tournament_stats, rebuild_player_stats
+
+User = get_user_model()
+
+
+class TournamentStatsTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='statsplayer',
+            password='testpass123',
+            bankroll=Decimal('1000.00')
+        )
+
+    def add_tournament(self, buy_in, cashed_for, place, day=date(2024, 1, 20)):
+        return TournamentInput.objects.create(
+            date=day,
+            buy_in=Decimal(buy_in),
+            cashed_for=Decimal(cashed_for),
+            place_finished=place,
+            player=self.user
+        )
+
+    def test_empty_stats(self):
+        stats = calculate_tournament_stats(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual(stats['total_tournaments'], 0)
+        self.assertEqual(stats['total_profit'], Decimal('0'))
+        self.assertEqual(stats['roi'], 0)
+        self.assertEqual(stats['avg_buy_in'], 0)
+
+    def test_stats_values(self):
+        self.add_tournament('100.00', '500.00', 1)
+        self.add_tournament('100.00', '150.00', 8)
+        self.add_tournament('50.00', '0.00', 45)
+        self.add_tournament('50.00', '0.00', 300)
+
+        stats = calculate_tournament_stats(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual(stats['total_tournaments'], 4)
+        self.assertEqual(stats['total_buy_ins'], Decimal('300.00'))
+        self.assertEqual(stats['total_cash'], Decimal('650.00'))
+        self.assertEqual(stats['total_profit'], Decimal('350.00'))
+        self.assertEqual(stats['roi'], Decimal('116.67'))
+        self.assertEqual(stats['itm_count'], 2)
+        self.assertEqual(stats['itm_percentage'], 50.0)
+        self.assertEqual(stats['first_places'], 1)
+        self.assertEqual(stats['top_10_finishes'], 2)
+        self.assertEqual(stats['first_place_percentage'], 25.0)
+        self.assertEqual(stats['top_10_percentage'], 50.0)
+        self.assertEqual(stats['avg_buy_in'], Decimal('75.00'))
+
+    def test_stats_use_single_query(self):
+        for place in range(1, 30):
+            self.add_tournament('10.00', '25.00' if place <= 5 else '0.00', place)
+
+        with self.assertNumQueries(1):
+            calculate_tournament_stats(TournamentInput.objects.filter(player=self.user))
+
+
+class StatsQueryCountTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='querycounter',
+            password='testpass123',
+        )
+
+    def add_tournaments(self, count):
+        TournamentInput.objects.bulk_create([
+            TournamentInput(
+                date=date(2024, 1, 1 + i % 28),
+                buy_in=Decimal('20.00'),
+                cashed_for=Decimal('60.00') if i % 5 == 0 else Decimal('0.00'),
+                place_finished=1 + i,
+                player=self.user,
+            )
+            for i in range(count)
+        ])
+        rebuild_player_stats(self.user)
+        self.user.bump_data_version()
+
+    def test_api_stats_query_count_is_constant(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        self.add_tournaments(5)
+        with self.assertNumQueries(1):
+            response = client.get('/api/tournaments/stats/')
+        self.assertEqual(response.data['total_tournaments'], 5)
+
+        self.add_tournaments(50)
+        with self.assertNumQueries(1):
+            response = client.get('/api/tournaments/stats/')
+        self.assertEqual(response.data['total_tournaments'], 55)
+
+    def test_dashboard_query_count_is_constant(self):
+        self.client.force_login(self.user)
+
+        self.add_tournaments(5)
+        with self.assertNumQueries(8):
+            self.client.get('/')
+
+        self.add_tournaments(50)
+        with self.assertNumQueries(8):
+            response = self.client.get('/')
+        self.assertEqual(response.context['total_tournaments'], 55)
@@ -0,0 +1,110 @@
+from decimal import Decimal
+from datetime import date
+from unittest import mock
+import numpy as np
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..simulation import run_simulation
+from ..workers import get_pool
+
+User = get_user_model()
+
+
+class SimulationTests(TestCase):
+
+    def test_same_seed_same_result_across_workers(self):
+        outcomes = np.array([-1000, -1000, -1000, 4000])
+
+        inline = run_simulation(outcomes, 20000, horizon=200, trajectories=25_000, seed=42, workers=1)
+        pooled = run_simulation(outcomes, 20000, horizon=200, trajectories=25_000, seed=42, workers=2)
+
+        self.assertEqual(inline['risk_of_ruin'], pooled['risk_of_ruin'])
+        self.assertEqual(inline['final_bankroll_percentiles'], pooled['final_bankroll_percentiles'])
+        self.assertEqual(inline['trajectories'], 25_000)
+        self.assertFalse(inline['truncated'])
+
+    def test_pool_is_created_once(self):
+        pool = get_pool('simulation-test', 2)
+        self.addCleanup(pool.shutdown)
+
+        self.assertIs(get_pool('simulation-test', 3), pool)
+        self.assertEqual(pool._max_workers, 2)
+
+    def test_certain_outcomes(self):
+        losing = run_simulation(np.array([-500]), 1000, horizon=5, trajectories=100, seed=1, workers=1)
+        self.assertEqual(losing['risk_of_ruin'], 1.0)
+        self.assertEqual(losing['final_bankroll_percentiles'][50], 0.0)
+
+        winning = run_simulation(np.array([500]), 1000, horizon=5, trajectories=100, downswing=1, seed=1, workers=1)
+        self.assertEqual(winning['risk_of_ruin'], 0.0)
+        self.assertEqual(winning['downswing_probability'], 0.0)
+        self.assertEqual(winning['final_bankroll_percentiles'][95], 3500.0)
+
+    def test_time_budget_truncates(self):
+        result = run_simulation(
+            np.array([-100, 300]), 5000, horizon=2000, trajectories=200_000,
+            seed=3, time_budget=0.001, workers=1,
+        )
+
+        self.assertTrue(result['truncated'])
+        self.assertLess(result['trajectories'], 200_000)
+
+
+@override_settings(SIMULATION_MAX_WORKERS=1, SIMULATION_TIME_BUDGET=10)
+class RiskOfRuinApiTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='riskplayer',
+            password='testpass123',
+            bankroll=Decimal('200.00')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_requires_history(self):
+        response = self.client.get('/api/users/risk-of-ruin/')
+        self.assertEqual(response.status_code, 400)
+
+    def add_history(self):
+        for cashed_for in ('0.00', '0.00', '0.00', '45.00'):
+            TournamentInput.objects.create(
+                date=date(2024, 7, 1),
+                buy_in=Decimal('10.00'),
+                cashed_for=Decimal(cashed_for),
+                place_finished=20,
+                player=self.user
+            )
+
+    def test_simulation(self):
+        self.add_history()
+
+        params = {'trajectories': 2000, 'horizon': 300, 'seed': 9, 'downswing_buy_ins': 10}
+        response = self.client.get('/api/users/risk-of-ruin/', params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['trajectories'], 2000)
+        self.assertEqual(response.data['seed'], 9)
+        self.assertEqual(response.data['downswing']['amount'], 100.0)
+        self.assertTrue(0 <= response.data['risk_of_ruin'] <= 1)
+        self.assertEqual(set(response.data['final_bankroll_percentiles']), {'5', '25', '50', '75', '95'})
+        self.assertEqual(self.client.get('/api/users/risk-of-ruin/', params).data['risk_of_ruin'],
+                         response.data['risk_of_ruin'])
+
+    def test_rejects_bad_parameters(self):
+        response = self.client.get('/api/users/risk-of-ruin/', {'trajectories': 'many'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_negative_seed(self):
+        self.add_history()
+        response = self.client.get('/api/users/risk-of-ruin/', {'seed': -1})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('seed', response.data)
+
+    def test_timeout_is_503(self):
+        self.add_history()
+        with mock.patch('tournaments.api_views.run_simulation', side_effect=TimeoutError):
+            response = self.client.get('/api/users/risk-of-ruin/', {'trajectories': 20_000, 'horizon': 5000})
+        self.assertEqual(response.status_code, 503)
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..analytics import calculate_swings
+from ..models import TournamentInput
+
+User = get_user_model()
+
+
+class SwingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='swingplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add(self, day, buy_in, cashed_for):
+        TournamentInput.objects.create(
+            date=date(2024, 1, day),
+            buy_in=Decimal(buy_in),
+            cashed_for=Decimal(cashed_for),
+            place_finished=5 if Decimal(cashed_for) else 500,
+            player=self.user
+        )
+
+    def test_empty_history(self):
+        swings = calculate_swings(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual(swings['tournaments'], 0)
+        self.assertEqual(swings['max_drawdown'], 0)
+        self.assertIsNone(swings['max_drawdown_start'])
+
+    def test_swings(self):
+        # Cumulative profit: +40, +30, +20, +10, +60, +50, +110
+        self.add(1, '10.00', '50.00')
+        self.add(3, '10.00', '0.00')
+        self.add(4, '10.00', '0.00')
+        self.add(8, '10.00', '0.00')
+        self.add(10, '10.00', '60.00')
+        self.add(11, '10.00', '0.00')
+        self.add(12, '10.00', '70.00')
+
+        swings = calculate_swings(TournamentInput.objects.filter(player=self.user), chunk_size=2)
+
+        self.assertEqual(swings['tournaments'], 7)
+        self.assertEqual(swings['max_drawdown'], 30.0)
+        self.assertEqual(swings['max_drawdown_start'], '2024-01-01')
+        self.assertEqual(swings['max_drawdown_end'], '2024-01-08')
+        self.assertEqual(swings['longest_downswing_tournaments'], 3)
+        self.assertEqual(swings['longest_downswing_days'], 7)
+        self.assertEqual(swings['longest_itm_drought'], 3)
+        self.assertEqual(swings['biggest_upswing'], 110.0)
+        self.assertEqual(swings['current_drawdown'], 0.0)
+
+    def test_dashboard_includes_cached_swings(self):
+        self.add(1, '10.00', '0.00')
+
+        response = self.client.get('/api/users/dashboard/')
+        self.assertEqual(response.data['swings']['max_drawdown'], 10.0)
+
+        with self.assertNumQueries(0):
+            self.client.get('/api/users/dashboard/')
+
+        self.client.post(
+            '/api/tournaments/',
+            {'date': '2024-01-02', 'buy_in': '5.00', 'cashed_for': '0.00', 'place_finished': 90},
+            format='json'
+        )
+        self.user.refresh_from_db()
+        response = self.client.get('/api/users/dashboard/')
+        self.assertEqual(response.data['swings']['max_drawdown'], 15.0)
@@ -0,0 +1,86 @@
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from ..models import TournamentInput
+from ..services import calculate_buy_in_tiers, get_buy_in_tiers
+
+User = get_user_model()
+
+
+class BuyInTierTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='tierplayer',
+            password='testpass123',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        for buy_in, cashed_for, place in (
+            ('2.20', '0.00', 300),
+            ('4.99', '12.00', 9),
+            ('5.00', '0.00', 55),
+            ('22.00', '110.00', 1),
+            ('215.00', '0.00', 40),
+        ):
+            TournamentInput.objects.create(
+                date=date(2024, 6, 1),
+                buy_in=Decimal(buy_in),
+                cashed_for=Decimal(cashed_for),
+                place_finished=place,
+                player=self.user
+            )
+
+    def test_default_tiers_in_one_query(self):
+        with self.assertNumQueries(1):
+            tiers = calculate_buy_in_tiers(TournamentInput.objects.filter(player=self.user))
+
+        self.assertEqual([t['tier'] for t in tiers], ['micro', 'low', 'mid', 'high'])
+        self.assertEqual([t['total_tournaments'] for t in tiers], [2, 2, 0, 1])
+
+        micro, low, mid, high = tiers
+        self.assertEqual(micro['total_profit'], Decimal('4.81'))
+        self.assertEqual(micro['itm_percentage'], 50.0)
+        self.assertEqual(low['roi'], Decimal('307.41'))
+        self.assertEqual(low['first_places'], 1)
+        self.assertEqual(mid['roi'], 0)
+        self.assertEqual(high['total_profit'], Decimal('-215.00'))
+        self.assertEqual(high['min_buy_in'], Decimal('150.00'))
+        self.assertIsNone(high['max_buy_in'])
+
+    def test_custom_edges(self):
+        tiers = get_buy_in_tiers(['10', '100'])
+        self.assertEqual([name for name, _ in tiers], ['$0.00-$10.00', '$10.00-$100.00', '$100.00+'])
+
+        for edges in (['10', '5'], ['0'], ['5', '5']):
+            with self.assertRaises(ValueError):
+                get_buy_in_tiers(edges)
+
+    @override_settings(BUY_IN_TIERS=(('small', Decimal('50.00')), ('big', None)))
+    def test_tiers_from_settings(self):
+        tiers = calculate_buy_in_tiers(TournamentInput.objects.filter(player=self.user))
+        self.assertEqual([(t['tier'], t['total_tournaments']) for t in tiers], [('small', 4), ('big', 1)])
+
+    def test_endpoint(self):
+        response = self.client.get('/api/tournaments/buy-in-tiers/', {'edges': '5,100'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t['total_tournaments'] for t in response.data['tiers']], [2, 2, 1])
+        self.assertEqual(response.data['tiers'][1]['total_profit'], 83.0)
+
+        response = self.client.get('/api/tournaments/buy-in-tiers/', {'edges': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_includes_tiers(self):
+        response = self.client.get('/api/users/dashboard/')
+        self.assertEqual(len(response.data['buy_in_tiers']), 4)
+
+        self.client.force_login(self.user)
+        response = self.client.get('/')
+        self.assertContains(response, 'Buy-in Tiers')
+        self.assertEqual(response.context['buy_in_tiers'][0]['total_tournaments'], 2)
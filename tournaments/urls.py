@@ -5,6 +5,8 @@ app_name = 'tournaments'
 
 urlpatterns = [
     path('', views.dashboard, name='dashboard'),
+    path('async/', views.async_dashboard, name='async_dashboard'),
+    path('charts/<str:kind>/', views.chart, name='chart'),
 
     path('add_tournament/', views.add_tournament, name='add_tournament'),
     path('tournaments/', views.tournament_list, name='tournament_list'),
@@ -1,49 +1,102 @@
+from functools import wraps
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
 from django.contrib import messages
-from .models import TournamentInput, BankrollAdjustment
+from .models import TournamentInput
 from .forms import TournamentInputForm, BankrollAdjustmentForm, PokerUserCreationForm
 from django.contrib.auth import login
-from .services import get_period_filter, calculate_tournament_stats, calculate_adjustment_totals
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse
+from .cache import aget_dashboard_data, get_dashboard_data
+from .charts import CHART_FORMATS, CHART_KINDS, get_chart
+from .conditional import conditional_on_user_data
+from .pagination import InvalidCursor, keyset_page
+from .plotting import CONTENT_TYPES
+from .services import (
+    get_period_filter,
+    get_period_windows,
+    record_tournament_change,
+    tournament_snapshot,
+)
+
+TOURNAMENT_LIST_PAGE_SIZE = 25
+
+
+def period_summaries(data):
+    """Stat card values for every standard period, as rendered strings."""
+    return {
+        name: {
+            'period_display': display,
+            **{key: str(value) for key, value in data['period_stats'][name].items()},
+            **{key: str(value) for key, value in data['period_adjustment_totals'][name].items()},
+        }
+        for name, display, _, _ in get_period_windows()
+    }
 
 
-@login_required
-def dashboard(request):
-    period = request.GET.get('period', 'all')
+def dashboard_context(request, data):
+    return {
+        'tournaments': data['recent_tournaments'],
+        'adjustments': data['recent_adjustments'],
+        'buy_in_tiers': data['buy_in_tiers'],
+        'finish_histogram': data['finish_histogram'],
 
-    tournaments = TournamentInput.objects.filter(player=request.user)
-    adjustments = BankrollAdjustment.objects.filter(user=request.user)
+        'current_period': data['period'],
+        'period_display': data['period_display'],
+        'periods': period_summaries(data),
 
-    start_date, period_display = get_period_filter(period)
+        'user': request.user,
+        'current_bankroll': request.user.bankroll,
 
-    if start_date:
-        tournaments = tournaments.filter(date__gte=start_date)
-        adjustments = adjustments.filter(date__gte=start_date)
+        **data['stats'],
 
-    tournaments = tournaments.order_by('-date')
-    adjustments = adjustments.order_by('-date')
+        'total_deposits': data['adjustment_totals']['total_deposits'],
+        'total_withdrawals': data['adjustment_totals']['total_withdrawals'],
+    }
 
-    stats = calculate_tournament_stats(tournaments)
 
-    adjustment_totals = calculate_adjustment_totals(adjustments)
+@login_required
+@conditional_on_user_data
+def dashboard(request):
+    data = get_dashboard_data(request.user, request.GET.get('period', 'all'))
+    return render(request, 'tournaments/dashboard.html', dashboard_context(request, data))
 
-    context = {
-        'tournaments': tournaments[:10],
-        'adjustments': adjustments[:5],
 
-        'current_period': period,
-        'period_display': period_display,
+def async_login_required(view_func):
+    # login_required only wraps async views from Django 5.1 on.
+    @wraps(view_func)
+    async def inner(request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view_func(request, *args, **kwargs)
 
-        'user': request.user,
-        'current_bankroll': request.user.bankroll,
+    return inner
 
-        **stats,
 
-        'total_deposits': adjustment_totals['total_deposits'],
-        'total_withdrawals': adjustment_totals['total_withdrawals'],
-    }
+@async_login_required
+@conditional_on_user_data
+async def async_dashboard(request):
+    """The dashboard, with a cache miss built from concurrent reads."""
+    data = await aget_dashboard_data(request.user, request.GET.get('period', 'all'))
+    return await sync_to_async(render)(request, 'tournaments/dashboard.html', dashboard_context(request, data))
+
+
+@login_required
+@conditional_on_user_data
+def chart(request, kind):
+    file_format = request.GET.get('file_format', 'svg')
+    if kind not in CHART_KINDS or file_format not in CHART_FORMATS:
+        raise Http404
+
+    try:
+        path = get_chart(request.user, kind, file_format)
+    except TimeoutError:
+        return HttpResponse('Chart rendering timed out', status=503)
 
-    return render(request, 'tournaments/dashboard.html', context)
+    return FileResponse(open(path, 'rb'), content_type=CONTENT_TYPES[file_format])
 
 
 @login_required
@@ -51,12 +104,16 @@ def add_tournament(request):
     if request.method == 'POST':
         form = TournamentInputForm(request.POST)
         if form.is_valid():
-            tournament = form.save(commit=False)
-            tournament.player = request.user
-            tournament.save()
+            with transaction.atomic():
+                tournament = form.save(commit=False)
+                tournament.player = request.user
+                tournament.save()
 
-            request.user.bankroll += tournament.net_amount
-            request.user.save()
+                record_tournament_change(
+                    request.user,
+                    new=tournament_snapshot(tournament),
+                    tournament=tournament,
+                )
 
             messages.success(request, f'Tournament added! Net: {tournament.display_net}')
             return redirect('tournaments:dashboard')
@@ -72,11 +129,12 @@ def add_adjustment(request):
     if request.method == 'POST':
         form = BankrollAdjustmentForm(request.POST)
         if form.is_valid():
-            adjustment = form.save(commit=False)
-            adjustment.user = request.user
-            adjustment.save()
+            with transaction.atomic():
+                adjustment = form.save(commit=False)
+                adjustment.user = request.user
+                adjustment.save()
 
-            adjustment.apply_to_user()
+                adjustment.apply_to_user()
 
             if adjustment.transaction_type == 'deposit':
                 messages.info(request, f'Deposited {adjustment.amount}$')
@@ -94,6 +152,7 @@ def add_adjustment(request):
 
 
 @login_required
+@conditional_on_user_data
 def tournament_list(request):
     period = request.GET.get('period', 'all')
     tournaments = TournamentInput.objects.filter(player=request.user)
@@ -103,13 +162,21 @@ def tournament_list(request):
     if start_date:
         tournaments = tournaments.filter(date__gte=start_date)
 
-    total_count = tournaments.count()
-    total_profit = sum(t.net_amount for t in tournaments)
+    totals = tournaments.totals()
+
+    try:
+        page, next_cursor, previous_cursor = keyset_page(
+            tournaments.with_net_amount(), request.GET.get('cursor'), TOURNAMENT_LIST_PAGE_SIZE
+        )
+    except InvalidCursor:
+        raise Http404('Invalid cursor')
 
     context = {
-        'tournaments': tournaments.order_by('-date'),
-        'total_count': total_count,
-        'total_profit': total_profit,
+        'tournaments': page,
+        'next_cursor': next_cursor,
+        'previous_cursor': previous_cursor,
+        'total_count': totals['total_count'],
+        'total_profit': totals['total_profit'],
         'current_period': period,
     }
 
@@ -120,17 +187,22 @@ def tournament_list(request):
 def edit_tournament(request, pk):
     tournament = get_object_or_404(TournamentInput, pk=pk, player=request.user)
 
-    old_net_amount = tournament.net_amount
-
     if request.method == 'POST':
         form = TournamentInputForm(request.POST, instance=tournament)
         if form.is_valid():
-            request.user.bankroll -= old_net_amount
-
-            tournament = form.save()
-
-            request.user.bankroll += tournament.net_amount
-            request.user.save()
+            with transaction.atomic():
+                # Take the delta against the row as stored, locked until the
+                # save, so a concurrent edit cannot be counted twice.
+                stored = get_object_or_404(TournamentInput.objects.select_for_update(), pk=pk, player=request.user)
+                old_snapshot = tournament_snapshot(stored)
+                tournament = form.save()
+
+                record_tournament_change(
+                    request.user,
+                    old=old_snapshot,
+                    new=tournament_snapshot(tournament),
+                    tournament=tournament,
+                )
 
             messages.success(request, 'Tournament updated successfully!')
             return redirect('tournaments:tournament_list')
@@ -144,10 +216,12 @@ def delete_tournament(request, pk):
     tournament = get_object_or_404(TournamentInput, pk=pk, player=request.user)
 
     if request.method == 'POST':
-        request.user.bankroll -= tournament.net_amount
-        request.user.save()
+        with transaction.atomic():
+            tournament = get_object_or_404(TournamentInput.objects.select_for_update(), pk=pk, player=request.user)
+            old_snapshot = tournament_snapshot(tournament)
+            tournament.delete()
 
-        tournament.delete()
+            record_tournament_change(request.user, old=old_snapshot)
 
         messages.success(request, 'Tournament deleted successfully!')
         return redirect('tournaments:tournament_list')
@@ -0,0 +1,26 @@
+"""
+Process pools for CPU-bound work. Tasks run in spawned interpreters, so
+the modules they call into (simulation, plotting) import no Django and
+workers never inherit the parent's database connections.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name, workers):
+    """
+    The shared pool called ``name``, created with ``workers`` processes on
+    first use and kept for the life of the process. Later calls get the
+    same pool whatever they pass, so one caller can never shut down a pool
+    that others have work queued on.
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pools[name] = pool
+        return pool